@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Bulk evaluation CLI: score many (job posting, candidate CV) pairs from a
+manifest and stream one JSON result line per pair as it completes.
+
+Records are read lazily and at most a fixed number of pairs are in flight, so
+memory stays constant regardless of manifest size. Rubrics are extracted once
+per job posting (disk cache + in-memory LRU shared by the workers).
+
+MANIFEST FORMAT:
+----------------
+JSONL (one object per line) or CSV (header row) with the fields:
+
+    job_id          Identifier of the job posting
+    posting         Job posting text          (or posting_path: text file)
+    candidate_id    Identifier of the candidate
+    cv_text         CV text                   (or cv_path: .pdf or text file)
+
+OUTPUT FORMAT:
+--------------
+One JSON object per line, in completion order:
+
+    {"line": 3, "job_id": "...", "candidate_id": "...", "model": "...",
+     "status": "ok", "final_score": 72.5, "breakdown": [...], "cv_hash": "...", "duration": 4.1}
+    {"line": 4, ..., "status": "error", "error": "..."}
+
+Duplicate CVs (same normalized text, see cv_text_hash) for the same posting
+are scored once; the copies reuse the result and carry "deduplicated": true.
+
+USAGE:
+------
+    python batch_evaluate.py manifest.jsonl -o results.jsonl --workers 8
+    python batch_evaluate.py manifest.csv --model google/gemini-2.5-flash-lite
+    cat manifest.jsonl | python batch_evaluate.py - > results.jsonl
+
+    # Score on compact CV profiles (extracted once per CV, cached by CV hash)
+    python batch_evaluate.py manifest.jsonl -o results.jsonl --compact-profile
+
+    # Compact CV text first (page furniture, contact details, low-value sections; see cv_compaction.py)
+    python batch_evaluate.py manifest.jsonl -o results.jsonl --compact-cv --cv-token-budget 1500
+
+    # Live top-10 per job (progress output) and a score histogram at the end
+    python batch_evaluate.py manifest.jsonl -o results.jsonl --top 10
+
+    # Resumable run: rerun the same command after a failure to continue
+    python batch_evaluate.py manifest.jsonl -o results.jsonl --journal results.journal
+    python batch_evaluate.py manifest.jsonl --journal results.journal --status
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Iterable, Iterator, Dict, Any, Optional, TextIO, Callable, Set
+
+import test_matching_score
+from cv_text import extract_pdf_text, extract_pdf_pages, cv_text_hash
+from cv_compaction import compact_cv_text
+from evaluation_pipeline import StepCache
+from batch_journal import BatchJournal, format_progress
+from leaderboard import Leaderboard
+from cv_profile import score_criteria_with_profile
+from test_matching_score import (
+    extract_rubric_with_llm,
+    score_criteria_with_llm,
+    calculate_matching_score
+)
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def read_manifest(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read manifest records from a JSONL or CSV file ("-" = JSONL on stdin).
+
+    Args:
+        path: Manifest path; CSV is detected by the .csv extension
+
+    Yields:
+        Record dicts with a "line" field (1-based line/row number)
+    """
+    if path == "-":
+        yield from _read_jsonl(sys.stdin)
+        return
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            # Job postings and CVs easily exceed the default 128KB field limit
+            csv.field_size_limit(sys.maxsize)
+            for row_number, row in enumerate(csv.DictReader(f), 2):
+                row["line"] = row_number
+                yield row
+        else:
+            yield from _read_jsonl(f)
+
+
+def _read_jsonl(f: TextIO) -> Iterator[Dict[str, Any]]:
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            record = {"error": f"Invalid JSON: {e}"}
+        record["line"] = line_number
+        yield record
+
+
+def journal_ids(item: Dict[str, Any]) -> tuple:
+    """
+    (job, candidate) identifiers of a record or output line for the journal key.
+
+    A missing job_id or candidate_id falls back to the manifest line number,
+    so ID-less records never share a journal entry.
+    """
+    line_id = f"line:{item.get('line')}"
+    job_id, candidate_id = item.get("job_id"), item.get("candidate_id")
+    return (
+        line_id if job_id in (None, "") else job_id,
+        line_id if candidate_id in (None, "") else candidate_id
+    )
+
+
+def manifest_journal_keys(
+    path: str,
+    model: str,
+    prompt_version: int = None,
+    scoring_mode: str = None
+) -> Optional[Set[str]]:
+    """
+    Journal keys of a manifest's pairs for one run, read lazily (None for stdin).
+
+    Progress and resume counts are limited to these keys, so entries of other
+    manifests, models, prompt versions or scoring modes (see scoring_mode_key)
+    in the same journal are not counted.
+    """
+    if path == "-":
+        return None
+    return {
+        BatchJournal.key(*journal_ids(record), model, prompt_version, scoring_mode)
+        for record in read_manifest(path)
+    }
+
+
+def load_posting(record: Dict[str, Any]) -> str:
+    """Return the job posting text of a record (inline or from posting_path)."""
+    if record.get("posting"):
+        return record["posting"]
+    if record.get("job_posting"):
+        return record["job_posting"]
+    if record.get("posting_path"):
+        return Path(record["posting_path"]).read_text(encoding="utf-8")
+    raise ValueError("Record has no posting or posting_path")
+
+
+def load_cv(record: Dict[str, Any], compact: bool = False, token_budget: int = None) -> str:
+    """
+    Return the CV text of a record (inline, from a PDF or from a text file).
+
+    Args:
+        record: Manifest record
+        compact: Compact the text (see cv_compaction.py); PDFs are compacted
+            page by page so repeated headers/footers are recognized
+        token_budget: Optional token budget for compaction
+    """
+    if record.get("cv_text"):
+        cv = record["cv_text"]
+    else:
+        cv_path = record.get("cv_path") or record.get("pdf_path")
+        if not cv_path:
+            raise ValueError("Record has no cv_text or cv_path")
+        if cv_path.lower().endswith(".pdf"):
+            cv = extract_pdf_pages(cv_path) if compact else extract_pdf_text(cv_path)
+        else:
+            cv = Path(cv_path).read_text(encoding="utf-8")
+    if not compact:
+        return cv
+    return compact_cv_text(cv, token_budget=token_budget).text
+
+
+# ============================================================================
+# EVALUATION
+# ============================================================================
+
+# Scored (posting, CV) pairs remembered for deduplication; duplicates further
+# apart in the manifest than this many distinct pairs are scored again
+DEDUP_CACHE_ENTRIES = 4096
+
+
+def get_rubric(
+    job_posting: str,
+    rubric_cache: StepCache,
+    model: str = None,
+    use_cache: bool = True,
+    prompt_version: int = None
+):
+    """Extract the rubric once per (posting, model), even with concurrent callers."""
+    key = hashlib.sha256(f"{model}\n{use_cache}\n{prompt_version}\n{job_posting}".encode("utf-8")).hexdigest()
+    (rubric,), _ = rubric_cache.get_or_compute(
+        key,
+        lambda: (extract_rubric_with_llm(job_posting, use_cache=use_cache, prompt_version=prompt_version, model=model),)
+    )
+    return rubric
+
+
+def evaluate_record(
+    record: Dict[str, Any],
+    rubric_cache: StepCache,
+    model: str = None,
+    use_cache: bool = True,
+    prompt_version: int = None,
+    score_cache: StepCache = None,
+    compact_profile: bool = False,
+    compact_cv: bool = False,
+    cv_token_budget: int = None
+) -> Dict[str, Any]:
+    """
+    Evaluate one manifest record (rubric extraction -> scoring -> final score).
+
+    Args:
+        record: Manifest record
+        rubric_cache: Shared in-memory rubric cache
+        model: Optional model name to use
+        use_cache: Whether to use the on-disk rubric cache
+        prompt_version: Optional Langfuse prompt version for rubric extraction
+        score_cache: Optional shared cache of results by (posting, CV hash);
+            a duplicate CV reuses the result (or waits for the running call)
+        compact_profile: Score on the compact structured CV profile (see cv_profile.py)
+        compact_cv: Compact the CV text before scoring (see cv_compaction.py)
+        cv_token_budget: Optional token budget for the compacted CV
+
+    Returns:
+        Output line dict; errors are reported with status "error"
+    """
+    start_time = time.time()
+    output = {
+        "line": record.get("line"),
+        "job_id": record.get("job_id"),
+        "candidate_id": record.get("candidate_id"),
+        "model": model or test_matching_score.OPENROUTER_MODEL
+    }
+    try:
+        if record.get("error"):
+            raise ValueError(record["error"])
+        job_posting = load_posting(record)
+        rubric = get_rubric(
+            job_posting, rubric_cache, model=model, use_cache=use_cache, prompt_version=prompt_version
+        )
+        cv_text = load_cv(record, compact=compact_cv, token_budget=cv_token_budget)
+        cv_hash = cv_text_hash(cv_text)
+
+        def score():
+            if compact_profile:
+                criteria_scores = score_criteria_with_profile(cv_text, rubric, model=model, use_cache=use_cache)
+            else:
+                criteria_scores = score_criteria_with_llm(cv_text, rubric, model=model)
+            return (calculate_matching_score(rubric, criteria_scores),)
+
+        if score_cache is None:
+            (result,), duplicate = score(), False
+        else:
+            key = hashlib.sha256(
+                f"{model}\n{use_cache}\n{prompt_version}\n{compact_profile}\n{job_posting}\n{cv_hash}".encode("utf-8")
+            ).hexdigest()
+            (result,), duplicate = score_cache.get_or_compute(key, score)
+        output.update({
+            "status": "ok",
+            "final_score": result["final_score"],
+            "breakdown": result["breakdown"],
+            "cv_hash": cv_hash[:16]
+        })
+        if duplicate:
+            output["deduplicated"] = True
+    except Exception as e:
+        output.update({"status": "error", "error": str(e)})
+    output["duration"] = round(time.time() - start_time, 3)
+    return output
+
+
+def scoring_mode_key(compact_profile: bool = False, compact_cv: bool = False, cv_token_budget: int = None) -> Optional[str]:
+    """Scoring mode part of the journal key (None for full-CV scoring)."""
+    parts = []
+    if compact_cv:
+        parts.append(f"compact_cv:{cv_token_budget or ''}")
+    if compact_profile:
+        parts.append("compact_profile")
+    return ",".join(parts) or None
+
+
+def run_batch(
+    records: Iterable[Dict[str, Any]],
+    output: TextIO,
+    max_workers: int = 8,
+    model: str = None,
+    use_cache: bool = True,
+    on_result: Callable[[Dict[str, Any]], None] = None,
+    journal: BatchJournal = None,
+    prompt_version: int = None,
+    dedupe: bool = True,
+    compact_profile: bool = False,
+    compact_cv: bool = False,
+    cv_token_budget: int = None,
+    journal_keys: Set[str] = None
+) -> Dict[str, Any]:
+    """
+    Stream records through the evaluation with bounded concurrency.
+
+    At most max_workers pairs are in flight; each result is written (and
+    flushed) to output as soon as it completes. With a journal, pairs already
+    completed for the same (job, candidate, model, prompt version, scoring
+    mode) are skipped and every new result is checkpointed.
+
+    Args:
+        records: Iterable of manifest records (consumed lazily)
+        output: Text stream for JSONL results
+        max_workers: Number of pairs evaluated concurrently
+        model: Optional model name to use
+        use_cache: Whether to use the on-disk rubric cache
+        on_result: Optional callback invoked with each output line dict
+        journal: Optional checkpoint journal for resumable runs
+        prompt_version: Optional Langfuse prompt version for rubric extraction
+        dedupe: Score each distinct (posting, CV text) pair only once
+        compact_profile: Score on compact structured CV profiles (see cv_profile.py)
+        compact_cv: Compact CV texts before scoring (see cv_compaction.py)
+        cv_token_budget: Optional token budget for compacted CVs
+        journal_keys: Optional set that receives the journal key of every
+            record read (progress of a manifest that cannot be read twice, e.g. stdin)
+
+    Returns:
+        dict with total, ok, failed, skipped, deduplicated, dedup_ratio
+        (deduplicated / ok) and elapsed (seconds)
+    """
+    rubric_cache = StepCache(max_entries=64)
+    score_cache = StepCache(max_entries=DEDUP_CACHE_ENTRIES) if dedupe else None
+    stats = {"total": 0, "ok": 0, "failed": 0, "skipped": 0, "deduplicated": 0}
+    model_name = model or test_matching_score.OPENROUTER_MODEL
+    scoring_mode = scoring_mode_key(compact_profile, compact_cv, cv_token_budget)
+    start_time = time.time()
+
+    def write(result: Dict[str, Any]):
+        output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        output.flush()
+        stats["total"] += 1
+        stats["ok" if result["status"] == "ok" else "failed"] += 1
+        if result.get("deduplicated"):
+            stats["deduplicated"] += 1
+        if journal is not None:
+            journal.record(
+                journal.key(*journal_ids(result), model_name, prompt_version, scoring_mode),
+                result,
+                prompt_version=prompt_version
+            )
+        if on_result is not None:
+            on_result(result)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending = set()
+        for record in records:
+            if journal is not None:
+                key = journal.key(*journal_ids(record), model_name, prompt_version, scoring_mode)
+                if journal_keys is not None:
+                    journal_keys.add(key)
+                if journal.is_done(key):
+                    stats["skipped"] += 1
+                    continue
+            if len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write(future.result())
+            pending.add(executor.submit(
+                evaluate_record, record, rubric_cache, model, use_cache, prompt_version, score_cache,
+                compact_profile, compact_cv, cv_token_budget
+            ))
+        for future in pending:
+            write(future.result())
+
+    stats["dedup_ratio"] = round(stats["deduplicated"] / stats["ok"], 3) if stats["ok"] else 0.0
+    stats["elapsed"] = round(time.time() - start_time, 3)
+    return stats
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score (job posting, CV) pairs from a JSONL/CSV manifest.")
+    parser.add_argument("manifest", help="Manifest file (.jsonl or .csv), or - for JSONL on stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="Pairs evaluated concurrently (default: 8)")
+    parser.add_argument("--model", default=None, help=f"OpenRouter model (default: {test_matching_score.OPENROUTER_MODEL})")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the on-disk rubric cache")
+    parser.add_argument("--prompt-version", type=int, default=None, help="Langfuse prompt version for rubric extraction")
+    parser.add_argument("--journal", default=None, help="Checkpoint journal; rerunning with the same journal resumes the batch")
+    parser.add_argument("--status", action="store_true", help="Print progress from the journal and exit")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress reports (default: 10)")
+    parser.add_argument("--no-dedupe", action="store_true", help="Score duplicate CVs again instead of reusing results")
+    parser.add_argument("--compact-profile", action="store_true",
+                        help="Score on a compact structured CV profile (extracted once per CV) instead of the full text")
+    parser.add_argument("--compact-cv", action="store_true",
+                        help="Strip page furniture, contact details and low-value sections from CVs before scoring")
+    parser.add_argument("--cv-token-budget", type=int, default=None,
+                        help="Token budget for compacted CVs (implies --compact-cv)")
+    parser.add_argument("--top", type=int, default=None, help="Report the current top-K candidates per job while running")
+    args = parser.parse_args(argv)
+
+    compact_cv = args.compact_cv or args.cv_token_budget is not None
+    journal = BatchJournal(args.journal) if args.journal else None
+    batch_keys = None
+    if journal is not None:
+        # Same key as run_batch: model, prompt version and scoring mode
+        batch_keys = manifest_journal_keys(
+            args.manifest,
+            args.model or test_matching_score.OPENROUTER_MODEL,
+            args.prompt_version,
+            scoring_mode_key(args.compact_profile, compact_cv, args.cv_token_budget)
+        )
+    # A stdin manifest cannot be read twice: its keys are collected while the batch runs
+    streamed_keys = set() if journal is not None and batch_keys is None else None
+    total = len(batch_keys) if batch_keys is not None else None
+    if args.status:
+        if journal is None:
+            parser.error("--status requires --journal")
+        print(format_progress(journal.progress(total, keys=batch_keys)), file=sys.stderr)
+        journal.close()
+        return 0
+    if batch_keys is not None:
+        resumed = journal.progress(total, keys=batch_keys)["resumed"]
+        if resumed:
+            print(f"🔄 Resuming: {resumed} pair(s) already completed in {args.journal}", file=sys.stderr)
+
+    last_report = [time.time()]
+    leaderboards: Dict[str, Leaderboard] = {}
+
+    def print_leaderboards(histogram: bool = False):
+        for job_id, board in leaderboards.items():
+            print(f"[{job_id}] {board.format_top()}", file=sys.stderr)
+            if histogram:
+                print(board.format_histogram(), file=sys.stderr)
+
+    def report_progress(result: Dict[str, Any]):
+        if args.top and result["status"] == "ok":
+            if result["job_id"] not in leaderboards:
+                leaderboards[result["job_id"]] = Leaderboard(top_k=args.top)
+            leaderboards[result["job_id"]].add(result["candidate_id"], result)
+        if (journal is None and not args.top) or time.time() - last_report[0] < args.progress_every:
+            return
+        last_report[0] = time.time()
+        if journal is not None:
+            print(format_progress(journal.progress(total, keys=batch_keys if batch_keys is not None else streamed_keys)),
+                  file=sys.stderr)
+        print_leaderboards()
+
+    to_stdout = args.output == "-"
+    output = sys.stdout if to_stdout else open(args.output, "a", encoding="utf-8")
+    # LLM call logging goes to stdout; keep it out of the JSONL stream
+    original_stdout = sys.stdout
+    if to_stdout:
+        sys.stdout = sys.stderr
+    try:
+        stats = run_batch(
+            read_manifest(args.manifest),
+            output,
+            max_workers=args.workers,
+            model=args.model,
+            use_cache=not args.no_cache,
+            on_result=report_progress,
+            journal=journal,
+            prompt_version=args.prompt_version,
+            dedupe=not args.no_dedupe,
+            compact_profile=args.compact_profile,
+            compact_cv=compact_cv,
+            cv_token_budget=args.cv_token_budget,
+            journal_keys=streamed_keys
+        )
+    finally:
+        sys.stdout = original_stdout
+        if not to_stdout:
+            output.close()
+        if journal is not None:
+            journal.close()
+
+    print_leaderboards(histogram=True)
+    print(f"✅ {stats['ok']}/{stats['total']} pairs scored, {stats['failed']} failed in {stats['elapsed']:.1f}s", file=sys.stderr)
+    if stats["deduplicated"]:
+        print(f"🔁 {stats['deduplicated']} duplicate CV(s) reused ({stats['dedup_ratio']:.0%} of scored pairs)", file=sys.stderr)
+    if stats["skipped"]:
+        print(f"⏭️  {stats['skipped']} pair(s) skipped (already in journal)", file=sys.stderr)
+    return 0 if stats["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
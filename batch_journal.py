@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint journal for batch evaluations.
+
+Every completed (job, candidate, model, prompt version) evaluation is appended
+as one JSON line and flushed immediately, so a batch that dies halfway (network
+blip, crash, Ctrl+C) can be rerun with the same journal: finished pairs are
+skipped and only outstanding work is paid for again. Failed pairs are journaled
+too but are retried on resume.
+
+JOURNAL FORMAT:
+---------------
+    {"key": "3f9c...", "job_id": "...", "candidate_id": "...", "model": "...",
+     "prompt_version": null, "status": "ok", "duration": 4.1,
+     "completed_at": 1732450000.0, "result": {...}}
+
+USAGE:
+------
+    journal = BatchJournal("results.journal")
+    key = journal.key(job_id, candidate_id, model, prompt_version)
+    if not journal.is_done(key):
+        ...
+        journal.record(key, result)
+    journal.progress(total=500, keys=batch_keys)   # done / remaining / ETA for this batch
+"""
+
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator, Set
+
+
+class BatchJournal:
+    """Append-only JSONL journal of completed batch evaluations."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        # Only short key hashes are kept in memory, not results
+        self._done = set()
+        self._failed = set()
+        self._durations: Dict[str, float] = {}
+        self._session_start = time.time()
+        self._session_completed = 0
+
+        for entry in self.entries():
+            self._apply(entry)
+        # Keys completed before this session (a journal can hold several
+        # batches, models or scoring modes; see progress(keys=...))
+        self._resumed = frozenset(self._done)
+        self.resumed = len(self._resumed)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    @staticmethod
+    def key(job_id: Any, candidate_id: Any, model: str = None, prompt_version: Any = None, mode: str = None) -> str:
+        """
+        Journal key of one evaluation (job, candidate, model, prompt version).
+
+        mode identifies a non-default scoring mode (e.g. compact CV profiles),
+        so results of one mode are not reused when resuming in another.
+        """
+        payload = [str(job_id), str(candidate_id), model, prompt_version] + ([mode] if mode else [])
+        payload = json.dumps(payload)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over journal entries (a truncated last line is ignored)."""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def _apply(self, entry: Dict[str, Any]):
+        key = entry.get("key")
+        if entry.get("status") == "ok":
+            if key not in self._done:
+                self._durations[key] = entry.get("duration") or 0.0
+            self._done.add(key)
+            self._failed.discard(key)
+        elif key not in self._done:
+            self._failed.add(key)
+
+    def is_done(self, key: str) -> bool:
+        with self._lock:
+            return key in self._done
+
+    def record(self, key: str, result: Dict[str, Any], prompt_version: Any = None):
+        """
+        Append one completed evaluation and flush it to disk.
+
+        Args:
+            key: Journal key (see BatchJournal.key)
+            result: Output line dict (needs "status"; "duration" is used for ETA)
+            prompt_version: Prompt version the result was produced with
+        """
+        entry = {
+            "key": key,
+            "job_id": result.get("job_id"),
+            "candidate_id": result.get("candidate_id"),
+            "model": result.get("model"),
+            "prompt_version": prompt_version,
+            "status": result.get("status"),
+            "duration": result.get("duration"),
+            "completed_at": time.time(),
+            "result": result
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            self._apply(entry)
+            self._session_completed += 1
+
+    def progress(self, total: Optional[int] = None, keys: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        Progress report computed from the journal.
+
+        Args:
+            total: Total number of pairs in the batch (if known)
+            keys: Journal keys of the batch; entries for other keys (other
+                manifests, models, prompt versions or scoring modes) are not
+                counted. None counts the whole journal.
+
+        Returns:
+            dict with done, failed, resumed, remaining, percent, avg_duration,
+            throughput (pairs/s in this session) and eta_seconds
+        """
+        with self._lock:
+            done_keys = self._done if keys is None else self._done & keys
+            done = len(done_keys)
+            failed = len(self._failed if keys is None else self._failed & keys)
+            resumed = len(self._resumed if keys is None else self._resumed & keys)
+            elapsed = time.time() - self._session_start
+            throughput = self._session_completed / elapsed if elapsed > 0 and self._session_completed else None
+            avg_duration = sum(self._durations[key] for key in done_keys) / done if done else None
+
+        remaining = max(total - done, 0) if total is not None else None
+        eta_seconds = None
+        if remaining is not None and throughput:
+            eta_seconds = remaining / throughput
+        return {
+            "done": done,
+            "failed": failed,
+            "resumed": resumed,
+            "remaining": remaining,
+            "percent": round(100 * done / total, 1) if total else None,
+            "avg_duration": round(avg_duration, 2) if avg_duration is not None else None,
+            "throughput": round(throughput, 3) if throughput else None,
+            "eta_seconds": round(eta_seconds) if eta_seconds is not None else None
+        }
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def format_progress(progress: Dict[str, Any]) -> str:
+    """One-line human readable progress report."""
+    parts = [f"{progress['done']} done"]
+    if progress["remaining"] is not None:
+        parts[0] = f"{progress['done']}/{progress['done'] + progress['remaining']} done ({progress['percent']}%)"
+    if progress["failed"]:
+        parts.append(f"{progress['failed']} failed")
+    if progress["resumed"]:
+        parts.append(f"{progress['resumed']} resumed from journal")
+    if progress["eta_seconds"] is not None:
+        minutes, seconds = divmod(progress["eta_seconds"], 60)
+        parts.append(f"ETA {int(minutes)}m{int(seconds):02d}s")
+    return "📊 " + ", ".join(parts)
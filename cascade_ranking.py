@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Cascade ranking: a fast model screens every candidate, a strong model
+confirms only the candidates that can make the shortlist.
+
+Most candidates in a large pool are obvious non-fits; scoring all of them with
+the strong model pays its latency and cost for nothing. The cascade:
+
+1. Screen: score everyone with the fast model (default: Gemini Flash Lite)
+2. Select: the top-k screened candidates, plus anyone within `margin` points
+   of the k-th score (and anyone whose screening failed)
+3. Confirm: re-score the selected candidates with the strong model
+   (default: Claude Haiku); their confirmed score replaces the screened one
+
+The report compares the cascade with scoring everyone on the strong model
+(estimated from the strong model's per-candidate cost and call time).
+
+USAGE:
+------
+    rubric = extract_rubric_with_llm(job_posting)
+    report = cascade_rank(candidates, rubric, top_k=10, margin=5)
+    report["ranking"][:10]     # [{"name", "final_score", "screen_score", "stage"}]
+    report["savings"]          # {"cost", "cost_pct", "llm_seconds", ...}
+"""
+
+import time
+from typing import List, Dict, Any
+
+from test_matching_score import (
+    EvaluationRubric,
+    CLAUDE_HAIKU_OPENROUTER,
+    GEMINI_FLASH_LITE_OPENROUTER,
+    score_profiles_concurrently,
+    track_llm_calls
+)
+
+
+def _usage(calls: List[Dict[str, Any]]) -> Dict[str, float]:
+    return {
+        "calls": len(calls),
+        "cost": sum(call.get("cost") or 0.0 for call in calls),
+        "total_tokens": sum(call.get("total_tokens") or 0 for call in calls),
+        "llm_seconds": sum(call.get("duration") or 0.0 for call in calls)
+    }
+
+
+def _run_stage(cv_profiles: List[tuple], rubric: EvaluationRubric, model: str, max_workers: int) -> Dict[str, Any]:
+    start_time = time.time()
+    with track_llm_calls() as calls:
+        results, failures = score_profiles_concurrently(cv_profiles, rubric, max_workers=max_workers, model=model)
+    stage = {
+        "model": model,
+        "candidates": len(cv_profiles),
+        "results": results,
+        "failures": failures,
+        "wall_time": time.time() - start_time
+    }
+    stage.update(_usage(calls))
+    return stage
+
+
+def select_for_confirmation(screen_results: List[tuple], top_k: int, margin: float) -> List[str]:
+    """
+    Names of the screened candidates to re-score with the strong model.
+
+    Args:
+        screen_results: (name, score, result) tuples sorted by score (descending)
+        top_k: Size of the shortlist
+        margin: Candidates within this many points of the k-th score are also confirmed
+
+    Returns:
+        Candidate names in screening order
+    """
+    if not screen_results or top_k <= 0:
+        return []
+    cutoff = screen_results[min(top_k, len(screen_results)) - 1][1]
+    return [
+        name for i, (name, score, _) in enumerate(screen_results)
+        if i < top_k or score >= cutoff - margin
+    ]
+
+
+def cascade_rank(
+    cv_profiles: List[tuple],
+    rubric: EvaluationRubric,
+    top_k: int = 10,
+    margin: float = 5.0,
+    screen_model: str = GEMINI_FLASH_LITE_OPENROUTER,
+    confirm_model: str = CLAUDE_HAIKU_OPENROUTER,
+    max_workers: int = 8
+) -> Dict[str, Any]:
+    """
+    Rank candidates with a fast screening model and a strong confirmation model.
+
+    Args:
+        cv_profiles: List of (name, cv_text) tuples (names must be unique)
+        rubric: The evaluation rubric (shared by both stages)
+        top_k: Size of the shortlist confirmed by the strong model
+        margin: Also confirm candidates within this many points of the k-th screened score
+        screen_model: Fast model scoring every candidate
+        confirm_model: Strong model re-scoring the selected candidates
+        max_workers: Maximum number of concurrent scoring calls per stage
+
+    Returns:
+        dict with:
+        - ranking: [{"name", "final_score", "screen_score", "stage", "result"}];
+          confirmed candidates first (by confirmed score), then screened-only
+        - failures: (name, error) for candidates that failed both stages
+        - screen / confirm: per-stage model, candidates, calls, cost, tokens,
+          llm_seconds and wall_time
+        - savings: cost / llm_seconds saved versus scoring everyone with the
+          strong model (estimated from the confirmation stage)
+    """
+    print("\n" + "="*100)
+    print(f"CASCADE RANKING: {len(cv_profiles)} candidates, screen={screen_model}, confirm={confirm_model}, "
+          f"top_k={top_k}, margin={margin}")
+    print("="*100)
+
+    screen = _run_stage(cv_profiles, rubric, screen_model, max_workers)
+    screen_scores = {name: score for name, score, _ in screen["results"]}
+
+    # Candidates the fast model could not score are confirmed rather than dropped
+    selected = set(select_for_confirmation(screen["results"], top_k, margin))
+    selected.update(name for name, _ in screen["failures"])
+    to_confirm = [(name, cv) for name, cv in cv_profiles if name in selected]
+    print(f"\n→ Confirming {len(to_confirm)}/{len(cv_profiles)} candidates with {confirm_model}")
+    confirm = _run_stage(to_confirm, rubric, confirm_model, max_workers)
+
+    ranking = []
+    confirmed = set()
+    for name, score, result in confirm["results"]:
+        confirmed.add(name)
+        ranking.append({
+            "name": name,
+            "final_score": score,
+            "screen_score": screen_scores.get(name),
+            "stage": "confirmed",
+            "result": result
+        })
+    for name, score, result in screen["results"]:
+        if name not in confirmed:
+            ranking.append({
+                "name": name,
+                "final_score": score,
+                "screen_score": score,
+                "stage": "screened",
+                "result": result
+            })
+    ranked_names = {entry["name"] for entry in ranking}
+    failures = [(name, error) for name, error in confirm["failures"] if name not in ranked_names]
+
+    # Estimate single-model scoring from the strong model's per-candidate usage
+    savings = None
+    if confirm["candidates"]:
+        per_candidate_cost = confirm["cost"] / confirm["candidates"]
+        per_candidate_seconds = confirm["llm_seconds"] / confirm["candidates"]
+        single_cost = per_candidate_cost * len(cv_profiles)
+        single_seconds = per_candidate_seconds * len(cv_profiles)
+        cascade_cost = screen["cost"] + confirm["cost"]
+        cascade_seconds = screen["llm_seconds"] + confirm["llm_seconds"]
+        savings = {
+            "single_model_cost": round(single_cost, 6),
+            "cascade_cost": round(cascade_cost, 6),
+            "cost": round(single_cost - cascade_cost, 6),
+            "cost_pct": round(100 * (single_cost - cascade_cost) / single_cost, 1) if single_cost else None,
+            "single_model_llm_seconds": round(single_seconds, 2),
+            "cascade_llm_seconds": round(cascade_seconds, 2),
+            "llm_seconds": round(single_seconds - cascade_seconds, 2)
+        }
+
+    for stage in (screen, confirm):
+        del stage["results"]
+        del stage["failures"]
+
+    print("\n" + "="*100)
+    print("CASCADE SUMMARY")
+    print("="*100)
+    for i, entry in enumerate(ranking[:max(top_k, 1)], 1):
+        screened = f" (screen: {entry['screen_score']})" if entry["stage"] == "confirmed" else " (screened only)"
+        print(f"{i}. {entry['name']}: {entry['final_score']}/100{screened}")
+    print(f"\nScreen:  {screen['calls']} calls, ${screen['cost']:.4f}, {screen['wall_time']:.1f}s")
+    print(f"Confirm: {confirm['calls']} calls, ${confirm['cost']:.4f}, {confirm['wall_time']:.1f}s")
+    if savings:
+        print(f"Saved vs {confirm_model} only: ${savings['cost']:.4f} ({savings['cost_pct']}%), "
+              f"{savings['llm_seconds']:.1f}s of LLM time")
+    print("="*100)
+
+    return {
+        "ranking": ranking,
+        "failures": failures,
+        "screen": screen,
+        "confirm": confirm,
+        "savings": savings
+    }
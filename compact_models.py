@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Compact representations of rubrics and scoring results for large batches.
+
+RubricCriterion, EvaluationRubric and CriterionScore are mutable dataclasses
+with a per-instance __dict__ (parse_rubric and calculate_matching_score update
+them in place), and every calculate_matching_score result is a dict holding a
+list of breakdown dicts that repeat the criterion name, weight, evidence and
+gap for each candidate. Holding 100k results that way costs hundreds of
+megabytes (see benchmark_memory).
+
+This module provides:
+
+- CompactCriterion / CompactRubric / CompactScore: frozen, slotted variants
+  with interned criterion names (read-only snapshots, convertible both ways)
+- ResultStore: an append-only, array-backed container for the results of many
+  candidates scored against one rubric. Scores are a flat float32 array
+  (candidates × criteria), final scores an int16 array, and evidence/gap texts
+  are indices into a deduplicated string table ("" and repeated texts are
+  stored once). Full calculate_matching_score results are rebuilt on demand.
+
+USAGE:
+------
+    store = ResultStore(rubric)
+    for name, score, result in results:            # score_profiles_concurrently output
+        store.append(name, result)
+    store.ranking(top_n=20)                        # [(candidate_id, final_score)]
+    store.result("alice")                          # calculate_matching_score structure
+    store.to_score_matrix().reweight({...})        # vectorized re-ranking
+
+    # Memory benchmark (dicts vs ResultStore)
+    python compact_models.py --candidates 100000
+"""
+
+import sys
+import math
+import random
+import argparse
+import tracemalloc
+from array import array
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+
+from test_matching_score import RubricCriterion, EvaluationRubric, CriterionScore
+
+
+# ============================================================================
+# FROZEN MODELS
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class CompactCriterion:
+    """Read-only RubricCriterion without a per-instance __dict__."""
+    name: str
+    weight: float
+    description: str
+    is_required: bool
+
+    @classmethod
+    def from_criterion(cls, criterion: RubricCriterion) -> "CompactCriterion":
+        return cls(sys.intern(criterion.name), float(criterion.weight), criterion.description, bool(criterion.is_required))
+
+    def to_criterion(self) -> RubricCriterion:
+        return RubricCriterion(name=self.name, weight=self.weight, description=self.description,
+                               is_required=self.is_required)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactRubric:
+    """Read-only EvaluationRubric (criteria stored as a tuple)."""
+    criteria: Tuple[CompactCriterion, ...]
+    total_weight: float
+
+    @classmethod
+    def from_rubric(cls, rubric: EvaluationRubric) -> "CompactRubric":
+        return cls(tuple(CompactCriterion.from_criterion(c) for c in rubric.criteria), float(rubric.total_weight))
+
+    def to_rubric(self) -> EvaluationRubric:
+        return EvaluationRubric(criteria=[c.to_criterion() for c in self.criteria], total_weight=self.total_weight)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactScore:
+    """Read-only CriterionScore with an interned criterion name."""
+    criteria_name: str
+    score: float
+    evidence: str
+    gap: str
+
+    @classmethod
+    def from_score(cls, score: CriterionScore) -> "CompactScore":
+        return cls(sys.intern(score.criteria_name), float(score.score), score.evidence or "", score.gap or "")
+
+    def to_score(self) -> CriterionScore:
+        return CriterionScore(criteria_name=self.criteria_name, score=self.score, evidence=self.evidence, gap=self.gap)
+
+
+# ============================================================================
+# ARRAY-BACKED RESULTS
+# ============================================================================
+
+class ResultStore:
+    """
+    Append-only results of many candidates against one rubric.
+
+    Per candidate the store keeps len(criteria) float32 scores, two uint32
+    text indices per criterion and an int16 final score; criterion names and
+    weights are stored once for the whole batch.
+    """
+
+    def __init__(self, rubric: EvaluationRubric):
+        self.rubric = CompactRubric.from_rubric(rubric) if isinstance(rubric, EvaluationRubric) else rubric
+        self.columns = {c.name: column for column, c in enumerate(self.rubric.criteria)}
+        self.candidate_ids: List[str] = []
+        self.scores = array("f")          # row-major (candidates × criteria), NaN = not scored
+        self.final = array("h")
+        self.evidence = array("I")        # indices into self.texts, row-major like scores
+        self.gaps = array("I")
+        self.texts: List[str] = [""]
+        self._text_index: Dict[str, int] = {"": 0}
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def _text(self, text: Optional[str]) -> int:
+        text = text or ""
+        index = self._text_index.get(text)
+        if index is None:
+            index = len(self.texts)
+            self.texts.append(text)
+            self._text_index[text] = index
+        return index
+
+    def append(self, candidate_id: str, result: Dict[str, Any]):
+        """
+        Add one candidate's calculate_matching_score result.
+
+        Breakdown entries are matched to rubric columns by name; criteria
+        missing from the breakdown are stored as not scored.
+        """
+        if candidate_id in self._rows:
+            raise ValueError(f"Duplicate candidate id: {candidate_id}")
+        width = len(self.rubric.criteria)
+        row_scores = [math.nan] * width
+        row_evidence = [0] * width
+        row_gaps = [0] * width
+        for item in result["breakdown"]:
+            column = self.columns.get(item["criterion"])
+            if column is None:
+                continue
+            row_scores[column] = item["score"]
+            row_evidence[column] = self._text(item.get("evidence"))
+            row_gaps[column] = self._text(item.get("gap"))
+
+        self._rows[candidate_id] = len(self.candidate_ids)
+        self.candidate_ids.append(candidate_id)
+        self.scores.extend(row_scores)
+        self.evidence.extend(row_evidence)
+        self.gaps.extend(row_gaps)
+        self.final.append(int(result["final_score"]))
+
+    def extend(self, results: List[tuple]):
+        """Add score_profiles_concurrently results ((name, score, result) tuples)."""
+        for name, _, result in results:
+            self.append(name, result)
+
+    def final_score(self, candidate_id: str) -> int:
+        return self.final[self._rows[candidate_id]]
+
+    def ranking(self, top_n: int = None) -> List[tuple]:
+        """(candidate_id, final_score) sorted by score (descending, ties keep insertion order)."""
+        order = sorted(range(len(self.final)), key=lambda row: -self.final[row])
+        if top_n is not None:
+            order = order[:top_n]
+        return [(self.candidate_ids[row], self.final[row]) for row in order]
+
+    def result(self, candidate_id: str) -> Dict[str, Any]:
+        """
+        Rebuild one candidate's result.
+
+        Returns:
+            dict with final_score, total_weight_used and breakdown (same
+            structure as calculate_matching_score, in rubric order)
+        """
+        row = self._rows[candidate_id]
+        offset = row * len(self.rubric.criteria)
+        breakdown = []
+        total_weight = 0.0
+        for column, criterion in enumerate(self.rubric.criteria):
+            score = self.scores[offset + column]
+            if math.isnan(score):
+                continue
+            score = int(score) if score.is_integer() else score
+            total_weight += criterion.weight
+            breakdown.append({
+                "criterion": criterion.name,
+                "score": score,
+                "weight": criterion.weight,
+                "contribution": round(score * (criterion.weight / 100), 2),
+                "evidence": self.texts[self.evidence[offset + column]],
+                "gap": self.texts[self.gaps[offset + column]]
+            })
+        return {
+            "final_score": self.final[row],
+            "total_weight_used": total_weight,
+            "breakdown": breakdown
+        }
+
+    def to_score_matrix(self):
+        """ScoreMatrix over the stored scores and texts (for vectorized re-weighting and ranking)."""
+        import numpy as np
+        from score_matrix import ScoreMatrix
+
+        width = len(self.rubric.criteria)
+        scores = np.frombuffer(self.scores, dtype=np.float32).reshape(len(self), width)
+        rows = range(0, len(self.evidence), width)
+        evidence = [[self.texts[index] for index in self.evidence[start:start + width]] for start in rows]
+        gaps = [[self.texts[index] for index in self.gaps[start:start + width]] for start in rows]
+        return ScoreMatrix(self.rubric.to_rubric(), list(self.candidate_ids), scores.copy(), evidence, gaps)
+
+
+# ============================================================================
+# MEMORY BENCHMARK
+# ============================================================================
+
+def _synthetic_batch(num_candidates: int, num_criteria: int, seed: int = 0) -> Tuple[EvaluationRubric, List[tuple]]:
+    """Results shaped like score_profiles_concurrently output, with typical text reuse."""
+    rng = random.Random(seed)
+    rubric = EvaluationRubric(
+        criteria=[
+            RubricCriterion(name=f"Hard Skills - Skill {i}", weight=100 / num_criteria,
+                            description=f"Hands-on experience with skill {i}", is_required=i < 3)
+            for i in range(num_criteria)
+        ],
+        total_weight=100.0
+    )
+    results = []
+    for n in range(num_candidates):
+        breakdown = []
+        for criterion in rubric.criteria:
+            score = float(rng.choice([0, 20, 40, 60, 70, 80, 85, 90, 100]))
+            # Evidence is mostly candidate-specific; gaps repeat across candidates
+            evidence = f"{rng.randint(1, 12)} years at Company {rng.randint(1, 5000)} working on {criterion.name.lower()}"
+            gap = "" if score >= 80 else f"No evidence of {criterion.name.lower()}"
+            breakdown.append({
+                "criterion": f"{criterion.name}",     # a new string per result, as parsed from JSON
+                "score": score,
+                "weight": criterion.weight,
+                "contribution": round(score * (criterion.weight / 100), 2),
+                "evidence": evidence,
+                "gap": gap
+            })
+        final_score = round(sum(item["score"] * (item["weight"] / 100) for item in breakdown))
+        results.append((f"candidate-{n}", final_score, {
+            "final_score": final_score,
+            "total_weight_used": 100.0,
+            "breakdown": breakdown
+        }))
+    return rubric, results
+
+
+def _traced(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, after - before
+
+
+def benchmark_memory(num_candidates: int = 100_000, num_criteria: int = 10) -> Dict[str, float]:
+    """
+    Compare the memory of plain result dicts and a ResultStore for equally shaped batches.
+
+    The dicts are measured as score_profiles_concurrently returns them; the
+    store is filled in chunks so the source dicts are not all alive at once.
+
+    Returns:
+        dict with dict_mb, store_mb, ratio and unique_texts
+    """
+    print(f"📏 Memory benchmark: {num_candidates} candidates × {num_criteria} criteria")
+
+    results, dict_bytes = _traced(lambda: _synthetic_batch(num_candidates, num_criteria)[1])
+    rubric = _synthetic_batch(0, num_criteria)[0]
+    del results
+
+    def build_store():
+        store = ResultStore(rubric)
+        chunk = 1000
+        for start in range(0, num_candidates, chunk):
+            _, part = _synthetic_batch(min(chunk, num_candidates - start), num_criteria, seed=start + 1)
+            for name, _, result in part:
+                store.append(f"{name}@{start}", result)
+        return store
+
+    store, store_bytes = _traced(build_store)
+    report = {
+        "dict_mb": round(dict_bytes / 1e6, 1),
+        "store_mb": round(store_bytes / 1e6, 1),
+        "ratio": round(dict_bytes / store_bytes, 1) if store_bytes else None,
+        "unique_texts": len(store.texts)
+    }
+    print(f"  Result dicts: {report['dict_mb']} MB")
+    print(f"  ResultStore:  {report['store_mb']} MB ({report['unique_texts']} unique texts)")
+    print(f"  → {report['ratio']}x smaller")
+    return report
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Memory benchmark: result dicts vs ResultStore.")
+    parser.add_argument("--candidates", type=int, default=100_000, help="Number of candidates (default: 100000)")
+    parser.add_argument("--criteria", type=int, default=10, help="Criteria per rubric (default: 10)")
+    args = parser.parse_args(argv)
+    benchmark_memory(args.candidates, args.criteria)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
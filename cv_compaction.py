@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Section-aware CV compaction to cut prompt tokens.
+
+Raw PDF text includes page furniture (headers/footers repeated on every page,
+page numbers), contact blocks, reference and hobby sections and layout
+whitespace. The full CV is sent in every scoring and qualification-note
+prompt, so all of it is paid for again for every job. compact_cv_text:
+
+1. Strips page furniture: page-number lines, and lines repeated at the top or
+   bottom of several pages (the first occurrence is kept)
+2. Removes contact details (e-mail, URLs, and phone numbers in the contact
+   block or next to a phone label) and personal data that must not influence
+   scoring (date of birth, marital status, gender); location lines are kept
+   for location criteria
+3. Collapses whitespace, bullet glyphs, separator lines and blank lines
+4. Detects sections (local_scorers.section_heading), drops references,
+   shortens interests/hobbies, and orders experience entries most recent first
+5. Under a token budget, trims in order: interests, projects, the details of
+   the oldest experience entries (their title and dates are kept), other
+   sections, and finally truncates the tail
+
+Sections are emitted as: header, summary, contact, experience, skills,
+languages, certifications, education, other, projects, interests, so a
+truncated CV loses the least relevant parts.
+
+USAGE:
+------
+    compacted = compact_cv_text(extract_pdf_pages("alice.pdf"), token_budget=1500)
+    compacted.text
+    compacted.tokens_before, compacted.tokens_after    # estimate_tokens
+    compacted.removed                                  # {"furniture_lines": 6, ...}
+
+    # CLI
+    python cv_compaction.py alice.pdf --budget 1500 [--show]
+"""
+
+import re
+import sys
+import argparse
+from datetime import date
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Tuple
+
+from cv_text import extract_pdf_pages
+from llm_packing import estimate_tokens
+from local_scorers import DATE_RANGE_PATTERN, date_range_months, section_heading, _fold
+
+
+# ============================================================================
+# PATTERNS
+# ============================================================================
+
+# Emission order (also the order in which a budget truncation cuts from the end)
+SECTION_ORDER = ["header", "summary", "contact", "experience", "skills", "languages", "certifications",
+                 "education", "other", "projects", "interests"]
+# Trimmed first when over budget
+BUDGET_DROP_ORDER = ["interests", "projects"]
+
+INTERESTS_MAX_CHARS = 200
+
+PAGE_NUMBER_PATTERN = re.compile(
+    r"^[-–\s]*(?:page|pagina|seite|pag\.?|p\.)?\s*\d{1,3}\s*(?:(?:/|of|sur|van|von|de|di)\s*\d{1,3})?[-–\s]*$"
+)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+|\b(?:linkedin|github|gitlab|xing)\.com/\S*", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"(?<![\w/.-])\+?\(?\d[\d\s().-]{7,}\d(?![\w/.-])")
+# Phone-shaped numbers are only removed on contact lines (numbers such as
+# "1 000 000 requests" in experience are content)
+PHONE_LABELS = re.compile(
+    r"\b(?:phone|telephone|tel|mobile|mob|gsm|cell|telefoon|telefon|telefono|telefone|portable|handy)\b",
+    re.IGNORECASE
+)
+CONTACT_SECTIONS = {"header", "contact"}
+HEADER_CONTACT_LINES = 8  # lines at the top of the CV treated as its contact block
+CONTACT_LABELS = re.compile(
+    r"\b(?:e-?mail|mail|phone|telephone|tel|mobile|mob|gsm|cell|linkedin|github|website|web|portfolio|"
+    r"telefoon|telefon|telefono|telefone|courriel|portable|handy)\b\.?\s*:?",
+    re.IGNORECASE
+)
+# Personal data irrelevant to (and not to be used for) scoring
+PERSONAL_DATA_PATTERN = re.compile(
+    r"^(?:date of birth|birth ?date|born|birthday|dob|age|marital status|gender|sex|date de naissance|"
+    r"ne le|nee le|etat civil|situation familiale|geboortedatum|geboren|burgerlijke staat|geslacht|"
+    r"geburtsdatum|familienstand|geschlecht|fecha de nacimiento|estado civil|data di nascita|"
+    r"stato civile|data de nascimento)\b"
+)
+BULLET_PATTERN = re.compile(r"^[•●▪■◦‣∙·○►▸➢✓✔\-–—*]+\s*")
+SEPARATOR_PATTERN = re.compile(r"^[\W_]{3,}$")
+
+
+# ============================================================================
+# CLEANING
+# ============================================================================
+
+@dataclass
+class CompactedCV:
+    """Compacted CV text with its token report."""
+    text: str
+    tokens_before: int
+    tokens_after: int
+    token_budget: Optional[int] = None
+    sections: List[str] = field(default_factory=list)
+    removed: Dict[str, int] = field(default_factory=dict)
+    truncated: bool = False
+
+    @property
+    def saved_pct(self) -> float:
+        return round(100 * (self.tokens_before - self.tokens_after) / self.tokens_before, 1) if self.tokens_before else 0.0
+
+    def summary(self) -> str:
+        return (f"~{self.tokens_before} → ~{self.tokens_after} tokens ({self.saved_pct}% fewer)"
+                + (f", budget {self.token_budget}" if self.token_budget else "")
+                + (", truncated" if self.truncated else ""))
+
+
+def _furniture_key(line: str) -> str:
+    """Line with digits masked, so "Page 2" and "Page 3" headers compare equal."""
+    return re.sub(r"\d+", "#", " ".join(_fold(line).split()))
+
+
+def _strip_page_furniture(pages: List[str], removed: Dict[str, int]) -> List[str]:
+    """Lines of all pages without page numbers and repeated page headers/footers."""
+    page_lines = [[line for line in page.splitlines() if line.strip()] for page in pages]
+    furniture = set()
+    if len(page_lines) >= 2:
+        # Lines at the top or bottom of several pages
+        edge_pages: Dict[str, int] = {}
+        for lines in page_lines:
+            for key in {_furniture_key(line) for line in lines[:3] + lines[-3:]}:
+                edge_pages[key] = edge_pages.get(key, 0) + 1
+        furniture = {key for key, count in edge_pages.items() if count >= max(2, len(page_lines) // 2)}
+
+    kept = []
+    seen_furniture = set()
+    for lines in page_lines:
+        for position, line in enumerate(lines):
+            if PAGE_NUMBER_PATTERN.match(_fold(line.strip())):
+                removed["furniture_lines"] += 1
+                continue
+            at_edge = position < 3 or position >= len(lines) - 3
+            key = _furniture_key(line)
+            if at_edge and key in furniture:
+                if key in seen_furniture:
+                    removed["furniture_lines"] += 1
+                    continue
+                seen_furniture.add(key)
+            kept.append(line)
+    return kept
+
+
+def _clean_line(line: str, removed: Dict[str, int], contact_line: bool = False) -> Optional[str]:
+    """
+    Line without contact details and layout noise (None to drop it).
+
+    Args:
+        line: CV line
+        removed: Removal counters (updated)
+        contact_line: The line is in the contact block (CV header or contact
+            section); elsewhere phone numbers are only removed next to a
+            phone label or another contact item
+    """
+    line = " ".join(line.split())
+    if not line or SEPARATOR_PATTERN.match(line):
+        return None
+    if PERSONAL_DATA_PATTERN.match(_fold(line)):
+        removed["personal_lines"] += 1
+        return None
+
+    bullet = BULLET_PATTERN.match(line)
+    prefix = ""
+    if bullet and len(line) > bullet.end():
+        prefix, line = "- ", line[bullet.end():]
+
+    cleaned = URL_PATTERN.sub("", EMAIL_PATTERN.sub("", line))
+    if contact_line or cleaned != line or PHONE_LABELS.search(line):
+        cleaned = PHONE_PATTERN.sub(
+            lambda m: m.group(0) if DATE_RANGE_PATTERN.search(_fold(m.group(0))) else "", cleaned
+        )
+    if cleaned != line:
+        removed["contact_items"] += 1
+        cleaned = CONTACT_LABELS.sub("", cleaned)
+        cleaned = " ".join(cleaned.strip(" |,;:/-–•").split())
+        if sum(ch.isalpha() for ch in cleaned) < 3:
+            return None
+        # Leftover separators between removed items ("Amsterdam |  | ")
+        cleaned = re.sub(r"(?:\s*[|,;•/]\s*){2,}", " | ", cleaned)
+        line = cleaned
+    return prefix + line
+
+
+# ============================================================================
+# SECTIONS
+# ============================================================================
+
+def _split_sections(lines: List[str]) -> List[Tuple[str, List[str]]]:
+    """(section, lines) in CV order; lines include the heading. Text before the first heading is "header"."""
+    sections = [("header", [])]
+    for line in lines:
+        section = section_heading(line)
+        if section:
+            sections.append((section, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, body) for name, body in sections if body]
+
+
+def _experience_entries(lines: List[str], now: int) -> Tuple[List[str], List[dict]]:
+    """
+    Split an experience section (without heading) into dated entries.
+
+    An entry starts at a line with a date range; when that line holds only the
+    dates, the title line just above it belongs to the entry too.
+
+    Returns:
+        (preamble lines, [{"lines", "header", "end", "start"}])
+    """
+    starts = []
+    ranges = {}
+    for i, line in enumerate(lines):
+        match = DATE_RANGE_PATTERN.search(_fold(line))
+        if not match:
+            continue
+        ranges[i] = date_range_months(match, now)
+        remainder = _fold(line)[:match.start()] + _fold(line)[match.end():]
+        date_only = sum(ch.isalpha() for ch in remainder) < 3
+        title_above = date_only and i > 0 and (not starts or starts[-1] < i - 1) and not lines[i - 1].startswith("- ")
+        starts.append(i - 1 if title_above else i)
+    if not starts:
+        return lines, []
+
+    entries = []
+    for n, start in enumerate(starts):
+        end = starts[n + 1] if n + 1 < len(starts) else len(lines)
+        block = lines[start:end]
+        dated = [ranges[i] for i in range(start, end) if i in ranges]
+        header = 2 if start not in ranges else 1
+        entries.append({
+            "lines": block,
+            "header": header,
+            "start": dated[0][0] if dated else 0,
+            "end": dated[0][1] if dated else 0
+        })
+    return lines[:starts[0]], entries
+
+
+def _render(sections: Dict[str, List[List[str]]]) -> str:
+    blocks = []
+    for name in SECTION_ORDER:
+        for body in sections.get(name, []):
+            blocks.append("\n".join(body))
+    return "\n\n".join(block for block in blocks if block.strip())
+
+
+# ============================================================================
+# COMPACTION
+# ============================================================================
+
+def compact_cv_text(
+    cv: Union[str, List[str]],
+    token_budget: int = None,
+    today: date = None
+) -> CompactedCV:
+    """
+    Compact a CV for prompts.
+
+    Args:
+        cv: CV text, or the list of page texts (extract_pdf_pages) so repeated
+            page headers/footers can be recognized; form feeds in a text also
+            separate pages
+        token_budget: Optional maximum size in estimated tokens (estimate_tokens)
+        today: Reference date for "present" when ordering experience
+
+    Returns:
+        CompactedCV with the text and the before/after token report
+    """
+    pages = cv if isinstance(cv, list) else cv.split("\f")
+    original = "\n".join(pages).strip()
+    today = today or date.today()
+    now = today.year * 12 + today.month - 1
+    removed = {"furniture_lines": 0, "contact_items": 0, "personal_lines": 0,
+               "reference_lines": 0, "interest_chars": 0, "trimmed_entries": 0, "dropped_sections": 0}
+
+    # name -> list of section bodies (a heading can occur twice)
+    sections: Dict[str, List[List[str]]] = {}
+    entries: List[dict] = []
+    for name, body in _split_sections(_strip_page_furniture(pages, removed)):
+        body = [
+            line for line in (
+                _clean_line(line, removed, contact_line=name == "contact" or (
+                    name == "header" and position < HEADER_CONTACT_LINES))
+                for position, line in enumerate(body)
+            ) if line
+        ]
+        if not body:
+            continue
+        if name == "references":
+            removed["reference_lines"] += len(body)
+            continue
+        if name == "interests":
+            text = "; ".join(line.lstrip("- ") for line in body[1:])
+            removed["interest_chars"] += max(len(text) - INTERESTS_MAX_CHARS, 0)
+            if len(text) > INTERESTS_MAX_CHARS:
+                text = text[:INTERESTS_MAX_CHARS].rsplit(" ", 1)[0] + " ..."
+            body = [body[0], text] if text else []
+        if name == "experience":
+            preamble, section_entries = _experience_entries(body[1:], now)
+            entries.extend(section_entries)
+            body = [body[0]] + preamble
+        if name not in SECTION_ORDER:
+            name = "other"
+        if body:
+            sections.setdefault(name, []).append(body)
+
+    # Most recent experience first (ongoing roles first, then by end and start date)
+    entries.sort(key=lambda entry: (entry["end"], entry["start"]), reverse=True)
+    experience_head = list(sections["experience"][0]) if entries else []
+
+    def rebuild_experience():
+        sections["experience"][0] = experience_head + [line for entry in entries for line in entry["lines"]]
+
+    if entries:
+        rebuild_experience()
+
+    text = _render(sections)
+    truncated = False
+    if token_budget:
+        # Cheapest losses first
+        for name in BUDGET_DROP_ORDER:
+            if estimate_tokens(text) <= token_budget:
+                break
+            if sections.pop(name, None):
+                removed["dropped_sections"] += 1
+                text = _render(sections)
+        for entry in reversed(entries):
+            if estimate_tokens(text) <= token_budget:
+                break
+            if len(entry["lines"]) > entry["header"]:
+                del entry["lines"][entry["header"]:]
+                removed["trimmed_entries"] += 1
+                rebuild_experience()
+                text = _render(sections)
+        for name in ["other", "summary"]:
+            if estimate_tokens(text) <= token_budget:
+                break
+            if sections.pop(name, None):
+                removed["dropped_sections"] += 1
+                text = _render(sections)
+        if estimate_tokens(text) > token_budget:
+            text = text[:token_budget * 4].rsplit("\n", 1)[0] + "\n[...]"
+            truncated = True
+
+    return CompactedCV(
+        text=text,
+        tokens_before=estimate_tokens(original),
+        tokens_after=estimate_tokens(text),
+        token_budget=token_budget,
+        sections=[name for name in SECTION_ORDER if name in sections],
+        removed={key: value for key, value in removed.items() if value},
+        truncated=truncated
+    )
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compact a CV (PDF or text file) for LLM prompts.")
+    parser.add_argument("cv", help="CV file (.pdf or text)")
+    parser.add_argument("--budget", type=int, default=None, help="Token budget (default: no limit)")
+    parser.add_argument("--show", action="store_true", help="Print the compacted text")
+    args = parser.parse_args(argv)
+
+    if args.cv.lower().endswith(".pdf"):
+        cv = extract_pdf_pages(args.cv)
+    else:
+        cv = Path(args.cv).read_text(encoding="utf-8")
+    compacted = compact_cv_text(cv, token_budget=args.budget)
+    if args.show:
+        print(compacted.text)
+        print()
+    print(f"✂️ {args.cv}: {compacted.summary()}")
+    print(f"   Sections: {', '.join(compacted.sections)}")
+    if compacted.removed:
+        print(f"   Removed: {', '.join(f'{key}={value}' for key, value in compacted.removed.items())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Lexical pre-ranking of a CV corpus (BM25) before LLM scoring.
+
+With hundreds of applicants per job, calling score_criteria_with_llm for every
+CV is the bottleneck. This module keeps a local inverted index over extracted
+CV texts and ranks candidates against the rubric's criterion names and
+descriptions, so only the top-N are sent to the LLM.
+
+Each criterion is scored as a separate BM25 query and normalized by the best
+matching CV, then combined with the criterion weights (required criteria can
+be boosted). Text is lowercased and accent-folded, so "Développeur" matches
+"developpeur".
+
+The index supports incremental adds (re-adding an unchanged CV is a no-op,
+a changed CV replaces the old postings) and is pickled to disk for fast
+restarts.
+
+USAGE:
+------
+    index = CVIndex.load("cv_index.pkl")        # empty index if missing
+    index.add("alice.pdf", cv_text)
+    index.save("cv_index.pkl")
+
+    ranking = index.rank_for_rubric(rubric, top_n=50)   # [(doc_id, score)]
+    shortlist, dropped = prerank(cv_profiles, rubric, top_n=50, index=index)
+
+    # CLI
+    python cv_index.py add cv_index.pkl cvs/*.pdf
+    python cv_index.py query cv_index.pkl posting.txt --top 50 [--score]
+"""
+
+import re
+import sys
+import math
+import pickle
+import hashlib
+import argparse
+import unicodedata
+from pathlib import Path
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+
+from cv_text import extract_pdf_text
+from test_matching_score import EvaluationRubric
+
+
+# ============================================================================
+# TOKENIZATION
+# ============================================================================
+
+# Frequent words of the supported languages that carry no matching signal
+STOPWORDS = {
+    # English
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is",
+    "it", "of", "on", "or", "the", "to", "with", "within", "their", "this", "that", "must",
+    "should", "least", "plus", "strong", "good", "ability", "knowledge", "experience",
+    # French
+    "au", "aux", "avec", "ce", "dans", "de", "des", "du", "en", "et", "la", "le", "les", "ou",
+    "par", "pour", "sur", "un", "une",
+    # Spanish / Portuguese / Italian
+    "con", "el", "los", "las", "para", "por", "del", "com", "da", "do", "di", "il", "per",
+    # German / Dutch
+    "und", "der", "die", "das", "mit", "von", "fur", "een", "het", "van", "voor", "met"
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, accent-fold and split text into index terms.
+
+    Keeps technology names such as "c++", "c#", "node.js" and ".net" (as
+    "net") in one piece and drops stopwords and single characters (except
+    "c" and "r").
+    """
+    normalized = unicodedata.normalize("NFKD", text or "")
+    folded = "".join(ch for ch in normalized if not unicodedata.combining(ch)).lower()
+    return [
+        token for token in TOKEN_PATTERN.findall(folded)
+        if token not in STOPWORDS and (len(token) > 1 or token in ("c", "r"))
+    ]
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class CVIndex:
+    """Incremental BM25 inverted index over CV texts."""
+
+    VERSION = 1
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}   # term -> {doc_id: term frequency}
+        self.doc_lengths: Dict[str, int] = {}           # doc_id -> number of terms
+        self.doc_hashes: Dict[str, str] = {}            # doc_id -> hash of the indexed text
+        self.doc_terms: Dict[str, tuple] = {}           # doc_id -> distinct terms (for removal)
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str) -> bool:
+        """
+        Index (or re-index) one CV.
+
+        Args:
+            doc_id: Candidate identifier (e.g. file name)
+            text: Extracted CV text
+
+        Returns:
+            True if the index changed, False if the same text was already indexed
+        """
+        text_hash = _text_hash(text)
+        if self.doc_hashes.get(doc_id) == text_hash:
+            return False
+        if doc_id in self:
+            self.remove(doc_id)
+
+        terms = Counter(tokenize(text))
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(terms.values())
+        self.doc_lengths[doc_id] = length
+        self.doc_hashes[doc_id] = text_hash
+        self.doc_terms[doc_id] = tuple(terms)
+        self.total_length += length
+        return True
+
+    def add_many(self, documents: List[Tuple[str, str]]) -> int:
+        """Index (doc_id, text) pairs; returns the number of new or changed CVs."""
+        return sum(self.add(doc_id, text) for doc_id, text in documents)
+
+    def remove(self, doc_id: str):
+        """Remove a CV from the index (no-op if absent)."""
+        if doc_id not in self:
+            return
+        for term in self.doc_terms.pop(doc_id):
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        del self.doc_hashes[doc_id]
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self) - df + 0.5) / (df + 0.5))
+
+    def score(self, query_terms: List[str], doc_ids: Optional[set] = None) -> Dict[str, float]:
+        """
+        BM25 scores of the CVs matching at least one query term.
+
+        Args:
+            query_terms: Tokenized query (repeated terms count once)
+            doc_ids: Optional subset of CVs to score
+
+        Returns:
+            dict of doc_id -> BM25 score
+        """
+        if not self.doc_lengths:
+            return {}
+        avg_length = self.total_length / len(self.doc_lengths) or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(query_terms):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf(term)
+            for doc_id, frequency in docs.items():
+                if doc_ids is not None and doc_id not in doc_ids:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores
+
+    def rank_for_rubric(
+        self,
+        rubric: EvaluationRubric,
+        top_n: int = None,
+        doc_ids: Optional[set] = None,
+        required_boost: float = 2.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank indexed CVs against a rubric.
+
+        Each criterion (name + description) is a BM25 query; its scores are
+        divided by the best score for that criterion and weighted by the
+        criterion weight (times required_boost for required criteria).
+
+        Args:
+            rubric: The evaluation rubric
+            top_n: Return only the best N CVs (None = all)
+            doc_ids: Optional subset of CVs to rank (e.g. this job's applicants)
+            required_boost: Weight multiplier for required criteria
+
+        Returns:
+            (doc_id, score) tuples sorted by score (descending), score in 0-100;
+            CVs matching no criterion term score 0
+        """
+        candidates = set(self.doc_lengths) if doc_ids is None else set(doc_ids) & set(self.doc_lengths)
+        totals = dict.fromkeys(candidates, 0.0)
+        weight_sum = 0.0
+        for criterion in rubric.criteria:
+            weight = criterion.weight * (required_boost if criterion.is_required else 1.0)
+            weight_sum += weight
+            scores = self.score(tokenize(f"{criterion.name} {criterion.description}"), candidates)
+            best = max(scores.values(), default=0.0)
+            if best <= 0:
+                continue
+            for doc_id, value in scores.items():
+                totals[doc_id] += weight * value / best
+
+        ranking = sorted(
+            ((doc_id, round(100 * total / weight_sum, 2) if weight_sum else 0.0) for doc_id, total in totals.items()),
+            key=lambda item: (-item[1], item[0])
+        )
+        return ranking[:top_n] if top_n is not None else ranking
+
+    def save(self, path: str):
+        """Pickle the index to disk (written to a temp file, then renamed)."""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": self.VERSION, "k1": self.k1, "b": self.b,
+                         "postings": self.postings, "doc_lengths": self.doc_lengths,
+                         "doc_hashes": self.doc_hashes, "doc_terms": self.doc_terms,
+                         "total_length": self.total_length}, f)
+        tmp_path.replace(path)
+        print(f"✓ Saved CV index ({len(self)} CVs, {len(self.postings)} terms) to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "CVIndex":
+        """Load an index saved with save(); returns an empty index if the file is missing or outdated."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"⚠ Could not load CV index {path}, starting empty: {e}")
+            return cls()
+        if state.get("version") != cls.VERSION:
+            print(f"⚠ CV index {path} has an outdated format, starting empty")
+            return cls()
+        index = cls(k1=state["k1"], b=state["b"])
+        index.postings = state["postings"]
+        index.doc_lengths = state["doc_lengths"]
+        index.doc_hashes = state["doc_hashes"]
+        index.doc_terms = state["doc_terms"]
+        index.total_length = state["total_length"]
+        print(f"✓ Loaded CV index ({len(index)} CVs, {len(index.postings)} terms) from {path}")
+        return index
+
+
+# ============================================================================
+# PRE-RANKING
+# ============================================================================
+
+def prerank(
+    cv_profiles: List[tuple],
+    rubric: EvaluationRubric,
+    top_n: int,
+    index: CVIndex = None
+) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Keep the top-N candidates for LLM scoring.
+
+    Args:
+        cv_profiles: List of (name, cv_text) tuples (names must be unique)
+        rubric: The evaluation rubric
+        top_n: Number of candidates to keep
+        index: Optional persistent index (the candidates are added to it);
+            a temporary index is built otherwise
+
+    Returns:
+        (shortlist, dropped): (name, cv_text) tuples in BM25 order, and
+        (name, bm25_score) tuples for the candidates not sent to the LLM
+    """
+    index = index if index is not None else CVIndex()
+    index.add_many(cv_profiles)
+    texts = dict(cv_profiles)
+    ranking = index.rank_for_rubric(rubric, doc_ids=set(texts))
+    shortlist = [(name, texts[name]) for name, _ in ranking[:top_n]]
+    dropped = ranking[top_n:]
+    print(f"🔎 BM25 pre-ranking: kept {len(shortlist)}/{len(cv_profiles)} candidates for LLM scoring")
+    return shortlist, dropped
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _read_cv(path: Path) -> str:
+    if path.suffix.lower() == ".pdf":
+        return extract_pdf_text(path)
+    return path.read_text(encoding="utf-8")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="BM25 pre-ranking index over CV files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="Index CV files (PDF or text)")
+    add_parser.add_argument("index", help="Index file (created if missing)")
+    add_parser.add_argument("cvs", nargs="+", help="CV files; the file name is the candidate id")
+
+    query_parser = subparsers.add_parser("query", help="Rank indexed CVs against a job posting")
+    query_parser.add_argument("index", help="Index file")
+    query_parser.add_argument("posting", help="Job posting text file")
+    query_parser.add_argument("--top", type=int, default=20, help="Number of candidates to show (default: 20)")
+    query_parser.add_argument("--model", default=None, help="OpenRouter model for rubric extraction and scoring")
+    query_parser.add_argument("--score", action="store_true",
+                              help="LLM-score the top candidates (needs the CV files in --cv-dir)")
+    query_parser.add_argument("--cv-dir", default=".", help="Directory of the indexed CV files (with --score)")
+    args = parser.parse_args(argv)
+
+    index = CVIndex.load(args.index)
+
+    if args.command == "add":
+        changed = 0
+        for cv_path in map(Path, args.cvs):
+            try:
+                changed += index.add(cv_path.name, _read_cv(cv_path))
+            except Exception as e:
+                print(f"❌ {cv_path}: {e}")
+        print(f"✓ {changed} new or changed CVs")
+        index.save(args.index)
+        return 0
+
+    from test_matching_score import extract_rubric_with_llm, score_profiles_concurrently
+
+    rubric = extract_rubric_with_llm(Path(args.posting).read_text(encoding="utf-8"), model=args.model)
+    ranking = index.rank_for_rubric(rubric, top_n=args.top)
+    print("\n" + "=" * 100)
+    print(f"BM25 PRE-RANKING: top {len(ranking)} of {len(index)} CVs")
+    print("=" * 100)
+    for i, (doc_id, score) in enumerate(ranking, 1):
+        print(f"{i}. {doc_id}: {score}")
+
+    if args.score:
+        cv_profiles = [(doc_id, _read_cv(Path(args.cv_dir) / doc_id)) for doc_id, _ in ranking]
+        results, failures = score_profiles_concurrently(cv_profiles, rubric, model=args.model)
+        print("\n" + "=" * 100)
+        print("LLM SCORES")
+        print("=" * 100)
+        for i, (name, score, _) in enumerate(results, 1):
+            print(f"{i}. {name}: {score}/100")
+        for name, error in failures:
+            print(f"❌ {name}: {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
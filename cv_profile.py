@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Structured CV profile: extracted once per CV, reused for every job.
+
+Every scoring call sends the full raw CV text, although a candidate is
+typically matched against many jobs. This module runs a one-time profiling
+stage with the resume prompts from prompts.py:
+
+- EXP_INDUS_PROMPT: roles (title, company, dates, employment type, summary)
+  and industries
+- EDUCATION_AND_ADDRESS_PROMPT: education and address, extended with skills,
+  languages and a one-line profile summary
+
+(EXP_INDUS_PROMPT supersedes EXP_EDU_PROMPT for experience: it adds the
+employment type needed to exclude internships.) Both calls run concurrently
+and the profile is cached on disk by CV hash (cv_text_hash), so re-uploads
+and re-exports of the same CV reuse it.
+
+render_compact_profile turns the profile into a short text (date ranges,
+roles, education, skills, languages) that scoring sends instead of the full
+CV. The text keeps the section headings and "MM-YYYY - MM-YYYY" date ranges,
+so the local scorers (local_scorers.py) work on it too. Qualification notes
+still use the full CV.
+
+USAGE:
+------
+    profile = get_cv_profile(cv_text)               # cached by CV hash
+    compact_text = render_compact_profile(profile)
+    criteria_scores = score_criteria_with_profile(cv_text, rubric, model=model)
+
+    # Pipeline / batch
+    build_evaluation_pipeline(compact_profile=True)
+    python batch_evaluate.py manifest.jsonl --compact-profile
+"""
+
+import json
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable
+
+from cv_text import cv_text_hash
+from llm_packing import estimate_tokens
+from prompts import (
+    EXP_INDUS_PROMPT,
+    EDUCATION_AND_ADDRESS_PROMPT,
+    CV_PROFILE_EXPERIENCE_OUTPUT_PROMPT,
+    CV_PROFILE_EDUCATION_OUTPUT_PROMPT
+)
+from test_matching_score import (
+    EvaluationRubric,
+    CriterionScore,
+    call_openrouter,
+    parse_llm_json,
+    score_criteria_with_llm
+)
+
+PROFILE_CACHE_DIR = Path(__file__).parent / ".cv_profile_cache"
+PROFILE_CACHE_DIR.mkdir(exist_ok=True)
+
+# Bumped when the profile structure or prompts change (invalidates the cache)
+PROFILE_VERSION = 1
+
+# LangChain message types -> OpenRouter roles
+MESSAGE_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+# Per-CV-hash [lock, users]; an entry is dropped when its last user is done
+_profile_locks: Dict[str, list] = {}
+_profile_locks_guard = threading.Lock()
+
+
+# ============================================================================
+# EXTRACTION
+# ============================================================================
+
+def _prompt_messages(prompt, cv_text: str, output_prompt: str) -> List[Dict[str, str]]:
+    """OpenRouter messages from a resume ChatPromptTemplate, with the JSON output spec appended."""
+    messages = [
+        {"role": MESSAGE_ROLES.get(message.type, "user"), "content": message.content}
+        for message in prompt.format_messages(resume=cv_text)
+    ]
+    messages[-1]["content"] += "\n\n" + output_prompt
+    return messages
+
+
+def _extract_part(prompt, output_prompt: str, cv_text: str, generation_name: str, model: str) -> Dict[str, Any]:
+    response_text, llm_duration = call_openrouter(
+        messages=_prompt_messages(prompt, cv_text, output_prompt),
+        max_tokens=3000,
+        generation_name=generation_name,
+        model=model
+    )
+    print(f"✓ {generation_name}: {llm_duration:.2f}s")
+    data = parse_llm_json(response_text)
+    if not isinstance(data, dict):
+        raise ValueError(f"{generation_name}: expected a JSON object")
+    return data
+
+
+def extract_cv_profile(cv_text: str, model: str = None) -> Dict[str, Any]:
+    """
+    Extract the structured profile of a CV (two concurrent LLM calls).
+
+    Args:
+        cv_text: The candidate's CV text
+        model: Optional model name to use
+
+    Returns:
+        dict with experience, industries, education, address, skills,
+        languages and profile_summary
+    """
+    print("\n[LLM CALL via OpenRouter] CV Profiling...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        experience = executor.submit(
+            _extract_part, EXP_INDUS_PROMPT, CV_PROFILE_EXPERIENCE_OUTPUT_PROMPT, cv_text, "cv_profile_experience", model
+        )
+        education = executor.submit(
+            _extract_part, EDUCATION_AND_ADDRESS_PROMPT, CV_PROFILE_EDUCATION_OUTPUT_PROMPT, cv_text, "cv_profile_education", model
+        )
+        experience, education = experience.result(), education.result()
+
+    return {
+        "experience": experience.get("experience") or [],
+        "industries": experience.get("industries") or [],
+        "education": education.get("education") or [],
+        "address": education.get("address") or "",
+        "skills": education.get("skills") or [],
+        "languages": education.get("languages") or [],
+        "profile_summary": education.get("profile_summary") or ""
+    }
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+def _cache_file(cv_hash: str) -> Path:
+    return PROFILE_CACHE_DIR / f"profile_{cv_hash[:32]}.json"
+
+
+def load_cv_profile(cv_text: str) -> Dict[str, Any]:
+    """Cached profile of a CV, or None."""
+    cache_file = _cache_file(cv_text_hash(cv_text))
+    if not cache_file.exists():
+        return None
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    except Exception as e:
+        print(f"⚠ Profile cache load failed: {e}")
+        return None
+    if cached.get("version") != PROFILE_VERSION:
+        return None
+    return cached["profile"]
+
+
+def save_cv_profile(cv_text: str, profile: Dict[str, Any], model: str = None):
+    """Store a CV profile in the disk cache."""
+    cv_hash = cv_text_hash(cv_text)
+    try:
+        _cache_file(cv_hash).write_text(json.dumps({
+            "version": PROFILE_VERSION,
+            "cv_hash": cv_hash,
+            "model": model,
+            "profile": profile
+        }, ensure_ascii=False, indent=2), encoding="utf-8")
+    except Exception as e:
+        print(f"⚠ Profile cache save failed: {e}")
+
+
+def get_cv_profile(cv_text: str, model: str = None, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Structured profile of a CV, extracted at most once per CV hash.
+
+    Concurrent callers for the same CV (e.g. one candidate scored against
+    several jobs in a batch) wait for a single extraction.
+
+    Args:
+        cv_text: The candidate's CV text
+        model: Optional model name used for extraction
+        use_cache: Whether to read/write the on-disk profile cache
+
+    Returns:
+        Profile dict (see extract_cv_profile)
+    """
+    if not use_cache:
+        return extract_cv_profile(cv_text, model=model)
+
+    cv_hash = cv_text_hash(cv_text)
+    with _profile_locks_guard:
+        entry = _profile_locks.setdefault(cv_hash, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            profile = load_cv_profile(cv_text)
+            if profile is not None:
+                print(f"✓ Loaded CV profile from cache (key: {cv_hash[:16]})")
+                return profile
+            profile = extract_cv_profile(cv_text, model=model)
+            save_cv_profile(cv_text, profile, model=model)
+            return profile
+    finally:
+        with _profile_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _profile_locks[cv_hash]
+
+
+# ============================================================================
+# COMPACT TEXT
+# ============================================================================
+
+def _join(*parts: str, separator: str = ", ") -> str:
+    return separator.join(str(part).strip() for part in parts if part and str(part).strip())
+
+
+def render_compact_profile(profile: Dict[str, Any]) -> str:
+    """
+    Compact text of a structured profile, sent to the LLM instead of the CV.
+
+    Args:
+        profile: Profile dict (see extract_cv_profile)
+
+    Returns:
+        Plain text with PROFILE, WORK EXPERIENCE, EDUCATION, SKILLS and
+        LANGUAGES sections (empty sections are left out)
+    """
+    lines = ["CANDIDATE PROFILE (structured extract of the CV)"]
+    if profile.get("profile_summary"):
+        lines.append(profile["profile_summary"])
+    if profile.get("address"):
+        lines.append(f"Location: {profile['address']}")
+    if profile.get("industries"):
+        lines.append(f"Industries: {_join(*profile['industries'])}")
+
+    if profile.get("experience"):
+        lines.extend(["", "WORK EXPERIENCE"])
+        for role in profile["experience"]:
+            dates = _join(role.get("start_date"), role.get("end_date"), separator=" - ")
+            employment = f" ({role['employment_type']})" if role.get("employment_type") else ""
+            where = _join(role.get("company"), role.get("industry"), _join(role.get("city"), role.get("country")),
+                          separator=" | ")
+            lines.append(f"- {dates}: {role.get('title', '')}{employment}" + (f" | {where}" if where else ""))
+            if role.get("summary"):
+                lines.append(f"  {role['summary']}")
+
+    if profile.get("education"):
+        lines.extend(["", "EDUCATION"])
+        for entry in profile["education"]:
+            dates = _join(entry.get("start_date"), entry.get("end_date"), separator=" - ")
+            degree = _join(entry.get("degree"), entry.get("field_of_study"))
+            lines.append(f"- {dates}: {degree} | {_join(entry.get('school_name'), entry.get('country'))}")
+
+    if profile.get("skills"):
+        lines.extend(["", "SKILLS", _join(*profile["skills"])])
+
+    if profile.get("languages"):
+        lines.extend(["", "LANGUAGES"])
+        for entry in profile["languages"]:
+            if isinstance(entry, dict):
+                lines.append(f"- {entry.get('language', '')}" + (f": {entry['level']}" if entry.get("level") else ""))
+            else:
+                lines.append(f"- {entry}")
+
+    return "\n".join(lines)
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+def score_criteria_with_profile(
+    cv_profile: str,
+    rubric: EvaluationRubric,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None,
+    scorer: Callable[..., List[CriterionScore]] = score_criteria_with_llm,
+    use_cache: bool = True
+) -> List[CriterionScore]:
+    """
+    Score criteria on the compact structured profile instead of the full CV.
+
+    Drop-in replacement for score_criteria_with_llm (the profile is
+    extracted on first use and cached by CV hash).
+
+    Args:
+        cv_profile: The candidate's CV text
+        rubric: The evaluation rubric
+        model: Optional model name (used for profiling and scoring)
+        scorer: Criteria scorer applied to the compact text (e.g. score_criteria_hybrid)
+        use_cache: Whether to read/write the on-disk profile cache
+
+    Returns:
+        List of criterion scores
+    """
+    compact_text = render_compact_profile(get_cv_profile(cv_profile, model=model, use_cache=use_cache))
+    full_tokens, compact_tokens = estimate_tokens(cv_profile), estimate_tokens(compact_text)
+    print(f"🗜️ Compact profile: ~{compact_tokens} tokens instead of ~{full_tokens} for the full CV "
+          f"({100 * (full_tokens - compact_tokens) / max(full_tokens, 1):.0f}% fewer)")
+    return scorer(compact_text, rubric, langfuse_parent=langfuse_parent, session_id=session_id, model=model)
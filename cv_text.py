@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+CV text extraction shared by the Streamlit app, the evaluation pipeline and
+batch tools.
+
+Supports PyPDF2 and pdfplumber (whichever is installed, PyPDF2 preferred).
+Unlike the Streamlit wrapper, these functions raise on failure instead of
+rendering errors, so they can run in worker threads.
+
+Candidates apply to several roles and re-upload the same PDF, so batches
+contain duplicate CVs. cv_text_hash identifies a CV by its normalized text
+(Unicode NFKC, case and whitespace folded), so re-exported or re-uploaded
+copies of the same CV hash alike and are scored once per rubric.
+
+USAGE:
+------
+    cv_text = extract_pdf_text("alice.pdf")
+    cv_text_hash(cv_text)                          # SHA256 of the normalized text
+"""
+
+import io
+import hashlib
+import unicodedata
+from pathlib import Path
+from typing import Union, BinaryIO, List
+
+# PDF extraction - try both libraries
+PDF_LIBRARY = None
+try:
+    import PyPDF2
+    PDF_LIBRARY = "PyPDF2"
+except ImportError:
+    pass
+
+try:
+    import pdfplumber
+    if PDF_LIBRARY is None:
+        PDF_LIBRARY = "pdfplumber"
+except ImportError:
+    pass
+
+
+def extract_pdf_pages(pdf_file: Union[BinaryIO, bytes, str, Path]) -> List[str]:
+    """
+    Extract the text of each PDF page (pages without text are left out).
+
+    Page boundaries let CV compaction recognize repeated headers and footers.
+
+    Args:
+        pdf_file: File-like object, raw PDF bytes, or path to a PDF file
+
+    Returns:
+        List of page texts
+
+    Raises:
+        ImportError: If neither PyPDF2 nor pdfplumber is installed
+    """
+    if PDF_LIBRARY is None:
+        raise ImportError("Please install a PDF library: `pip install PyPDF2` or `pip install pdfplumber`")
+
+    if isinstance(pdf_file, (str, Path)):
+        pdf_bytes = Path(pdf_file).read_bytes()
+    elif isinstance(pdf_file, bytes):
+        pdf_bytes = pdf_file
+    else:
+        # Reset file pointer to beginning
+        pdf_file.seek(0)
+        pdf_bytes = pdf_file.read()
+
+    pages = []
+    if PDF_LIBRARY == "PyPDF2":
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                pages.append(page_text)
+    else:  # pdfplumber
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    pages.append(page_text)
+    return pages
+
+
+def extract_pdf_text(pdf_file: Union[BinaryIO, bytes, str, Path]) -> str:
+    """
+    Extract text from a PDF.
+
+    Args:
+        pdf_file: File-like object, raw PDF bytes, or path to a PDF file
+
+    Returns:
+        Extracted text (pages joined by newlines)
+
+    Raises:
+        ImportError: If neither PyPDF2 nor pdfplumber is installed
+    """
+    return "\n".join(extract_pdf_pages(pdf_file)).strip()
+
+
+# ============================================================================
+# DEDUPLICATION
+# ============================================================================
+
+def normalize_cv_text(text: str) -> str:
+    """
+    Canonical form of a CV text for duplicate detection (not for scoring).
+
+    Applies NFKC (ligatures, full-width characters), case folding, and
+    collapses whitespace within lines; blank lines are dropped.
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def cv_text_hash(text: str) -> str:
+    """SHA256 of the normalized CV text."""
+    return hashlib.sha256(normalize_cv_text(text).encode("utf-8")).hexdigest()
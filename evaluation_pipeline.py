@@ -0,0 +1,659 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware executor for the candidate evaluation pipeline.
+
+Each step declares the values it reads and the values it produces:
+
+    cv_text              ← cv_pdf                          (PDF extraction)
+    compact_cv           ← cv_text, model, use_cache       (CV profiling, optional)
+    rubric               ← job_posting                     (rubric extraction)
+    criteria_scores      ← rubric, cv_text                 (criteria scoring)
+    result               ← rubric, criteria_scores         (score calculation)
+    gate, applied_gate   ← rubric, criteria_scores, gating_policy (required gate)
+    qualification_note   ← criteria_scores, applied_gate, ... (qualification note)
+    qualification_summary← qualification_note, result      (summary)
+
+The executor runs every step as soon as its inputs are available, so
+independent work (e.g. PDF extraction and rubric extraction) runs
+concurrently. Step outputs are memoized by a hash of the step's inputs: after
+changing only the language, re-running executes only the note and summary
+steps.
+
+USAGE:
+------
+    cache = StepCache()
+    pipeline = build_evaluation_pipeline(cache=cache)
+    run = pipeline.run({
+        "job_posting": job_posting, "cv_text": cv_text,
+        "language": "French", "model": None, "gating_policy": GatingPolicy(), ...
+    })
+    run.outputs["result"]["final_score"]
+    run.step_times        # {"rubric_extraction": 3.1, ...}
+    run.cached_steps      # steps served from the memo cache
+
+    # Warm the cache while the user is still filling in the form
+    SpeculativeStepRunner("rubric_extraction").schedule(pipeline, context)
+"""
+
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, asdict, is_dataclass
+from typing import List, Optional, Dict, Any, Callable
+
+from cv_text import extract_pdf_text
+from qualification_note import render_gated_note
+from local_scorers import score_criteria_hybrid
+from cv_profile import get_cv_profile, render_compact_profile
+from test_matching_score import (
+    extract_rubric_with_llm,
+    score_criteria_with_llm,
+    calculate_matching_score,
+    evaluate_required_gate,
+    generate_qualification_note,
+    generate_qualification_summary,
+    summarize_qualification,
+    evaluate_candidate_fused,
+    build_rubric_text
+)
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+@dataclass
+class PipelineStep:
+    """A unit of work with declared inputs and outputs."""
+    name: str
+    func: Callable[..., Any]
+    inputs: List[str]
+    outputs: List[str]
+    # Passed to func but not part of the memo key (e.g. session_id)
+    untracked_inputs: List[str] = field(default_factory=list)
+    memoize: bool = True
+    # Per-run predicate on the run's values; when it returns False the step is
+    # recomputed (and its memo entry refreshed) instead of served from the memo
+    use_memo: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+
+@dataclass
+class PipelineRun:
+    """Outputs and timings of one pipeline execution."""
+    outputs: Dict[str, Any]
+    step_times: Dict[str, float]
+    cached_steps: List[str]
+    skipped_steps: List[str]
+    total_time: float
+
+
+def _fingerprint(value: Any) -> Any:
+    """Convert a value to a JSON-serializable form for hashing."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {"__dataclass__": type(value).__name__, **asdict(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def hash_inputs(step_name: str, inputs: Dict[str, Any]) -> str:
+    """Memo key for a step: SHA256 of the step name and its input values."""
+    payload = json.dumps({"step": step_name, "inputs": _fingerprint(inputs)}, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _InFlight:
+    """A step computation other threads can wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.outputs = None
+        self.error = None
+
+
+class StepCache:
+    """
+    Thread-safe in-memory LRU cache of step outputs keyed by input hash.
+
+    Concurrent requests for the same key are single-flighted: the first caller
+    computes, the others wait for its result (e.g. an evaluation started while
+    the speculative rubric extraction for the same posting is still running).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, outputs: tuple):
+        with self._lock:
+            self._entries[key] = outputs
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def status(self, key: str) -> str:
+        """Return "ready", "running" or "missing" for a memo key."""
+        with self._lock:
+            if key in self._entries:
+                return "ready"
+            return "running" if key in self._inflight else "missing"
+
+    def get_or_compute(self, key: str, compute: Callable[[], tuple]) -> tuple:
+        """
+        Return (outputs, cached) for a key, computing it at most once.
+
+        Args:
+            key: Memo key (see hash_inputs)
+            compute: Callable returning the outputs tuple
+
+        Returns:
+            Tuple of (outputs, cached) where cached is False only for the
+            caller that actually ran compute
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key], True
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = _InFlight()
+
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.outputs, True
+
+        try:
+            pending.outputs = compute()
+            self.put(key, pending.outputs)
+            return pending.outputs, False
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.event.set()
+
+
+class Pipeline:
+    """
+    Runs steps in dependency order, concurrently where possible.
+
+    A step is skipped when all of its outputs are already present in the
+    initial context (e.g. cv_text provided directly instead of cv_pdf).
+    """
+
+    def __init__(self, steps: List[PipelineStep], cache: StepCache = None, max_workers: int = 4):
+        self.steps = steps
+        self.cache = cache if cache is not None else StepCache()
+        self.max_workers = max_workers
+
+        producers = {}
+        for step in steps:
+            for output in step.outputs:
+                if output in producers:
+                    raise ValueError(f"Output '{output}' is produced by both '{producers[output]}' and '{step.name}'")
+                producers[output] = step.name
+        self.producers = producers
+
+    def _get_step(self, step_name: str) -> PipelineStep:
+        for step in self.steps:
+            if step.name == step_name:
+                return step
+        raise ValueError(f"Unknown step '{step_name}'")
+
+    def step_key(self, step_name: str, context: Dict[str, Any]) -> str:
+        """Memo key the step would use for the given context."""
+        step = self._get_step(step_name)
+        return hash_inputs(step.name, {name: context.get(name) for name in step.inputs})
+
+    def _execute(self, step: PipelineStep, values: Dict[str, Any]) -> tuple:
+        """Run one step (worker thread); returns (outputs, duration, cached)."""
+        start = time.time()
+        tracked = {name: values[name] for name in step.inputs}
+
+        def compute() -> tuple:
+            kwargs = dict(tracked)
+            kwargs.update({name: values.get(name) for name in step.untracked_inputs})
+            result = step.func(**kwargs)
+            outputs = result if len(step.outputs) > 1 else (result,)
+            if len(outputs) != len(step.outputs):
+                raise ValueError(f"Step '{step.name}' returned {len(outputs)} values, expected {len(step.outputs)}")
+            return tuple(outputs)
+
+        if not step.memoize:
+            return compute(), time.time() - start, False
+        key = hash_inputs(step.name, tracked)
+        if step.use_memo is not None and not step.use_memo(values):
+            outputs = compute()
+            self.cache.put(key, outputs)
+            return outputs, time.time() - start, False
+        outputs, cached = self.cache.get_or_compute(key, compute)
+        return outputs, time.time() - start, cached
+
+    def run_step(self, step_name: str, context: Dict[str, Any]) -> tuple:
+        """
+        Run a single step synchronously (memoized), e.g. to warm the cache.
+
+        Args:
+            step_name: Name of the step
+            context: Values for the step's inputs
+
+        Returns:
+            Tuple of the step's outputs
+        """
+        step = self._get_step(step_name)
+        missing = [name for name in step.inputs if name not in context]
+        if missing:
+            raise ValueError(f"Step '{step_name}' needs {missing}")
+        outputs, duration, cached = self._execute(step, context)
+        print(f"⏱️  Step '{step_name}' {'(cached) ' if cached else ''}took {duration:.2f}s")
+        return outputs
+
+    def _steps_for(self, targets: List[str], values: Dict[str, Any]) -> set:
+        """Names of the steps needed to produce targets from values."""
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in values:
+                continue
+            if name not in self.producers:
+                raise ValueError(f"Target '{name}' is neither provided nor produced")
+            step = self._get_step(self.producers[name])
+            if step.name not in needed:
+                needed.add(step.name)
+                stack.extend(step.inputs)
+        return needed
+
+    def run(
+        self,
+        context: Dict[str, Any],
+        on_step_complete: Callable[[str, float, bool], None] = None,
+        targets: List[str] = None
+    ) -> PipelineRun:
+        """
+        Execute the pipeline.
+
+        Args:
+            context: Initial values (job_posting, cv_text or cv_pdf, language, ...)
+            on_step_complete: Optional callback(step_name, duration, cached),
+                invoked from the calling thread as each step finishes
+            targets: Optional output names; only the steps needed to produce
+                them are run (e.g. ["result"] to stop after scoring)
+
+        Returns:
+            PipelineRun with all values, per-step timings and cache hits
+        """
+        total_start = time.time()
+        values = dict(context)
+        needed = self._steps_for(targets, values) if targets is not None else None
+        pending = []
+        skipped = []
+        for step in self.steps:
+            if all(output in values for output in step.outputs):
+                skipped.append(step.name)
+            elif needed is None or step.name in needed:
+                pending.append(step)
+
+        # Validate that every input is either provided or produced
+        for step in pending:
+            for name in step.inputs:
+                if name not in values and name not in self.producers:
+                    raise ValueError(f"Step '{step.name}' needs '{name}', which is neither provided nor produced")
+
+        step_times = {}
+        cached_steps = []
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                ready = [step for step in pending if all(name in values for name in step.inputs)]
+                for step in ready:
+                    pending.remove(step)
+                    running[executor.submit(self._execute, step, dict(values))] = step
+
+                if not running:
+                    missing = {name for step in pending for name in step.inputs if name not in values}
+                    raise ValueError(f"Pipeline is stuck: missing inputs {sorted(missing)}")
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        outputs, duration, cached = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    values.update(zip(step.outputs, outputs))
+                    step_times[step.name] = duration
+                    if cached:
+                        cached_steps.append(step.name)
+                    print(f"⏱️  Step '{step.name}' {'(cached) ' if cached else ''}took {duration:.2f}s")
+                    if on_step_complete:
+                        on_step_complete(step.name, duration, cached)
+
+        return PipelineRun(
+            outputs=values,
+            step_times=step_times,
+            cached_steps=cached_steps,
+            skipped_steps=skipped,
+            total_time=time.time() - total_start
+        )
+
+
+# ============================================================================
+# SPECULATIVE EXECUTION
+# ============================================================================
+
+class SpeculativeStepRunner:
+    """
+    Debounced background execution of one pipeline step.
+
+    Used to start rubric extraction as soon as the job posting settles, so the
+    rubric is already in the step cache (or in flight) when the evaluation
+    starts. Each new schedule() call with different inputs cancels a run that
+    has not started yet.
+    """
+
+    def __init__(self, step_name: str = "rubric_extraction", delay: float = 1.0):
+        self.step_name = step_name
+        self.delay = delay
+        self._timer: Optional[threading.Timer] = None
+        self._key: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def schedule(self, pipeline: Pipeline, context: Dict[str, Any]) -> str:
+        """
+        Schedule the step for the given context after the debounce delay.
+
+        Args:
+            pipeline: Pipeline whose cache should be warmed
+            context: Values for the step's inputs
+
+        Returns:
+            "ready", "running", "scheduled" or "missing" for these inputs
+            (a step whose memo is bypassed for this context is not scheduled)
+        """
+        step = pipeline._get_step(self.step_name)
+        if step.use_memo is not None and not step.use_memo(context):
+            return "missing"
+        key = pipeline.step_key(self.step_name, context)
+        with self._lock:
+            status = pipeline.cache.status(key)
+            if status != "missing":
+                return status
+            if key == self._key and self._timer is not None and self._timer.is_alive():
+                return "scheduled"
+            if self._timer is not None:
+                self._timer.cancel()
+            self._key = key
+            self._timer = threading.Timer(self.delay, self._run, args=(pipeline, dict(context)))
+            self._timer.daemon = True
+            self._timer.start()
+            return "scheduled"
+
+    def _run(self, pipeline: Pipeline, context: Dict[str, Any]):
+        print(f"⚡ Speculative '{self.step_name}' started")
+        try:
+            pipeline.run_step(self.step_name, context)
+        except Exception as e:
+            print(f"⚠ Speculative '{self.step_name}' failed: {e}")
+
+
+# ============================================================================
+# EVALUATION GRAPH
+# ============================================================================
+
+def _format_criteria_scores(criteria_scores) -> str:
+    """Format criteria scores for the qualification note prompt."""
+    return "\n".join([
+        f"- {cs.criteria_name}: {cs.score}/100 - Evidence: {cs.evidence or 'N/A'}"
+        for cs in criteria_scores
+    ])
+
+
+def _cache_enabled(values: Dict[str, Any]) -> bool:
+    """Memo predicate of the LLM steps: use_cache=False ("Use Cache" unchecked) forces fresh calls."""
+    return values.get("use_cache", True) is not False
+
+
+def _split_gate(gate: Dict[str, Any]) -> tuple:
+    """
+    Gate decision for display, and the decision the note steps depend on.
+
+    The note steps only see the gate when it applies, so changing the policy
+    does not invalidate memoized notes of candidates it does not gate.
+    """
+    return gate, (gate if gate["gated"] else None)
+
+
+def _qualification_note_step(job_posting, cv_text, rubric, criteria_scores, applied_gate,
+                             language, model, session_id, langfuse_parent) -> str:
+    """Qualification note, skipped or downgraded by the required-criteria gate."""
+    gate = applied_gate or {"action": "none"}
+    if gate["action"] == "skip":
+        print("🚧 Gated: rendering the qualification note locally")
+        return render_gated_note(gate["failed_criteria"], gate["threshold"], language)
+    downgrade = gate["action"] == "downgrade"
+    return generate_qualification_note(
+        job_posting, cv_text,
+        rubric_text=build_rubric_text(rubric),
+        criteria_scores_text=_format_criteria_scores(criteria_scores),
+        language=language,
+        langfuse_parent=langfuse_parent,
+        session_id=session_id,
+        model=gate["model"] if downgrade else model,
+        brief=downgrade,
+        max_tokens=gate["max_tokens"] if downgrade else 3000
+    )
+
+
+def _qualification_summary_step(qualification_note, result, applied_gate, language, model,
+                                session_id, langfuse_parent) -> str:
+    """LLM summary, rendered locally instead for gated candidates."""
+    if applied_gate:
+        return summarize_qualification(
+            qualification_note,
+            result=result,
+            language=language,
+            llm_fallback=True,
+            langfuse_parent=langfuse_parent,
+            session_id=session_id,
+            model=applied_gate["model"] or model
+        )
+    return generate_qualification_summary(
+        qualification_note,
+        language=language,
+        langfuse_parent=langfuse_parent,
+        session_id=session_id,
+        model=model
+    )
+
+
+def build_evaluation_pipeline(
+    fused: bool = False,
+    local_summary: bool = True,
+    cache: StepCache = None,
+    max_workers: int = 4,
+    local_criteria: bool = False,
+    compact_profile: bool = False
+) -> Pipeline:
+    """
+    Build the candidate evaluation pipeline.
+
+    Context keys: job_posting, cv_text or cv_pdf, language, model, use_cache,
+    prompt_version, prompt_label, gating_policy (GatingPolicy or None), and
+    (untracked) session_id, langfuse_parent.
+
+    When a required criterion scores below the gating threshold, the note is
+    rendered locally ("skip") or written briefly by a cheaper model
+    ("downgrade"), and the summary is rendered locally. The fused pipeline
+    scores and writes the note in one call, so it is not gated.
+
+    Args:
+        fused: Produce scores, note and summary with one LLM call
+        local_summary: Render the summary locally (LLM only as fallback)
+        cache: Shared step cache (reuse it across runs to memoize steps)
+        max_workers: Maximum number of steps running concurrently
+        local_criteria: Score experience-years and language criteria locally
+            (see local_scorers.py); only the other criteria go to the LLM
+        compact_profile: Score on the compact structured CV profile (extracted
+            once per CV and cached, see cv_profile.py) instead of the full CV;
+            the qualification note still uses the full CV
+
+    Returns:
+        Pipeline producing rubric, criteria_scores, result, gate (non-fused),
+        qualification_note and qualification_summary
+    """
+    observability = ["session_id", "langfuse_parent"]
+
+    steps = [
+        PipelineStep(
+            name="pdf_extraction",
+            func=lambda cv_pdf: extract_pdf_text(cv_pdf),
+            inputs=["cv_pdf"],
+            outputs=["cv_text"]
+        ),
+        PipelineStep(
+            name="rubric_extraction",
+            func=lambda job_posting, model, use_cache, prompt_version, prompt_label, session_id, langfuse_parent:
+                extract_rubric_with_llm(
+                    job_posting,
+                    use_cache=use_cache,
+                    prompt_version=prompt_version,
+                    prompt_label=prompt_label,
+                    langfuse_parent=langfuse_parent,
+                    session_id=session_id,
+                    model=model
+                ),
+            inputs=["job_posting", "model", "use_cache", "prompt_version", "prompt_label"],
+            outputs=["rubric"],
+            untracked_inputs=observability,
+            use_memo=_cache_enabled
+        ),
+        PipelineStep(
+            name="score_calculation",
+            func=lambda rubric, criteria_scores: calculate_matching_score(rubric, criteria_scores),
+            inputs=["rubric", "criteria_scores"],
+            outputs=["result"]
+        )
+    ]
+
+    if fused:
+        steps.append(PipelineStep(
+            name="fused_evaluation",
+            func=lambda job_posting, cv_text, rubric, language, model, session_id, langfuse_parent:
+                evaluate_candidate_fused(
+                    job_posting, cv_text, rubric,
+                    language=language,
+                    langfuse_parent=langfuse_parent,
+                    session_id=session_id,
+                    model=model
+                ),
+            inputs=["job_posting", "cv_text", "rubric", "language", "model"],
+            outputs=["criteria_scores", "qualification_note", "qualification_summary"],
+            untracked_inputs=observability,
+            use_memo=_cache_enabled
+        ))
+        return Pipeline(steps, cache=cache, max_workers=max_workers)
+
+    score_criteria = score_criteria_hybrid if local_criteria else score_criteria_with_llm
+    scoring_text = "cv_text"
+    if compact_profile:
+        steps.append(PipelineStep(
+            name="cv_profiling",
+            func=lambda cv_text, model, use_cache:
+                render_compact_profile(get_cv_profile(cv_text, model=model, use_cache=use_cache)),
+            inputs=["cv_text", "model", "use_cache"],
+            outputs=["compact_cv"],
+            use_memo=_cache_enabled
+        ))
+        scoring_text = "compact_cv"
+    steps.append(PipelineStep(
+        name="hybrid_criteria_scoring" if local_criteria else "criteria_scoring",
+        func=lambda rubric, model, session_id, langfuse_parent, **text:
+            score_criteria(
+                text[scoring_text], rubric,
+                langfuse_parent=langfuse_parent,
+                session_id=session_id,
+                model=model
+            ),
+        inputs=[scoring_text, "rubric", "model"],
+        outputs=["criteria_scores"],
+        untracked_inputs=observability,
+        use_memo=_cache_enabled
+    ))
+    steps.append(PipelineStep(
+        name="required_gate",
+        func=lambda rubric, criteria_scores, gating_policy:
+            _split_gate(evaluate_required_gate(rubric, criteria_scores, gating_policy)),
+        inputs=["rubric", "criteria_scores", "gating_policy"],
+        outputs=["gate", "applied_gate"],
+        memoize=False
+    ))
+    steps.append(PipelineStep(
+        name="qualification_note",
+        func=_qualification_note_step,
+        inputs=["job_posting", "cv_text", "rubric", "criteria_scores", "applied_gate", "language", "model"],
+        outputs=["qualification_note"],
+        untracked_inputs=observability,
+        use_memo=_cache_enabled
+    ))
+    if local_summary:
+        steps.append(PipelineStep(
+            name="local_summary",
+            func=lambda qualification_note, result, applied_gate, language, model, session_id, langfuse_parent:
+                summarize_qualification(
+                    qualification_note,
+                    result=result,
+                    language=language,
+                    llm_fallback=True,
+                    langfuse_parent=langfuse_parent,
+                    session_id=session_id,
+                    model=(applied_gate or {}).get("model") or model
+                ),
+            inputs=["qualification_note", "result", "applied_gate", "language", "model"],
+            outputs=["qualification_summary"],
+            untracked_inputs=observability,
+            use_memo=_cache_enabled
+        ))
+    else:
+        steps.append(PipelineStep(
+            name="qualification_summary",
+            func=_qualification_summary_step,
+            inputs=["qualification_note", "result", "applied_gate", "language", "model"],
+            outputs=["qualification_summary"],
+            untracked_inputs=observability,
+            use_memo=_cache_enabled
+        ))
+    return Pipeline(steps, cache=cache, max_workers=max_workers)
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Durable SQLite-backed work queue for candidate evaluations.
+
+Evaluation requests are enqueued into a local SQLite database and N worker
+processes pull them, run extract_rubric_with_llm -> score_criteria_with_llm ->
+calculate_matching_score and write the results back.
+
+HOW IT WORKS:
+-------------
+- A worker claims a job by setting a lease (visibility timeout). If the worker
+  crashes, the lease expires and the job becomes visible to other workers.
+- A failed job is retried until max_attempts, then marked "failed". Invalid
+  manifest lines are reported and not enqueued; an invalid payload already
+  in the queue fails without retries.
+- Results are only accepted from the worker holding the current lease.
+- stats() reports per-queue counts, average duration and throughput.
+
+USAGE:
+------
+    python job_queue.py enqueue manifest.jsonl          # same format as batch_evaluate.py
+    python job_queue.py work --workers 4                # run 4 worker processes
+    python job_queue.py stats
+    python job_queue.py results > results.jsonl
+
+    queue = JobQueue("evaluations.db")
+    job_id = queue.enqueue({"job_id": "j1", "posting": "...", "candidate_id": "c1", "cv_text": "..."})
+    queue.get(job_id)["status"]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import argparse
+import multiprocessing
+from typing import Dict, Any, Optional, Iterable, List
+
+DEFAULT_DB_PATH = "evaluations.db"
+DEFAULT_QUEUE = "default"
+DEFAULT_VISIBILITY_TIMEOUT = 300.0  # seconds a claimed job stays invisible
+DEFAULT_MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker TEXT,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    lease_until REAL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (queue, status, lease_until);
+"""
+
+
+class InvalidPayload(ValueError):
+    """Payload that cannot be evaluated (not retried)."""
+
+
+class JobQueue:
+    """SQLite-backed queue; each process should open its own JobQueue."""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, queue: str = DEFAULT_QUEUE):
+        self.db_path = db_path
+        self.queue = queue
+        self.conn = sqlite3.connect(db_path, timeout=30.0, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def enqueue(self, payload: Dict[str, Any], max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Add one evaluation request; returns its job id."""
+        return self.enqueue_many([payload], max_attempts=max_attempts)[0]
+
+    def enqueue_many(self, payloads: Iterable[Dict[str, Any]], max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> List[int]:
+        """Add evaluation requests in one transaction; returns their job ids."""
+        now = time.time()
+        ids = []
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for payload in payloads:
+                cursor = self.conn.execute(
+                    "INSERT INTO jobs (queue, payload, max_attempts, enqueued_at) VALUES (?, ?, ?, ?)",
+                    (self.queue, json.dumps(payload, ensure_ascii=False), max_attempts, now)
+                )
+                ids.append(cursor.lastrowid)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return ids
+
+    def claim(self, worker: str, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """
+        Claim the oldest visible job (pending, or running with an expired lease).
+
+        Expired leases of jobs that already used max_attempts (e.g. a job that
+        keeps killing its worker) are marked "failed" instead of being retried.
+
+        Args:
+            worker: Worker identifier (lease owner)
+            visibility_timeout: Seconds before an unfinished claim becomes visible again
+
+        Returns:
+            dict with id, payload and attempts, or None if the queue is empty
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                """
+                UPDATE jobs SET status = 'failed', finished_at = ?, lease_until = NULL,
+                                error = 'lease expired'
+                WHERE queue = ? AND status = 'running' AND lease_until < ? AND attempts >= max_attempts
+                """,
+                (now, self.queue, now)
+            )
+            row = self.conn.execute(
+                """
+                SELECT id, payload, attempts FROM jobs
+                WHERE queue = ? AND (status = 'pending' OR (status = 'running' AND lease_until < ?))
+                ORDER BY id LIMIT 1
+                """,
+                (self.queue, now)
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                """
+                UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1,
+                                started_at = ?, lease_until = ?
+                WHERE id = ?
+                """,
+                (worker, now, now + visibility_timeout, row["id"])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return {"id": row["id"], "payload": json.loads(row["payload"]), "attempts": row["attempts"] + 1}
+
+    def complete(self, job_id: int, worker: str, result: Dict[str, Any]) -> bool:
+        """Store a result; returns False if the worker no longer holds the lease."""
+        cursor = self.conn.execute(
+            """
+            UPDATE jobs SET status = 'done', finished_at = ?, result = ?, error = NULL
+            WHERE id = ? AND worker = ? AND status = 'running'
+            """,
+            (time.time(), json.dumps(result, ensure_ascii=False), job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str, retry: bool = True) -> bool:
+        """
+        Record a failure; the job is retried until max_attempts is reached.
+
+        Args:
+            retry: False for errors a retry cannot fix (e.g. an invalid
+                manifest record): the job is marked "failed" at once
+        """
+        cursor = self.conn.execute(
+            """
+            UPDATE jobs SET status = CASE WHEN ? AND attempts < max_attempts THEN 'pending' ELSE 'failed' END,
+                            finished_at = ?, error = ?, lease_until = NULL
+            WHERE id = ? AND worker = ? AND status = 'running'
+            """,
+            (retry, time.time(), error, job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def results(self) -> Iterable[Dict[str, Any]]:
+        """Iterate over finished (done or failed) jobs of this queue."""
+        for row in self.conn.execute(
+            "SELECT id, payload, status, attempts, result, error FROM jobs "
+            "WHERE queue = ? AND status IN ('done', 'failed') ORDER BY id",
+            (self.queue,)
+        ):
+            payload = json.loads(row["payload"])
+            yield {
+                "id": row["id"],
+                "job_id": payload.get("job_id"),
+                "candidate_id": payload.get("candidate_id"),
+                "status": row["status"],
+                "attempts": row["attempts"],
+                "result": json.loads(row["result"]) if row["result"] else None,
+                "error": row["error"]
+            }
+
+    def stats(self, window: float = 300.0) -> Dict[str, Any]:
+        """
+        Per-queue statistics.
+
+        Args:
+            window: Seconds over which throughput is measured
+
+        Returns:
+            dict with counts per status, avg_duration (s), throughput
+            (jobs/min over the window) and oldest_pending_age (s)
+        """
+        now = time.time()
+        counts = {status: 0 for status in ("pending", "running", "done", "failed")}
+        for row in self.conn.execute(
+            "SELECT status, COUNT(*) AS n FROM jobs WHERE queue = ? GROUP BY status", (self.queue,)
+        ):
+            counts[row["status"]] = row["n"]
+        row = self.conn.execute(
+            """
+            SELECT AVG(finished_at - started_at) AS avg_duration,
+                   SUM(CASE WHEN finished_at >= ? THEN 1 ELSE 0 END) AS recent
+            FROM jobs WHERE queue = ? AND status = 'done'
+            """,
+            (now - window, self.queue)
+        ).fetchone()
+        oldest = self.conn.execute(
+            "SELECT MIN(enqueued_at) AS t FROM jobs WHERE queue = ? AND status = 'pending'", (self.queue,)
+        ).fetchone()["t"]
+        return {
+            "queue": self.queue,
+            **counts,
+            "avg_duration": round(row["avg_duration"], 2) if row["avg_duration"] is not None else None,
+            "throughput_per_min": round((row["recent"] or 0) * 60.0 / window, 2),
+            "oldest_pending_age": round(now - oldest, 1) if oldest is not None else None
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def evaluate_payload(payload: Dict[str, Any], rubric_cache) -> Dict[str, Any]:
+    """Run rubric extraction -> criteria scoring -> score calculation for one job."""
+    from batch_evaluate import load_posting, load_cv, get_rubric
+    from test_matching_score import score_criteria_with_llm, calculate_matching_score
+
+    if payload.get("error"):
+        raise InvalidPayload(payload["error"])
+    model = payload.get("model")
+    rubric = get_rubric(
+        load_posting(payload),
+        rubric_cache,
+        model=model,
+        use_cache=payload.get("use_cache", True),
+        prompt_version=payload.get("prompt_version")
+    )
+    criteria_scores = score_criteria_with_llm(load_cv(payload), rubric, model=model)
+    result = calculate_matching_score(rubric, criteria_scores)
+    return {"final_score": result["final_score"], "breakdown": result["breakdown"]}
+
+
+def worker_loop(
+    db_path: str = DEFAULT_DB_PATH,
+    queue: str = DEFAULT_QUEUE,
+    visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    poll_interval: float = 1.0,
+    exit_when_empty: bool = False,
+    max_jobs: int = None
+) -> int:
+    """
+    Pull and process jobs until stopped (or the queue is empty).
+
+    Args:
+        db_path: SQLite database path
+        queue: Queue name
+        visibility_timeout: Lease duration for claimed jobs
+        poll_interval: Seconds to sleep when the queue is empty
+        exit_when_empty: Return instead of polling when no job is visible
+        max_jobs: Optional number of jobs after which the worker exits
+
+    Returns:
+        Number of jobs processed
+    """
+    from evaluation_pipeline import StepCache
+
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    job_queue = JobQueue(db_path, queue)
+    rubric_cache = StepCache(max_entries=64)
+    processed = 0
+    try:
+        while max_jobs is None or processed < max_jobs:
+            job = job_queue.claim(worker, visibility_timeout)
+            if job is None:
+                if exit_when_empty:
+                    break
+                time.sleep(poll_interval)
+                continue
+            try:
+                result = evaluate_payload(job["payload"], rubric_cache)
+            except Exception as e:
+                print(f"⚠ [{worker}] Job {job['id']} failed (attempt {job['attempts']}): {e}")
+                job_queue.fail(job["id"], worker, str(e), retry=not isinstance(e, InvalidPayload))
+            else:
+                if not job_queue.complete(job["id"], worker, result):
+                    print(f"⚠ [{worker}] Lease lost for job {job['id']}, result discarded")
+                else:
+                    print(f"✓ [{worker}] Job {job['id']}: {result['final_score']}/100")
+            processed += 1
+    finally:
+        job_queue.close()
+    return processed
+
+
+def run_workers(num_workers: int = 4, **worker_kwargs) -> None:
+    """Start num_workers worker processes and wait for them."""
+    processes = [
+        multiprocessing.Process(target=worker_loop, kwargs=worker_kwargs, daemon=True)
+        for _ in range(num_workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # Claimed jobs become visible again once their lease expires
+        for process in processes:
+            process.terminate()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Durable SQLite work queue for candidate evaluations.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"SQLite database (default: {DEFAULT_DB_PATH})")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE, help=f"Queue name (default: {DEFAULT_QUEUE})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Enqueue the records of a JSONL/CSV manifest")
+    enqueue_parser.add_argument("manifest", help="Manifest file (see batch_evaluate.py), or - for JSONL on stdin")
+    enqueue_parser.add_argument("--model", default=None, help="OpenRouter model for these jobs")
+    enqueue_parser.add_argument("--prompt-version", type=int, default=None, help="Langfuse prompt version")
+    enqueue_parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+
+    work_parser = subparsers.add_parser("work", help="Run worker processes")
+    work_parser.add_argument("-w", "--workers", type=int, default=4, help="Number of worker processes (default: 4)")
+    work_parser.add_argument("--visibility-timeout", type=float, default=DEFAULT_VISIBILITY_TIMEOUT)
+    work_parser.add_argument("--exit-when-empty", action="store_true", help="Stop workers once the queue is drained")
+
+    subparsers.add_parser("stats", help="Print queue statistics")
+    subparsers.add_parser("results", help="Print finished jobs as JSONL")
+    args = parser.parse_args(argv)
+
+    if args.command == "enqueue":
+        from batch_evaluate import read_manifest
+
+        invalid = []
+
+        def payloads():
+            for record in read_manifest(args.manifest):
+                if record.get("error"):
+                    invalid.append(record)
+                    continue
+                if args.model:
+                    record["model"] = args.model
+                if args.prompt_version is not None:
+                    record["prompt_version"] = args.prompt_version
+                yield record
+
+        job_queue = JobQueue(args.db, args.queue)
+        ids = job_queue.enqueue_many(payloads(), max_attempts=args.max_attempts)
+        job_queue.close()
+        print(f"✅ Enqueued {len(ids)} job(s) in '{args.queue}'")
+        for record in invalid:
+            print(f"⚠ Line {record['line']} skipped: {record['error']}", file=sys.stderr)
+    elif args.command == "work":
+        run_workers(
+            args.workers,
+            db_path=args.db,
+            queue=args.queue,
+            visibility_timeout=args.visibility_timeout,
+            exit_when_empty=args.exit_when_empty
+        )
+    elif args.command == "stats":
+        job_queue = JobQueue(args.db, args.queue)
+        print(json.dumps(job_queue.stats(), indent=2))
+        job_queue.close()
+    elif args.command == "results":
+        job_queue = JobQueue(args.db, args.queue)
+        for result in job_queue.results():
+            print(json.dumps(result, ensure_ascii=False))
+        job_queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Streaming top-k leaderboard for batch ranking.
+
+Batch scoring used to keep every candidate's full result and sort at the end.
+A Leaderboard is updated as each calculate_matching_score result arrives: a
+min-heap keeps the k best results (with their breakdowns) and a fixed-bin
+histogram, count, mean, min and max summarize everyone else, so memory is
+O(k + bins) whatever the batch size and the current top-k can be shown while
+the batch is still running.
+
+Updates are thread-safe (results arrive from scoring worker threads). Ties
+keep arrival order: an equal score never displaces an earlier candidate.
+
+USAGE:
+------
+    board = Leaderboard(top_k=10)
+    results, failures = score_profiles_concurrently(cv_profiles, rubric, on_result=board.add, keep_results=False)
+    board.top()                    # [(name, score, result)] best first
+    print(board.format_top(3))     # current top-3, e.g. from a progress callback
+    print(board.format_histogram())
+"""
+
+import heapq
+import threading
+from typing import List, Dict, Any, Optional
+
+
+class Leaderboard:
+    """Top-k results and a score histogram, updated one result at a time."""
+
+    def __init__(self, top_k: int = 10, bin_width: int = 10):
+        """
+        Args:
+            top_k: Number of results kept with their full breakdown
+            bin_width: Histogram bin width in score points (0-100 range)
+        """
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if bin_width < 1 or 100 % bin_width:
+            raise ValueError("bin_width must divide 100")
+        self.top_k = top_k
+        self.bin_width = bin_width
+        self.bins = [0] * (100 // bin_width)
+        self.count = 0
+        self.total = 0.0
+        self.min_score: Optional[float] = None
+        self.max_score: Optional[float] = None
+        self._heap: List[tuple] = []        # (score, -arrival, name, result); heap[0] = weakest kept
+        self._arrivals = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, name: str, result: Dict[str, Any]) -> bool:
+        """
+        Record one candidate's result.
+
+        Args:
+            name: Candidate name / id
+            result: calculate_matching_score result (needs "final_score")
+
+        Returns:
+            True if the candidate entered the top-k
+        """
+        score = result["final_score"]
+        with self._lock:
+            self.count += 1
+            self.total += score
+            self.min_score = score if self.min_score is None else min(self.min_score, score)
+            self.max_score = score if self.max_score is None else max(self.max_score, score)
+            self.bins[min(max(int(score // self.bin_width), 0), len(self.bins) - 1)] += 1
+
+            self._arrivals += 1
+            entry = (score, -self._arrivals, name, result)
+            if len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, entry)
+                return True
+            if score > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+                return True
+            return False
+
+    def top(self, n: int = None) -> List[tuple]:
+        """
+        Current best results.
+
+        Args:
+            n: Number of results (default: all kept, i.e. top_k)
+
+        Returns:
+            List of (name, score, result) tuples, best first (ties in arrival order)
+        """
+        with self._lock:
+            entries = sorted(self._heap, reverse=True)
+        return [(name, score, result) for score, _, name, result in entries[:n]]
+
+    def threshold(self) -> Optional[float]:
+        """Score a new candidate must beat to enter a full top-k (None while not full)."""
+        with self._lock:
+            return self._heap[0][0] if len(self._heap) >= self.top_k else None
+
+    def mean(self) -> Optional[float]:
+        with self._lock:
+            return self.total / self.count if self.count else None
+
+    def histogram(self) -> List[tuple]:
+        """(low, high, count) per bin; the last bin includes 100."""
+        with self._lock:
+            counts = list(self.bins)
+        return [(i * self.bin_width, (i + 1) * self.bin_width, c) for i, c in enumerate(counts)]
+
+    def format_top(self, n: int = None) -> str:
+        """Numbered "name: score/100" lines for progress output."""
+        lines = [f"🏆 Top {min(n or self.top_k, self.top_k)} of {self.count} scored:"]
+        for i, (name, score, _) in enumerate(self.top(n), 1):
+            lines.append(f"  {i}. {name}: {score}/100")
+        return "\n".join(lines)
+
+    def format_histogram(self, width: int = 40) -> str:
+        """Text bar chart of the score distribution."""
+        histogram = self.histogram()
+        peak = max((c for _, _, c in histogram), default=0) or 1
+        mean = self.mean()
+        lines = [f"📊 Score distribution ({self.count} candidates"
+                 + (f", mean {mean:.1f}, min {self.min_score}, max {self.max_score})" if mean is not None else ")")]
+        for low, high, count in reversed(histogram):
+            label = f"{low:>3}-{high:<3}" if high < 100 else f"{low:>3}-100"
+            lines.append(f"  {label} {'█' * round(width * count / peak):<{width}} {count}")
+        return "\n".join(lines)
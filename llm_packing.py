@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Request packing: fit several evaluation items into one LLM request.
+
+The fixed part of a scoring prompt (CRITERIA_SCORING_PROMPT, the CV or the
+rubric) is often larger than the per-item part. Packing several items into one
+request under a token budget sends that fixed part once per pack instead of
+once per item.
+
+Every packed mode follows the same recovery strategy: items whose output is
+missing or malformed are retried in smaller packs (split in halves), and a
+single item that still fails falls back to the regular one-item LLM call.
+
+REVERSE MATCHING:
+-----------------
+Which of our open roles fits this candidate? One CV against many rubrics,
+with several rubrics per request so the CV is sent once per pack:
+
+    rubrics = rubrics_for_postings({"job-1": posting_1, "job-2": posting_2})
+    ranked, failures = reverse_match(cv_text, rubrics)
+    ranked[0]  # {"job_id": "job-2", "final_score": 81.5, "breakdown": [...]}
+
+MULTI-CANDIDATE PACKING:
+------------------------
+For short CVs the scoring instructions and rubric dominate the prompt. Several
+candidates are scored against one rubric per request (K chosen from the token
+budget), reducing the number of requests roughly K times:
+
+    results, failures = score_candidates_packed([("alice", cv_1), ("bob", cv_2)], rubric)
+    results[0]  # ("bob", 77.0, {...calculate_matching_score result...})
+
+BATCH RUBRIC EXTRACTION:
+------------------------
+Bulk-importing postings (e.g. seeding the rubric cache for a new client) sends
+several postings per request; each rubric is normalized and cached as if it
+had been extracted on its own:
+
+    rubrics, failures = extract_rubrics_batch({"job-1": posting_1, "job-2": posting_2})
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Tuple, Hashable
+
+from prompts import (
+    CRITERIA_SCORING_PROMPT,
+    REVERSE_MATCHING_OUTPUT_PROMPT,
+    PACKED_CANDIDATES_OUTPUT_PROMPT,
+    BATCH_RUBRIC_EXTRACTION_OUTPUT_PROMPT
+)
+from test_matching_score import (
+    EvaluationRubric,
+    RUBRIC_EXTRACTION_PROMPT,
+    call_openrouter,
+    parse_llm_json,
+    parse_criteria_scores,
+    parse_rubric,
+    load_rubric_from_cache,
+    save_rubric_to_cache,
+    build_rubric_text,
+    extract_rubric_with_llm,
+    score_criteria_with_llm,
+    calculate_matching_score
+)
+
+# Prompt-side token budget per packed request (rough estimate, see estimate_tokens)
+DEFAULT_TOKEN_BUDGET = 24000
+
+# Completion tokens reserved per scored criterion (evidence + gap) and per request
+OUTPUT_TOKENS_PER_CRITERION = 150
+OUTPUT_TOKENS_BASE = 300
+MAX_OUTPUT_TOKENS = 16000
+
+# Completion tokens reserved per extracted rubric (single extraction uses 2000)
+OUTPUT_TOKENS_PER_RUBRIC = 1500
+
+
+# ============================================================================
+# PACKING
+# ============================================================================
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting."""
+    return len(text) // 4 + 1
+
+
+def pack_by_budget(
+    items: List[Any],
+    cost: Callable[[Any], int],
+    budget: int,
+    max_items: int
+) -> List[List[Any]]:
+    """
+    Greedily group items (in order) into packs under a token budget.
+
+    Args:
+        items: Items to pack
+        cost: Token cost of one item
+        budget: Token budget per pack (an item larger than the budget gets its own pack)
+        max_items: Maximum number of items per pack
+
+    Returns:
+        List of packs
+    """
+    packs = []
+    current = []
+    used = 0
+    for item in items:
+        item_cost = cost(item)
+        if current and (used + item_cost > budget or len(current) >= max_items):
+            packs.append(current)
+            current = []
+            used = 0
+        current.append(item)
+        used += item_cost
+    if current:
+        packs.append(current)
+    return packs
+
+
+def run_packed(
+    packs: List[List[Any]],
+    item_id: Callable[[Any], Hashable],
+    score_pack: Callable[[List[Any]], Dict[Hashable, Any]],
+    score_single: Callable[[Any], Any],
+    max_workers: int = 4
+) -> Tuple[Dict[Hashable, Any], Dict[Hashable, str], Dict[str, int]]:
+    """
+    Run packed requests with split-and-retry.
+
+    Args:
+        packs: Packs of items (see pack_by_budget)
+        item_id: Returns the ID of an item
+        score_pack: Runs one packed request; returns {item ID: value} for the
+            items whose output was valid (missing IDs are retried)
+        score_single: Regular one-item path used when a single item fails packed
+        max_workers: Packs processed concurrently
+
+    Returns:
+        Tuple of (values by item ID, errors by item ID, request stats with
+        packed_requests, retried_packs and single_fallbacks)
+    """
+    stats = {"packed_requests": 0, "retried_packs": 0, "single_fallbacks": 0}
+    stats_lock = threading.Lock()
+
+    def count(name: str):
+        with stats_lock:
+            stats[name] += 1
+
+    def process(pack: List[Any]) -> Tuple[Dict[Hashable, Any], Dict[Hashable, str]]:
+        values = {}
+        errors = {}
+        if len(pack) == 1:
+            count("single_fallbacks")
+            try:
+                values[item_id(pack[0])] = score_single(pack[0])
+            except Exception as e:
+                errors[item_id(pack[0])] = str(e)
+            return values, errors
+
+        count("packed_requests")
+        try:
+            values.update(score_pack(pack))
+        except Exception as e:
+            print(f"⚠ Packed request for {len(pack)} items failed: {e}")
+        remaining = [item for item in pack if item_id(item) not in values]
+        if not remaining:
+            return values, errors
+
+        # Retry the failed items: as a smaller pack if some succeeded,
+        # otherwise split the pack in halves
+        count("retried_packs")
+        if len(remaining) < len(pack):
+            retry_packs = [remaining]
+        else:
+            middle = len(pack) // 2
+            retry_packs = [pack[:middle], pack[middle:]]
+        for retry_pack in retry_packs:
+            retry_values, retry_errors = process(retry_pack)
+            values.update(retry_values)
+            errors.update(retry_errors)
+        return values, errors
+
+    values = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for pack_values, pack_errors in executor.map(process, packs):
+            values.update(pack_values)
+            errors.update(pack_errors)
+    return values, errors, stats
+
+
+def _output_tokens(num_criteria: int) -> int:
+    return min(MAX_OUTPUT_TOKENS, OUTPUT_TOKENS_BASE + num_criteria * OUTPUT_TOKENS_PER_CRITERION)
+
+
+# ============================================================================
+# REVERSE MATCHING (one CV, many rubrics)
+# ============================================================================
+
+def rubrics_for_postings(postings: Dict[str, str], model: str = None) -> Dict[str, EvaluationRubric]:
+    """
+    Rubrics for several job postings (from the rubric cache when available,
+    otherwise extracted in packed requests, see extract_rubrics_batch).
+
+    Args:
+        postings: Job postings by job ID
+        model: Optional model name used for postings that are not cached
+
+    Returns:
+        Rubrics by job ID (postings whose extraction failed are left out)
+    """
+    rubrics, failures = extract_rubrics_batch(postings, model=model)
+    for job_id, error in failures:
+        print(f"⚠ No rubric for job '{job_id}': {error}")
+    return rubrics
+
+
+def build_reverse_matching_prompt(cv_profile: str, jobs: List[Tuple[str, EvaluationRubric]]) -> str:
+    """Prompt scoring one CV against several rubrics (one section per job_id)."""
+    job_sections = "\n\n".join(
+        f"### job_id: \"{job_id}\" ({len(rubric.criteria)} criteria)\n{build_rubric_text(rubric)}"
+        for job_id, rubric in jobs
+    )
+    return f"""{CRITERIA_SCORING_PROMPT}
+
+{REVERSE_MATCHING_OUTPUT_PROMPT.format(num_jobs=len(jobs))}
+
+**Candidate CV:**
+{cv_profile}
+
+**Jobs and their Evaluation Criteria (YOU MUST SCORE EACH JOB ON ITS OWN CRITERIA):**
+{job_sections}"""
+
+
+def reverse_match(
+    cv_profile: str,
+    rubrics: Dict[str, EvaluationRubric],
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    max_jobs_per_request: int = 8,
+    max_workers: int = 4,
+    session_id: str = None,
+    model: str = None
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+    """
+    Score one CV against many jobs, packing several rubrics per LLM request.
+
+    Args:
+        cv_profile: The candidate's CV text
+        rubrics: Rubrics by job ID (see rubrics_for_postings)
+        token_budget: Prompt-side token budget per request
+        max_jobs_per_request: Maximum number of rubrics per request
+        max_workers: Packed requests in flight at once
+        session_id: Optional session ID for Langfuse tracking
+        model: Optional model name to use
+
+    Returns:
+        Tuple of (ranked, failures):
+        - ranked: [{"job_id", "final_score", "breakdown"}] sorted by score (descending)
+        - failures: List of (job_id, error message)
+    """
+    jobs = list(rubrics.items())
+    prefix_tokens = estimate_tokens(CRITERIA_SCORING_PROMPT + REVERSE_MATCHING_OUTPUT_PROMPT + cv_profile)
+    packs = pack_by_budget(
+        jobs,
+        cost=lambda job: estimate_tokens(build_rubric_text(job[1])) + 20,
+        budget=max(token_budget - prefix_tokens, 0),
+        max_items=max_jobs_per_request
+    )
+    print(f"\n[REVERSE MATCHING] {len(jobs)} jobs in {len(packs)} packed request(s)")
+
+    def score_pack(pack: List[Tuple[str, EvaluationRubric]]) -> Dict[str, Any]:
+        response_text, _ = call_openrouter(
+            messages=[{"role": "user", "content": build_reverse_matching_prompt(cv_profile, pack)}],
+            max_tokens=_output_tokens(sum(len(rubric.criteria) for _, rubric in pack)),
+            generation_name="reverse_matching",
+            session_id=session_id,
+            model=model
+        )
+        data = parse_llm_json(response_text)
+        entries = {str(entry.get("job_id")): entry for entry in data.get("jobs", []) if isinstance(entry, dict)}
+        values = {}
+        for job_id, rubric in pack:
+            entry = entries.get(str(job_id))
+            if entry is None:
+                print(f"⚠ Job '{job_id}' missing from packed response")
+                continue
+            try:
+                values[job_id] = parse_criteria_scores(entry, rubric, strict=True)
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"⚠ Malformed scores for job '{job_id}': {e}")
+        return values
+
+    criteria_scores, errors, stats = run_packed(
+        packs,
+        item_id=lambda job: job[0],
+        score_pack=score_pack,
+        score_single=lambda job: score_criteria_with_llm(cv_profile, job[1], session_id=session_id, model=model),
+        max_workers=max_workers
+    )
+
+    ranked = []
+    for job_id, rubric in jobs:
+        if job_id in criteria_scores:
+            result = calculate_matching_score(rubric, criteria_scores[job_id])
+            ranked.append({"job_id": job_id, "final_score": result["final_score"], "breakdown": result["breakdown"]})
+    ranked.sort(key=lambda r: r["final_score"], reverse=True)
+    failures = [(job_id, errors[job_id]) for job_id, _ in jobs if job_id in errors]
+
+    requests_made = stats["packed_requests"] + stats["single_fallbacks"]
+    print(f"✓ Reverse matching: {len(ranked)}/{len(jobs)} jobs scored with {requests_made} request(s) "
+          f"instead of {len(jobs)} ({stats['retried_packs']} pack(s) retried)")
+    return ranked, failures
+
+
+# ============================================================================
+# MULTI-CANDIDATE PACKING (many CVs, one rubric)
+# ============================================================================
+
+def build_packed_candidates_prompt(rubric: EvaluationRubric, candidates: List[Tuple[str, str]]) -> str:
+    """Prompt scoring several CVs against one rubric (one section per candidate_id)."""
+    candidate_sections = "\n\n".join(
+        f"### candidate_id: \"{candidate_id}\"\n{cv_profile}"
+        for candidate_id, cv_profile in candidates
+    )
+    output_prompt = PACKED_CANDIDATES_OUTPUT_PROMPT.format(
+        num_candidates=len(candidates),
+        num_criteria=len(rubric.criteria)
+    )
+    return f"""{CRITERIA_SCORING_PROMPT}
+
+{output_prompt}
+
+**Evaluation Criteria (YOU MUST SCORE EACH ONE FOR EVERY CANDIDATE):**
+{build_rubric_text(rubric)}
+
+**Candidate CVs:**
+{candidate_sections}"""
+
+
+def score_candidates_packed(
+    cv_profiles: List[Tuple[str, str]],
+    rubric: EvaluationRubric,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    max_candidates_per_request: int = 8,
+    max_workers: int = 4,
+    session_id: str = None,
+    model: str = None
+) -> Tuple[List[Tuple[str, float, Dict[str, Any]]], List[Tuple[str, str]]]:
+    """
+    Score several candidates per LLM request against the same rubric.
+
+    K (candidates per request) is bounded by the prompt token budget, by
+    max_candidates_per_request and by the completion tokens the scores need.
+    Candidates missing or malformed in a packed response are retried in
+    smaller packs, then individually via score_criteria_with_llm.
+
+    Args:
+        cv_profiles: List of (candidate_id, cv_text) tuples (IDs must be unique)
+        rubric: The evaluation rubric
+        token_budget: Prompt-side token budget per request
+        max_candidates_per_request: Maximum K
+        max_workers: Packed requests in flight at once
+        session_id: Optional session ID for Langfuse tracking
+        model: Optional model name to use
+
+    Returns:
+        Tuple of (results, failures) in the format of score_profiles_concurrently:
+        results are (candidate_id, score, result) sorted by score (descending),
+        failures are (candidate_id, error message)
+    """
+    output_tokens_per_candidate = len(rubric.criteria) * OUTPUT_TOKENS_PER_CRITERION
+    max_items = min(
+        max_candidates_per_request,
+        max(1, (MAX_OUTPUT_TOKENS - OUTPUT_TOKENS_BASE) // max(output_tokens_per_candidate, 1))
+    )
+    prefix_tokens = estimate_tokens(
+        CRITERIA_SCORING_PROMPT + PACKED_CANDIDATES_OUTPUT_PROMPT + build_rubric_text(rubric)
+    )
+    packs = pack_by_budget(
+        list(cv_profiles),
+        cost=lambda candidate: estimate_tokens(candidate[1]) + 20,
+        budget=max(token_budget - prefix_tokens, 0),
+        max_items=max_items
+    )
+    print(f"\n[PACKED SCORING] {len(cv_profiles)} candidates in {len(packs)} request(s) "
+          f"(up to {max_items} per request)")
+
+    def score_pack(pack: List[Tuple[str, str]]) -> Dict[str, Any]:
+        response_text, _ = call_openrouter(
+            messages=[{"role": "user", "content": build_packed_candidates_prompt(rubric, pack)}],
+            max_tokens=_output_tokens(len(rubric.criteria) * len(pack)),
+            generation_name="packed_criteria_scoring",
+            session_id=session_id,
+            model=model
+        )
+        data = parse_llm_json(response_text)
+        entries = {
+            str(entry.get("candidate_id")): entry
+            for entry in data.get("candidates", []) if isinstance(entry, dict)
+        }
+        values = {}
+        for candidate_id, _ in pack:
+            entry = entries.get(str(candidate_id))
+            if entry is None:
+                print(f"⚠ Candidate '{candidate_id}' missing from packed response")
+                continue
+            try:
+                values[candidate_id] = parse_criteria_scores(entry, rubric, strict=True)
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"⚠ Malformed scores for candidate '{candidate_id}': {e}")
+        return values
+
+    criteria_scores, errors, stats = run_packed(
+        packs,
+        item_id=lambda candidate: candidate[0],
+        score_pack=score_pack,
+        score_single=lambda candidate: score_criteria_with_llm(
+            candidate[1], rubric, session_id=session_id, model=model
+        ),
+        max_workers=max_workers
+    )
+
+    results = []
+    for candidate_id, _ in cv_profiles:
+        if candidate_id in criteria_scores:
+            result = calculate_matching_score(rubric, criteria_scores[candidate_id])
+            results.append((candidate_id, result["final_score"], result))
+    results.sort(key=lambda x: x[1], reverse=True)
+    failures = [(candidate_id, errors[candidate_id]) for candidate_id, _ in cv_profiles if candidate_id in errors]
+
+    requests_made = stats["packed_requests"] + stats["single_fallbacks"]
+    print(f"✓ Packed scoring: {len(results)}/{len(cv_profiles)} candidates scored with {requests_made} request(s) "
+          f"instead of {len(cv_profiles)} ({stats['retried_packs']} pack(s) retried)")
+    return results, failures
+
+
+# ============================================================================
+# BATCH RUBRIC EXTRACTION (many postings)
+# ============================================================================
+
+def build_batch_rubric_prompt(postings: List[Tuple[str, str]]) -> str:
+    """Prompt extracting one rubric per posting (one section per posting_id)."""
+    posting_sections = "\n\n".join(
+        f"### posting_id: \"{posting_id}\"\n{job_posting}"
+        for posting_id, job_posting in postings
+    )
+    return f"""{RUBRIC_EXTRACTION_PROMPT}
+
+{BATCH_RUBRIC_EXTRACTION_OUTPUT_PROMPT.format(num_postings=len(postings))}
+
+Job Postings:
+{posting_sections}"""
+
+
+def extract_rubrics_batch(
+    postings: Dict[str, str],
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    max_postings_per_request: int = 5,
+    max_workers: int = 4,
+    use_cache: bool = True,
+    session_id: str = None,
+    model: str = None
+) -> Tuple[Dict[str, EvaluationRubric], List[Tuple[str, str]]]:
+    """
+    Extract rubrics for several job postings, packing several postings per request.
+
+    Cached postings are not sent. Each extracted rubric is normalized like
+    extract_rubric_with_llm (weights sum to 100) and written to the rubric
+    cache. Postings missing or malformed in a packed response are retried in
+    smaller packs, then individually via extract_rubric_with_llm.
+
+    Args:
+        postings: Job postings by posting ID
+        token_budget: Prompt-side token budget per request
+        max_postings_per_request: Maximum number of postings per request
+        max_workers: Packed requests in flight at once
+        use_cache: Whether to read and write the rubric cache
+        session_id: Optional session ID for Langfuse tracking
+        model: Optional model name to use
+
+    Returns:
+        Tuple of (rubrics by posting ID, failures as (posting ID, error message))
+    """
+    rubrics = {}
+    to_extract = []
+    for posting_id, job_posting in postings.items():
+        cached_rubric = load_rubric_from_cache(job_posting) if use_cache else None
+        if cached_rubric is not None:
+            rubrics[posting_id] = cached_rubric
+        else:
+            to_extract.append((posting_id, job_posting))
+
+    max_items = min(
+        max_postings_per_request,
+        max(1, (MAX_OUTPUT_TOKENS - OUTPUT_TOKENS_BASE) // OUTPUT_TOKENS_PER_RUBRIC)
+    )
+    packs = pack_by_budget(
+        to_extract,
+        cost=lambda posting: estimate_tokens(posting[1]) + 20,
+        budget=max(token_budget - estimate_tokens(RUBRIC_EXTRACTION_PROMPT + BATCH_RUBRIC_EXTRACTION_OUTPUT_PROMPT), 0),
+        max_items=max_items
+    )
+    print(f"\n[BATCH RUBRIC EXTRACTION] {len(postings)} postings: {len(rubrics)} cached, "
+          f"{len(to_extract)} in {len(packs)} request(s)")
+
+    def extract_pack(pack: List[Tuple[str, str]]) -> Dict[str, Any]:
+        response_text, _ = call_openrouter(
+            messages=[{"role": "user", "content": build_batch_rubric_prompt(pack)}],
+            max_tokens=min(MAX_OUTPUT_TOKENS, OUTPUT_TOKENS_BASE + OUTPUT_TOKENS_PER_RUBRIC * len(pack)),
+            generation_name="batch_rubric_extraction",
+            session_id=session_id,
+            model=model
+        )
+        data = parse_llm_json(response_text)
+        entries = {
+            str(entry.get("posting_id")): entry
+            for entry in data.get("postings", []) if isinstance(entry, dict)
+        }
+        values = {}
+        for posting_id, job_posting in pack:
+            entry = entries.get(str(posting_id))
+            if entry is None:
+                print(f"⚠ Posting '{posting_id}' missing from packed response")
+                continue
+            try:
+                rubric = parse_rubric(entry)
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"⚠ Malformed rubric for posting '{posting_id}': {e}")
+                continue
+            if use_cache:
+                save_rubric_to_cache(job_posting, rubric)
+            values[posting_id] = rubric
+        return values
+
+    extracted, errors, stats = run_packed(
+        packs,
+        item_id=lambda posting: posting[0],
+        score_pack=extract_pack,
+        score_single=lambda posting: extract_rubric_with_llm(
+            posting[1], use_cache=use_cache, session_id=session_id, model=model
+        ),
+        max_workers=max_workers
+    )
+    rubrics.update(extracted)
+    failures = [(posting_id, errors[posting_id]) for posting_id in postings if posting_id in errors]
+
+    requests_made = stats["packed_requests"] + stats["single_fallbacks"]
+    print(f"✓ Batch rubric extraction: {len(extracted)}/{len(to_extract)} extracted with {requests_made} request(s) "
+          f"({stats['retried_packs']} pack(s) retried)")
+    return rubrics, failures
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Deterministic local scorers for structured criteria.
+
+Rubrics almost always contain an "Experience Years" criterion ("5+ years in
+backend development") and "Languages - X" criteria ("Professional Dutch (B2+
+level)"). Both can be scored from the CV text with the rules that
+CRITERIA_SCORING_PROMPT spells out for the LLM:
+
+- Experience Years: date ranges in the CV's experience section are merged
+  (overlaps count once), internships/traineeships are excluded when the job
+  needs 2+ years, and the ratio qualified/required is mapped onto the
+  prompt's score bands (meets exactly = 80-84, 2x = 100, ...)
+- Languages: the level stated next to the language (CEFR code, "fluent",
+  "native", ... in the supported languages) is mapped onto the prompt's
+  scale (native/C2 = 100, C1 = 90, B2 = 80, ...) and capped below 80 when
+  under the required level
+
+A local scorer returns None when the CV does not give enough evidence (no
+date ranges, language not mentioned or without a level); those criteria,
+and every other criterion type, are scored by the LLM as usual. Only the
+remaining criteria are sent, which shrinks both prompt and output tokens.
+
+USAGE:
+------
+    local_scores, remaining = score_criteria_locally(cv_text, rubric)
+    criteria_scores = score_criteria_hybrid(cv_text, rubric, model=model)
+
+    # Pipeline
+    build_evaluation_pipeline(local_criteria=True)
+"""
+
+import re
+import unicodedata
+from datetime import date
+from typing import List, Optional, Dict, Tuple
+
+from test_matching_score import (
+    RubricCriterion,
+    EvaluationRubric,
+    CriterionScore,
+    score_criteria_with_llm,
+    score_criteria_subset
+)
+
+
+def _fold(text: str) -> str:
+    """Strip accents and lowercase text for keyword matching."""
+    normalized = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch)).lower().replace("ß", "ss")
+
+
+# ============================================================================
+# CRITERION CLASSIFICATION
+# ============================================================================
+
+EXPERIENCE_NAME_PATTERN = re.compile(
+    r"^(?:total |professional |work )?(?:experience(?: years| level)?|years? of (?:professional |work )?experience)\b"
+)
+LANGUAGE_NAME_PATTERN = re.compile(r"^(?:languages?|langues?|talen|taal|sprachen?|idiomas?|lingue|lingua)\b")
+
+# "5+ years", "3-5 years", "minimum 8 ans", "5 jaar" ...
+YEARS_PATTERN = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*(?:\+|(?:-|–|to|a|tot|bis)\s*\d+(?:[.,]\d+)?)?\s*\+?\s*"
+    r"(?:years?|yrs?|ans|annees|jaar|jahre?n?|anos|anni)\b"
+)
+
+
+def required_years(description: str) -> Optional[float]:
+    """Minimum number of years in a criterion description (None if absent)."""
+    match = YEARS_PATTERN.search(_fold(description))
+    return float(match.group(1).replace(",", ".")) if match else None
+
+
+def classify_criterion(criterion: RubricCriterion) -> Optional[str]:
+    """
+    Criterion type handled by a local scorer.
+
+    Returns:
+        "experience_years", "languages", or None (LLM-scored)
+    """
+    name = _fold(criterion.name).strip()
+    if EXPERIENCE_NAME_PATTERN.match(name) and required_years(criterion.description) is not None:
+        return "experience_years"
+    if LANGUAGE_NAME_PATTERN.match(name) and _criterion_languages(criterion):
+        return "languages"
+    return None
+
+
+# ============================================================================
+# EXPERIENCE YEARS
+# ============================================================================
+
+# First letters of month names (EN, FR, NL, DE, ES, IT, PT); "jui" is ambiguous in French
+MONTH_PREFIXES = {
+    "jan": 1, "ene": 1, "gen": 1,
+    "feb": 2, "fev": 2,
+    "mar": 3, "maa": 3,
+    "apr": 4, "avr": 4, "abr": 4,
+    "may": 5, "mai": 5, "mei": 5, "mag": 5,
+    "jun": 6, "juin": 6, "gio": 6,
+    "jul": 7, "juil": 7, "lug": 7,
+    "aug": 8, "aou": 8, "ago": 8,
+    "sep": 9, "set": 9,
+    "oct": 10, "okt": 10, "ott": 10, "out": 10,
+    "nov": 11,
+    "dec": 12, "dez": 12, "dic": 12
+}
+PRESENT_WORDS = r"present|current|now|today|ongoing|heden|nu|huidig|aujourd'?hui|actuel|maintenant|heute|jetzt|actualidad|presente|hoy|oggi|atual|atualmente"
+
+_DATE = r"(?:([a-z]{3,9})\.?\s+|(\d{1,2})\s*[/.-]\s*)?((?:19|20)\d{2})"
+DATE_RANGE_PATTERN = re.compile(
+    _DATE + r"\s*(?:-|–|—|to|until|tot|au|a|bis|hasta|al|->)\s*(?:" + _DATE + r"|(" + PRESENT_WORDS + r"))"
+)
+
+# Bare "stage" is left out: "early-stage startup" is common in English CVs
+INTERN_PATTERN = re.compile(r"\b(?:intern|internship|trainee|traineeship|stagiaire|stagiair|praktikum|praktikant|becario|tirocinio|estagio|estagiario)\b")
+
+# CV section headings by section (accent-folded, lowercase)
+SECTION_KEYWORDS = {
+    "experience": r"experiences?|employment|work history|career|ervaring|werkervaring|berufserfahrung|"
+                  r"experiencia|esperienz[ae]|parcours|experiencias",
+    "education": r"education|formations?|opleidingen?|ausbildung|studium|educacion|formacion|istruzione|"
+                 r"formazione|educacao|studies|etudes|academic|training",
+    "skills": r"skills|competences|competencies|vaardigheden|kenntnisse|fahigkeiten|habilidades|"
+              r"competenze|competencias|tools|technologies",
+    "languages": r"languages|langues|talen|talenkennis|sprachen|sprachkenntnisse|idiomas|lingue",
+    "certifications": r"certifications?|certificates|certificats|certificaten|zertifikate|certificados|certificazioni",
+    "projects": r"projects|projets|projecten|projekte|proyectos|progetti|projetos",
+    "interests": r"interests|hobbies|hobby's|loisirs|centres d'interet|interesses|interessen|freizeit|"
+                 r"intereses|aficiones|interessi|passatempi",
+    "references": r"references|referenties|referenzen|referencias|referenze",
+    "summary": r"profile|summary|about me|objective|profil|profiel|samenvatting|over mij|kurzprofil|"
+               r"zusammenfassung|perfil|resumen|sobre mi|chi sono|sommario|sobre mim|a propos",
+    "contact": r"contact|contact details|personal (?:details|information|data)|coordonnees|contactgegevens|"
+               r"persoonlijke gegevens|kontakt|personliche daten|datos personales|contacto|dati personali|"
+               r"contatti|dados pessoais"
+}
+# A heading line is only heading keywords: "Work Experience", "SKILLS & LANGUAGES:",
+# "== Education ==" (not "Contact Center Team Lead")
+_HEADING_QUALIFIER = r"(?:(?:professional|work|relevant|technical|key|core|additional|other|my|" \
+                     r"professionele|berufliche)\s+)?"
+_HEADING_TRAILING_QUALIFIER = r"(?:\s+(?:professionnelles?|academiques?|techniques?|linguistiques?|" \
+                              r"profesional(?:es)?|laboral|academica|tecnicas|professionali?|lavorativa|" \
+                              r"profissional))?"
+_HEADING_KEYWORD = (_HEADING_QUALIFIER + r"(" + "|".join(SECTION_KEYWORDS.values()) + r")"
+                    + _HEADING_TRAILING_QUALIFIER)
+HEADING_PATTERN = re.compile(
+    _HEADING_KEYWORD + r"(?:\s*(?:&|\+|/|,|and|et|en|und|y|e)\s*" + _HEADING_KEYWORD + r")*"
+)
+_SECTION_PATTERNS = {name: re.compile(r"(?:" + keywords + r")") for name, keywords in SECTION_KEYWORDS.items()}
+# Sections whose date ranges are not professional experience
+NON_EXPERIENCE_SECTIONS = {"education", "skills", "languages", "certifications", "projects", "interests", "references"}
+EDUCATION_LINE_PATTERN = re.compile(r"\b(?:university|universite|universiteit|universitat|universidad|universita|school|ecole|hogeschool|schule|bachelor|master|msc|bsc|phd|diploma|diplome|degree|licence)\b")
+
+
+def _month_number(word: Optional[str], number: Optional[str]) -> Optional[int]:
+    if number:
+        month = int(number)
+        return month if 1 <= month <= 12 else None
+    if word:
+        return MONTH_PREFIXES.get(word[:4]) or MONTH_PREFIXES.get(word[:3])
+    return None
+
+
+def date_range_months(match: re.Match, now: int) -> Tuple[int, int]:
+    """
+    (start, end) months of a DATE_RANGE_PATTERN match, counted as year * 12 + month - 1.
+
+    Args:
+        match: Match on accent-folded, lowercased text (see _fold)
+        now: Current month, used for "present"
+    """
+    start_word, start_number, start_year, end_word, end_number, end_year, present = match.groups()
+    start_month = _month_number(start_word, start_number)
+    end_month = _month_number(end_word, end_number)
+    start = int(start_year) * 12 + (start_month or 1) - 1
+    if present:
+        end = now
+    elif start_month is None and end_month is None:
+        # Year-only range: whole years between the two (a single year counts as one)
+        end = max(int(end_year), int(start_year) + 1) * 12
+    else:
+        end = int(end_year) * 12 + (end_month or 12) - 1
+    return start, end
+
+
+def section_heading(line: str) -> Optional[str]:
+    """
+    Section named by a heading line (a key of SECTION_KEYWORDS), if the line is one.
+
+    The line must consist of heading keywords only, apart from decoration and
+    a trailing colon; a role title such as "Contact Center Team Lead" is not a
+    heading.
+    """
+    stripped = _fold(line).strip(" :-–—•*#|=_\t")
+    if not stripped or len(stripped) > 60:
+        return None
+    match = HEADING_PATTERN.fullmatch(" ".join(stripped.split()))
+    if not match:
+        return None
+    keyword = match.group(1)
+    for section, pattern in _SECTION_PATTERNS.items():
+        if pattern.fullmatch(keyword):
+            return section
+    return None
+
+
+def extract_experience_periods(cv_text: str, today: date = None) -> List[Dict]:
+    """
+    Professional date ranges of a CV.
+
+    Ranges under an education (or skills, languages, ...) heading are
+    ignored; without headings, lines mentioning a school or degree are.
+
+    Args:
+        cv_text: CV text
+        today: Reference date for "present" (default: today)
+
+    Returns:
+        [{"start": months, "end": months, "intern": bool, "text": line}],
+        months counted as year * 12 + month - 1
+    """
+    today = today or date.today()
+    now = today.year * 12 + today.month - 1
+    lines = _fold(cv_text).splitlines()
+    periods = []
+    section = None
+    for i, line in enumerate(lines):
+        heading = section_heading(line)
+        if heading:
+            section = heading
+            continue
+        if section in NON_EXPERIENCE_SECTIONS:
+            continue
+        # Role titles are usually on the line above the dates, or on the same line
+        context = " ".join(lines[max(i - 1, 0):i + 1])
+        if section is None and EDUCATION_LINE_PATTERN.search(context):
+            continue
+        for match in DATE_RANGE_PATTERN.finditer(line):
+            start, end = date_range_months(match, now)
+            if end < start or start > now:
+                continue
+            periods.append({
+                "start": start,
+                "end": min(end, now),
+                "intern": bool(INTERN_PATTERN.search(context)),
+                "text": line.strip()
+            })
+    return periods
+
+
+def _merged_months(periods: List[Dict]) -> int:
+    """Total months covered by the periods (overlaps count once)."""
+    total = 0
+    current_start = current_end = None
+    for period in sorted(periods, key=lambda p: p["start"]):
+        if current_end is None or period["start"] > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = period["start"], period["end"]
+        else:
+            current_end = max(current_end, period["end"])
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+# (ratio from, ratio to, score from, score to): the bands of CRITERIA_SCORING_PROMPT
+EXPERIENCE_SCORE_BANDS = [
+    (0.0, 0.2, 0, 29),
+    (0.2, 0.4, 30, 49),
+    (0.4, 0.6, 50, 59),
+    (0.6, 0.8, 60, 69),
+    (0.8, 0.9, 70, 79),
+    (0.9, 1.2, 80, 84),
+    (1.2, 1.5, 85, 95),
+    (1.5, 2.0, 95, 100)
+]
+
+
+def experience_score(qualified_years: float, required: float) -> int:
+    """Map qualified / required years onto the prompt's score bands."""
+    if required <= 0:
+        return 100
+    ratio = qualified_years / required
+    for ratio_from, ratio_to, score_from, score_to in EXPERIENCE_SCORE_BANDS:
+        if ratio < ratio_to:
+            return round(score_from + (score_to - score_from) * (ratio - ratio_from) / (ratio_to - ratio_from))
+    return 100
+
+
+def score_experience_years(cv_text: str, criterion: RubricCriterion, today: date = None) -> Optional[CriterionScore]:
+    """
+    Score an "Experience Years" criterion from CV date ranges.
+
+    Internships and traineeships count only for junior requirements (< 2 years).
+
+    Returns:
+        CriterionScore, or None if the CV has no usable date ranges
+    """
+    required = required_years(criterion.description)
+    periods = extract_experience_periods(cv_text, today=today)
+    if required is None or not periods:
+        return None
+
+    count_interns = required < 2
+    qualified = [p for p in periods if count_interns or not p["intern"]]
+    years = round(_merged_months(qualified) / 12, 1)
+    score = experience_score(years, required)
+    excluded = len(periods) - len(qualified)
+
+    evidence = f"{years:g} years of professional experience from {len(qualified)} dated role(s)"
+    if excluded:
+        evidence += f" ({excluded} internship/traineeship period(s) excluded)"
+    gap = "" if years >= required else f"{required - years:.1f} years short of the required {required:g}+ years"
+    return CriterionScore(criteria_name=criterion.name, score=score, evidence=evidence, gap=gap)
+
+
+# ============================================================================
+# LANGUAGES
+# ============================================================================
+
+LANGUAGE_ALIASES = {
+    "English": ["english", "anglais", "engels", "englisch", "ingles", "inglese"],
+    "French": ["french", "francais", "frans", "franzosisch", "frances", "francese"],
+    "Dutch": ["dutch", "neerlandais", "nederlands", "niederlandisch", "neerlandes", "olandese", "flemish", "vlaams"],
+    "German": ["german", "allemand", "duits", "deutsch", "aleman", "tedesco", "alemao"],
+    "Spanish": ["spanish", "espagnol", "spaans", "spanisch", "espanol", "spagnolo", "espanhol"],
+    "Italian": ["italian", "italien", "italiaans", "italienisch", "italiano"],
+    "Portuguese": ["portuguese", "portugais", "portugees", "portugiesisch", "portugues", "portoghese"]
+}
+_ALIAS_TO_LANGUAGE = {alias: language for language, aliases in LANGUAGE_ALIASES.items() for alias in aliases}
+_ALIAS_PATTERN = re.compile(r"\b(" + "|".join(sorted(_ALIAS_TO_LANGUAGE, key=len, reverse=True)) + r")\b")
+
+# Connectors between two language names ("French or Dutch", "Frans en Nederlands").
+# Only the text between language names is checked: "of"/"o"/"e" are ordinary
+# words elsewhere in a description.
+_ANY_OF_PATTERN = re.compile(r"\b(?:or|ou|of|oder|o|either)\b")
+_ALL_OF_PATTERN = re.compile(r"\b(?:and|et|en|und|y|e|as well as|plus)\b|&")
+
+# CEFR ranks: A1=1 ... C2=6, native=7
+CEFR_RANKS = {"a1": 1, "a2": 2, "b1": 3, "b2": 4, "c1": 5, "c2": 6}
+LEVEL_WORDS = {
+    7: ["native", "mother tongue", "moedertaal", "langue maternelle", "maternelle", "muttersprache",
+        "nativo", "nativa", "madrelingua", "lingua madre", "bilingual", "bilingue", "tweetalig", "zweisprachig"],
+    6: ["proficient", "full professional", "mastery", "maitrise parfaite"],
+    5: ["fluent", "fluently", "courant", "couramment", "vloeiend", "fliessend", "fluido", "fluida", "fluente",
+        "advanced", "avance", "gevorderd", "fortgeschritten", "avanzado", "avanzato", "avancado"],
+    4: ["professional", "professionnel", "professionnelle", "professioneel", "upper intermediate",
+        "good", "bon", "bonne", "goed", "gut", "gute", "bueno", "buen", "buono", "bom"],
+    3: ["intermediate", "intermediaire", "gemiddeld", "mittel", "intermedio", "intermediario", "conversational"],
+    2: ["basic", "basique", "notions", "basis", "grundkenntnisse", "basico", "base", "elementary", "elementaire"],
+    1: ["beginner", "debutant", "beginner", "anfanger", "principiante", "iniciante"]
+}
+_LEVEL_PATTERN = re.compile(
+    r"\b(" + "|".join(sorted({w for words in LEVEL_WORDS.values() for w in words}, key=len, reverse=True))
+    + r"|[abc][12])\+?(?![a-z0-9])"
+)
+_WORD_RANKS = {word: rank for rank, words in LEVEL_WORDS.items() for word in words}
+
+# The prompt's language scale by rank (native/C2 = 100, C1 = 90, B2 = 80, ...)
+LANGUAGE_SCORES = {7: 100, 6: 100, 5: 90, 4: 80, 3: 70, 2: 60, 1: 40}
+LEVEL_LABELS = {7: "native", 6: "C2", 5: "C1", 4: "B2", 3: "B1", 2: "A2", 1: "A1"}
+DEFAULT_REQUIRED_RANK = 4  # "Professional" when the description states no level
+
+
+def _level_rank(token: str) -> int:
+    return CEFR_RANKS.get(token) or _WORD_RANKS[token]
+
+
+def _criterion_language_mentions(criterion: RubricCriterion) -> Tuple[str, list]:
+    """Folded text and language name matches of a criterion (name first, then description)."""
+    for text in (criterion.name, criterion.description):
+        folded = _fold(text)
+        mentions = list(_ALIAS_PATTERN.finditer(folded))
+        if mentions:
+            return folded, mentions
+    return "", []
+
+
+def _criterion_languages(criterion: RubricCriterion) -> List[str]:
+    """Languages named by a criterion (name first, then description)."""
+    languages = []
+    for match in _criterion_language_mentions(criterion)[1]:
+        language = _ALIAS_TO_LANGUAGE[match.group(1)]
+        if language not in languages:
+            languages.append(language)
+    return languages
+
+
+def _language_requirement_mode(criterion: RubricCriterion) -> Optional[str]:
+    """
+    Whether a criterion naming several languages needs "all" or "any" of them.
+
+    Decided from the words between consecutive language names only ("French
+    and Dutch" -> all, "French or Dutch" -> any, "French, Dutch" -> all).
+
+    Returns:
+        "all", "any", or None when the connectors are mixed or unclear
+        (e.g. "French/Dutch", "English and French or Dutch")
+    """
+    folded, mentions = _criterion_language_mentions(criterion)
+    any_of = all_of = False
+    for previous, current in zip(mentions, mentions[1:]):
+        between = folded[previous.end():current.start()]
+        has_any, has_all = bool(_ANY_OF_PATTERN.search(between)), bool(_ALL_OF_PATTERN.search(between))
+        if has_any == has_all and not re.fullmatch(r"[\s,;]*", between):
+            return None
+        any_of, all_of = any_of or has_any, all_of or has_all
+    if any_of and all_of:
+        return None
+    return "any" if any_of else "all"
+
+
+def _required_rank(description: str) -> int:
+    ranks = [_level_rank(match.group(1)) for match in _LEVEL_PATTERN.finditer(_fold(description))]
+    return min(ranks) if ranks else DEFAULT_REQUIRED_RANK
+
+
+def extract_language_levels(cv_text: str) -> Dict[str, int]:
+    """
+    Highest stated level per language in a CV.
+
+    Each level keyword on a line is attributed to the nearest language name
+    on that line (a separator such as "," or "|" in between counts as far;
+    ties go to the preceding name, as in "English: fluent").
+
+    Returns:
+        dict of language -> rank (A1=1 ... C2=6, native=7); languages
+        mentioned without any level are absent
+    """
+    levels: Dict[str, int] = {}
+    for line in _fold(cv_text).splitlines():
+        mentions = [(m.start(), m.end(), _ALIAS_TO_LANGUAGE[m.group(1)]) for m in _ALIAS_PATTERN.finditer(line)]
+        if not mentions:
+            continue
+        for level in _LEVEL_PATTERN.finditer(line):
+            best = None
+            for start, end, language in mentions:
+                if end <= level.start():
+                    between = line[end:level.start()]
+                    distance, preceding = len(between), 0
+                elif start >= level.end():
+                    between = line[level.end():start]
+                    distance, preceding = len(between), 1
+                else:
+                    continue
+                if re.search(r"[,;|/•]", between):
+                    distance += 10
+                if best is None or (distance, preceding) < best[0]:
+                    best = ((distance, preceding), language)
+            if best:
+                language = best[1]
+                levels[language] = max(levels.get(language, 0), _level_rank(level.group(1)))
+    return levels
+
+
+def language_score(candidate_rank: int, required_rank: int) -> int:
+    """Prompt scale when the requirement is met, capped below 80 (and 10 lower per extra level) otherwise."""
+    score = LANGUAGE_SCORES[candidate_rank]
+    if candidate_rank >= required_rank:
+        return max(score, 80)
+    return min(score, 79 - 10 * (required_rank - candidate_rank - 1))
+
+
+def score_language(cv_text: str, criterion: RubricCriterion) -> Optional[CriterionScore]:
+    """
+    Score a "Languages" criterion from the levels stated in the CV.
+
+    Criteria naming several languages need all of them (lowest score), or any
+    of them when the names are joined by "or" (see _language_requirement_mode).
+
+    Returns:
+        CriterionScore, or None if a language is not stated with a level or
+        the criterion is ambiguous about needing all or any of its languages
+    """
+    languages = _criterion_languages(criterion)
+    mode = _language_requirement_mode(criterion)
+    if mode is None:
+        return None
+    required = _required_rank(criterion.description)
+    cv_levels = extract_language_levels(cv_text)
+    any_of = mode == "any"
+    if any_of:
+        languages = [language for language in languages if language in cv_levels]
+    if not languages or any(language not in cv_levels for language in languages):
+        return None
+
+    scores = {language: language_score(cv_levels[language], required) for language in languages}
+    language = (max if any_of else min)(scores, key=scores.get)
+
+    evidence = "; ".join(f"{name}: {LEVEL_LABELS[cv_levels[name]]}" for name in languages) + " (stated in CV)"
+    gap = "" if cv_levels[language] >= required else (
+        f"{language} {LEVEL_LABELS[cv_levels[language]]} below the required {LEVEL_LABELS[required]}"
+    )
+    return CriterionScore(criteria_name=criterion.name, score=scores[language], evidence=evidence, gap=gap)
+
+
+# ============================================================================
+# HYBRID SCORING
+# ============================================================================
+
+LOCAL_SCORERS = {
+    "experience_years": score_experience_years,
+    "languages": score_language
+}
+
+
+def score_criteria_locally(cv_profile: str, rubric: EvaluationRubric) -> Tuple[Dict[str, CriterionScore], List[RubricCriterion]]:
+    """
+    Score the criteria that have a local scorer.
+
+    Returns:
+        (local_scores, remaining): scores by criterion name, and the
+        criteria left for the LLM (other types, or not enough evidence)
+    """
+    local_scores = {}
+    remaining = []
+    for criterion in rubric.criteria:
+        criterion_type = classify_criterion(criterion)
+        score = LOCAL_SCORERS[criterion_type](cv_profile, criterion) if criterion_type else None
+        if score is None:
+            remaining.append(criterion)
+        else:
+            local_scores[criterion.name] = score
+    return local_scores, remaining
+
+
+def score_criteria_hybrid(
+    cv_profile: str,
+    rubric: EvaluationRubric,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> List[CriterionScore]:
+    """
+    Score criteria locally where possible and send only the rest to the LLM.
+
+    Drop-in replacement for score_criteria_with_llm.
+
+    Returns:
+        List of CriterionScore in rubric order
+    """
+    local_scores, remaining = score_criteria_locally(cv_profile, rubric)
+    for name, score in local_scores.items():
+        print(f"🧮 Scored locally: {name} = {score.score} ({score.evidence})")
+
+    if remaining:
+        print(f"→ Sending {len(remaining)}/{len(rubric.criteria)} criteria to the LLM")
+    return score_criteria_subset(cv_profile, rubric, local_scores, score_criteria_with_llm,
+                                 langfuse_parent=langfuse_parent, session_id=session_id, model=model)
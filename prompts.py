@@ -3154,3 +3154,181 @@ Before returning:
   - Medior position + candidate has 1 year trainee + 3 years professional = **80-85** (count only 3 years)
   - Senior position + candidate has 6 months trainee + 6 years developer = **85-90** (count only 6 years)
 """
+
+
+FUSED_EVALUATION_OUTPUT_PROMPT = """## COMBINED OUTPUT (SINGLE RESPONSE)
+
+You are performing BOTH tasks above in one pass:
+1. **Criteria scoring** - score the candidate on EVERY rubric criterion using the scoring rules above
+2. **Qualification note** - write the full HTML qualification note using the required structure above, consistent with your criteria scores
+3. **Qualification summary** - a concise executive summary (2-3 short paragraphs, plain text, no HTML) covering: overall fit level, top 2-3 strengths, primary concerns, and the recommendation (ADVANCE/PROCEED WITH CAUTION/DO NOT ADVANCE)
+
+### LANGUAGE REQUIREMENT:
+Write the qualification note and the summary entirely in **{language}**. Criterion names MUST stay exactly as given in the rubric.
+
+### OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{{
+  "criteria_scores": [
+    {{
+      "criteria_name": "Exact criterion name from the rubric",
+      "score": 85,
+      "evidence": "Specific evidence from the CV",
+      "gap": ""
+    }}
+  ],
+  "qualification_note": "<b>OVERALL ASSESSMENT: [Fit Level]</b> ... full HTML note ...",
+  "qualification_summary": "Plain-text executive summary"
+}}
+
+### VALIDATION
+- "criteria_scores" MUST contain exactly {num_criteria} items, one per rubric criterion
+- "evidence" is REQUIRED for every criterion; "gap" is REQUIRED if score < 80
+- "qualification_note" MUST start with <b>OVERALL ASSESSMENT: and follow the required HTML structure
+- Escape double quotes and newlines inside JSON strings"""
+
+
+REVERSE_MATCHING_OUTPUT_PROMPT = """## PACKED OUTPUT: ONE CANDIDATE, SEVERAL JOBS (OVERRIDES THE OUTPUT FORMAT ABOVE)
+
+You are scoring the SAME candidate against {num_jobs} different jobs. Each job has its own list of criteria, identified by its job_id.
+Score every job INDEPENDENTLY, as if it were the only job: apply the scoring rules above to each job's own criteria and required level.
+
+### OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{{
+  "jobs": [
+    {{
+      "job_id": "Exact job_id as given",
+      "criteria_scores": [
+        {{
+          "criteria_name": "Exact criterion name from THIS job's criteria",
+          "score": 85,
+          "evidence": "Specific evidence from the CV",
+          "gap": ""
+        }}
+      ]
+    }}
+  ]
+}}
+
+### VALIDATION
+- "jobs" MUST contain exactly {num_jobs} items, one per job_id given
+- Each job's "criteria_scores" MUST contain one item per criterion of THAT job, using the exact criterion names
+- "evidence" is REQUIRED for every criterion; "gap" is REQUIRED if score < 80
+- Escape double quotes and newlines inside JSON strings"""
+
+
+PACKED_CANDIDATES_OUTPUT_PROMPT = """## PACKED OUTPUT: SEVERAL CANDIDATES, ONE JOB (OVERRIDES THE OUTPUT FORMAT ABOVE)
+
+You are scoring {num_candidates} different candidates against the SAME criteria. Each candidate's CV is identified by its candidate_id.
+Score every candidate INDEPENDENTLY, using ONLY that candidate's own CV - never mix evidence between candidates and do not rank them against each other.
+
+### OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{{
+  "candidates": [
+    {{
+      "candidate_id": "Exact candidate_id as given",
+      "criteria_scores": [
+        {{
+          "criteria_name": "Exact criterion name from the criteria list",
+          "score": 85,
+          "evidence": "Specific evidence from THIS candidate's CV",
+          "gap": ""
+        }}
+      ]
+    }}
+  ]
+}}
+
+### VALIDATION
+- "candidates" MUST contain exactly {num_candidates} items, one per candidate_id given
+- Each candidate's "criteria_scores" MUST contain exactly {num_criteria} items, one per criterion, using the exact criterion names
+- "evidence" is REQUIRED for every criterion; "gap" is REQUIRED if score < 80
+- Escape double quotes and newlines inside JSON strings"""
+
+
+BATCH_RUBRIC_EXTRACTION_OUTPUT_PROMPT = """## PACKED OUTPUT: SEVERAL JOB POSTINGS (OVERRIDES THE OUTPUT FORMAT ABOVE)
+
+You are given {num_postings} different job postings, each identified by its posting_id.
+Extract a SEPARATE rubric for every posting, INDEPENDENTLY, as if it were the only posting: never mix requirements between postings.
+
+### OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{{
+  "postings": [
+    {{
+      "posting_id": "Exact posting_id as given",
+      "criteria": [
+        {{
+          "name": "Criterion name",
+          "weight": 20,
+          "description": "What is required, including the required level",
+          "is_required": true
+        }}
+      ]
+    }}
+  ]
+}}
+
+### VALIDATION
+- "postings" MUST contain exactly {num_postings} items, one per posting_id given
+- Each posting's criteria weights MUST sum to 100
+- Escape double quotes and newlines inside JSON strings"""
+
+
+CV_PROFILE_EXPERIENCE_OUTPUT_PROMPT = """## OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{
+  "experience": [
+    {
+      "title": "Job title",
+      "company": "Company name or empty string",
+      "industry": "Industry in English",
+      "employment_type": "permanent",
+      "start_date": "05-2020",
+      "end_date": "Present",
+      "city": "City or empty string",
+      "country": "Country in English or empty string",
+      "summary": "Brief, factual summary (1-2 sentences)"
+    }
+  ],
+  "industries": ["IT"]
+}
+
+- Escape double quotes and newlines inside JSON strings"""
+
+
+CV_PROFILE_EDUCATION_OUTPUT_PROMPT = """## ADDITIONAL FIELDS: SKILLS AND LANGUAGES
+Also extract:
+- **skills**: up to 25 hard skills, tools and certifications explicitly stated in the resume (short names, e.g. "Python", "SAP FI", "PMP"); do not infer skills that are not stated
+- **languages**: every spoken language mentioned, with the level exactly as stated (CEFR code, "native", "fluent", ...) or an empty string if no level is stated
+- **profile_summary**: one factual sentence on the candidate's profile (current role, years of experience, domain)
+
+## OUTPUT FORMAT (STRICT)
+Return ONLY a single valid JSON object with NO additional text or markdown:
+
+{
+  "education": [
+    {
+      "degree": "Master of Science",
+      "field_of_study": "Computer Science",
+      "school_name": "School name",
+      "start_date": "2016",
+      "end_date": "2018",
+      "city": "City or empty string",
+      "country": "Country in English or empty string"
+    }
+  ],
+  "address": "City, Country",
+  "profile_summary": "One factual sentence",
+  "skills": ["Python"],
+  "languages": [{"language": "Dutch", "level": "native"}]
+}
+
+- Escape double quotes and newlines inside JSON strings"""
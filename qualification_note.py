@@ -0,0 +1,668 @@
+#!/usr/bin/env python3
+"""
+Local parsing of qualification notes.
+
+The qualification note produced by generate_qualification_note follows a fixed
+HTML structure (see QUALIFICATION_GENERATION_PROMPT in prompts.py):
+
+    <b>OVERALL ASSESSMENT: [Fit Level]</b>
+    <b>EXECUTIVE SUMMARY</b> ... <b>CANDIDATE STRENGTHS</b> <ul><li>...</li></ul>
+    <b>AREAS OF CONCERN</b> <ul><li>...</li></ul> ...
+    <b>RECOMMENDATION</b>
+    <p><b>[ADVANCE/PROCEED WITH CAUTION/DO NOT ADVANCE]</b> - [rationale]</p>
+
+Everything the executive summary needs (fit level, strengths, concerns,
+recommendation) is already in that structure, so this module extracts it
+deterministically and renders a templated summary per language instead of
+spending another LLM round-trip. The same parse drives a local implementation
+of QUALIFICATION_TO_SCORE_CONVERSION_PROMPT (fit level + recommendation ->
+matching score range).
+
+USAGE:
+------
+    parsed = parse_qualification_note(qualification_note)
+    if parsed:
+        summary = render_qualification_summary(parsed, result["breakdown"], "French")
+        conversion = score_from_qualification_note(parsed)  # {"matching_score": 82, ...}
+
+    # Candidate gated on a required criterion: no LLM note at all
+    note = render_gated_note(gate["failed_criteria"], gate["threshold"], "German")
+"""
+
+import re
+import html
+import unicodedata
+from typing import List, Optional, Dict, Any
+
+
+# ============================================================================
+# FIT LEVELS AND RECOMMENDATIONS
+# ============================================================================
+
+# Canonical fit levels (same scale as QUALIFICATION_GENERATION_PROMPT)
+FIT_LEVELS = [
+    "Exceptional Fit",
+    "Strong Fit",
+    "Good Fit",
+    "Moderate Fit",
+    "Weak Fit",
+    "Poor Fit"
+]
+
+# Words that identify a fit level, accent-stripped and lowercase.
+# The note is generated in the selected language, so the headline fit level
+# may be translated ("Adéquation forte", "Gute Passung", ...).
+FIT_LEVEL_KEYWORDS = {
+    "Exceptional Fit": {"exceptional", "exceptionnel", "exceptionnelle", "excepcional", "herausragend",
+                        "herausragende", "außergewohnlich", "außergewohnliche", "uitzonderlijk",
+                        "uitzonderlijke", "eccezionale"},
+    "Strong Fit": {"strong", "fort", "forte", "fuerte", "stark", "starke", "starker", "sterk", "sterke"},
+    "Good Fit": {"good", "bon", "bonne", "buen", "buena", "bueno", "gut", "gute", "guter", "goed",
+                 "goede", "buon", "buona", "buono", "bom", "boa"},
+    "Moderate Fit": {"moderate", "modere", "moderee", "moderado", "moderada", "moderat", "moderater",
+                     "gematigd", "gematigde", "matig", "matige", "moderato"},
+    "Weak Fit": {"weak", "faible", "debil", "schwach", "schwache", "schwacher", "zwak", "zwakke",
+                 "debole", "fraco", "fraca"},
+    "Poor Fit": {"poor", "insuffisant", "insuffisante", "mauvais", "mauvaise", "pobre", "deficiente",
+                 "gering", "geringe", "ungenugend", "ungenugende", "slecht", "slechte", "scarso",
+                 "scarsa", "insuficiente"}
+}
+
+# Canonical recommendation labels (checked in this order: the negative label
+# contains the positive one)
+RECOMMENDATIONS = ["DO NOT ADVANCE", "PROCEED WITH CAUTION", "ADVANCE"]
+
+RECOMMENDATION_PHRASES = {
+    "DO NOT ADVANCE": ["do not advance", "ne pas avancer", "ne pas poursuivre", "ne pas retenir",
+                       "no avanzar", "no continuar", "nicht weiterverfolgen", "nicht fortfahren",
+                       "niet doorgaan", "niet verder", "non procedere", "non avanzare",
+                       "nao avancar", "nao prosseguir"],
+    "PROCEED WITH CAUTION": ["proceed with caution", "avec prudence", "con precaucion", "con cautela",
+                             "mit vorsicht", "met voorzichtigheid", "voorzichtig", "com cautela"],
+    "ADVANCE": ["advance", "avancer", "poursuivre", "retenir", "avanzar", "continuar",
+                "weiterverfolgen", "fortfahren", "doorgaan", "procedere", "avanzare",
+                "avancar", "prosseguir"]
+}
+
+# Section heading keywords (accent-stripped, uppercase), English first
+SECTION_KEYWORDS = {
+    "overall": ["OVERALL ASSESSMENT", "EVALUATION GLOBALE", "APPRECIATION GLOBALE", "EVALUACION GENERAL",
+                "EVALUACION GLOBAL", "GESAMTBEWERTUNG", "GESAMTEINSCHATZUNG", "ALGEHELE BEOORDELING",
+                "TOTAALBEOORDELING", "VALUTAZIONE COMPLESSIVA", "VALUTAZIONE GLOBALE",
+                "AVALIACAO GERAL", "AVALIACAO GLOBAL"],
+    "executive_summary": ["EXECUTIVE SUMMARY", "RESUME EXECUTIF", "SYNTHESE", "RESUMEN EJECUTIVO",
+                          "ZUSAMMENFASSUNG", "MANAGEMENTSAMENVATTING", "SAMENVATTING",
+                          "SINTESI", "RIEPILOGO", "RESUMO EXECUTIVO"],
+    "strengths": ["STRENGTH", "POINTS FORTS", "FORCES", "FORTALEZAS", "PUNTOS FUERTES", "STARKEN",
+                  "STERKE PUNTEN", "STERKTES", "PUNTI DI FORZA", "PONTOS FORTES"],
+    "concerns": ["CONCERN", "POINTS D'ATTENTION", "POINTS DE VIGILANCE", "PREOCCUPATION", "PREOCUPACION",
+                 "BEDENKEN", "AANDACHTSPUNTEN", "ZORGPUNTEN", "PREOCCUPAZIONE", "CRITICITA",
+                 "PREOCUPAC"],
+    "recommendation": ["RECOMMENDATION", "RECOMMANDATION", "RECOMENDACION", "EMPFEHLUNG",
+                       "AANBEVELING", "ADVIES", "RACCOMANDAZIONE", "RECOMENDACAO"]
+}
+
+# Top-level section order of the required note structure (positional fallback)
+SECTION_ORDER = [
+    "overall", "executive_summary", "recent_experience", "requirements",
+    "strengths", "concerns", "trajectory", "soft_skills", "recommendation"
+]
+
+
+# ============================================================================
+# SUMMARY TEMPLATES (one per language offered in the UI)
+# ============================================================================
+
+SUMMARY_TEMPLATES = {
+    "English": {
+        "fit": "Overall fit: {fit_level}{score}.",
+        "score": " (matching score {final_score}/100)",
+        "strengths": "Key strengths: {items}",
+        "concerns": "Primary concerns: {items}",
+        "no_concerns": "Primary concerns: none identified.",
+        "top_criteria": "Strongest criteria: {items}.",
+        "bottom_criteria": "Weakest criteria: {items}.",
+        "recommendation": "Recommendation: {recommendation}{rationale}",
+        "fit_levels": {level: level for level in FIT_LEVELS},
+        "recommendations": {label: label for label in RECOMMENDATIONS}
+    },
+    "French": {
+        "fit": "Adéquation globale : {fit_level}{score}.",
+        "score": " (score de correspondance {final_score}/100)",
+        "strengths": "Points forts : {items}",
+        "concerns": "Principales préoccupations : {items}",
+        "no_concerns": "Principales préoccupations : aucune identifiée.",
+        "top_criteria": "Critères les plus forts : {items}.",
+        "bottom_criteria": "Critères les plus faibles : {items}.",
+        "recommendation": "Recommandation : {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Adéquation exceptionnelle", "Strong Fit": "Forte adéquation",
+            "Good Fit": "Bonne adéquation", "Moderate Fit": "Adéquation modérée",
+            "Weak Fit": "Faible adéquation", "Poor Fit": "Adéquation insuffisante"
+        },
+        "recommendations": {
+            "ADVANCE": "AVANCER", "PROCEED WITH CAUTION": "AVANCER AVEC PRUDENCE",
+            "DO NOT ADVANCE": "NE PAS AVANCER"
+        }
+    },
+    "Spanish": {
+        "fit": "Adecuación general: {fit_level}{score}.",
+        "score": " (puntuación de coincidencia {final_score}/100)",
+        "strengths": "Fortalezas clave: {items}",
+        "concerns": "Principales preocupaciones: {items}",
+        "no_concerns": "Principales preocupaciones: ninguna identificada.",
+        "top_criteria": "Criterios más fuertes: {items}.",
+        "bottom_criteria": "Criterios más débiles: {items}.",
+        "recommendation": "Recomendación: {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Adecuación excepcional", "Strong Fit": "Adecuación fuerte",
+            "Good Fit": "Buena adecuación", "Moderate Fit": "Adecuación moderada",
+            "Weak Fit": "Adecuación débil", "Poor Fit": "Adecuación insuficiente"
+        },
+        "recommendations": {
+            "ADVANCE": "AVANZAR", "PROCEED WITH CAUTION": "AVANZAR CON PRECAUCIÓN",
+            "DO NOT ADVANCE": "NO AVANZAR"
+        }
+    },
+    "German": {
+        "fit": "Gesamteignung: {fit_level}{score}.",
+        "score": " (Matching-Score {final_score}/100)",
+        "strengths": "Wichtigste Stärken: {items}",
+        "concerns": "Hauptbedenken: {items}",
+        "no_concerns": "Hauptbedenken: keine festgestellt.",
+        "top_criteria": "Stärkste Kriterien: {items}.",
+        "bottom_criteria": "Schwächste Kriterien: {items}.",
+        "recommendation": "Empfehlung: {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Herausragende Passung", "Strong Fit": "Starke Passung",
+            "Good Fit": "Gute Passung", "Moderate Fit": "Moderate Passung",
+            "Weak Fit": "Schwache Passung", "Poor Fit": "Ungenügende Passung"
+        },
+        "recommendations": {
+            "ADVANCE": "WEITERVERFOLGEN", "PROCEED WITH CAUTION": "MIT VORSICHT WEITERVERFOLGEN",
+            "DO NOT ADVANCE": "NICHT WEITERVERFOLGEN"
+        }
+    },
+    "Dutch": {
+        "fit": "Algehele match: {fit_level}{score}.",
+        "score": " (matchingscore {final_score}/100)",
+        "strengths": "Belangrijkste sterke punten: {items}",
+        "concerns": "Belangrijkste aandachtspunten: {items}",
+        "no_concerns": "Belangrijkste aandachtspunten: geen vastgesteld.",
+        "top_criteria": "Sterkste criteria: {items}.",
+        "bottom_criteria": "Zwakste criteria: {items}.",
+        "recommendation": "Aanbeveling: {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Uitzonderlijke match", "Strong Fit": "Sterke match",
+            "Good Fit": "Goede match", "Moderate Fit": "Matige match",
+            "Weak Fit": "Zwakke match", "Poor Fit": "Slechte match"
+        },
+        "recommendations": {
+            "ADVANCE": "DOORGAAN", "PROCEED WITH CAUTION": "VOORZICHTIG DOORGAAN",
+            "DO NOT ADVANCE": "NIET DOORGAAN"
+        }
+    },
+    "Italian": {
+        "fit": "Idoneità complessiva: {fit_level}{score}.",
+        "score": " (punteggio di corrispondenza {final_score}/100)",
+        "strengths": "Punti di forza principali: {items}",
+        "concerns": "Principali criticità: {items}",
+        "no_concerns": "Principali criticità: nessuna individuata.",
+        "top_criteria": "Criteri più forti: {items}.",
+        "bottom_criteria": "Criteri più deboli: {items}.",
+        "recommendation": "Raccomandazione: {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Idoneità eccezionale", "Strong Fit": "Idoneità forte",
+            "Good Fit": "Buona idoneità", "Moderate Fit": "Idoneità moderata",
+            "Weak Fit": "Idoneità debole", "Poor Fit": "Idoneità scarsa"
+        },
+        "recommendations": {
+            "ADVANCE": "PROCEDERE", "PROCEED WITH CAUTION": "PROCEDERE CON CAUTELA",
+            "DO NOT ADVANCE": "NON PROCEDERE"
+        }
+    },
+    "Portuguese": {
+        "fit": "Adequação geral: {fit_level}{score}.",
+        "score": " (pontuação de correspondência {final_score}/100)",
+        "strengths": "Principais pontos fortes: {items}",
+        "concerns": "Principais preocupações: {items}",
+        "no_concerns": "Principais preocupações: nenhuma identificada.",
+        "top_criteria": "Critérios mais fortes: {items}.",
+        "bottom_criteria": "Critérios mais fracos: {items}.",
+        "recommendation": "Recomendação: {recommendation}{rationale}",
+        "fit_levels": {
+            "Exceptional Fit": "Adequação excepcional", "Strong Fit": "Adequação forte",
+            "Good Fit": "Boa adequação", "Moderate Fit": "Adequação moderada",
+            "Weak Fit": "Adequação fraca", "Poor Fit": "Adequação insuficiente"
+        },
+        "recommendations": {
+            "ADVANCE": "AVANÇAR", "PROCEED WITH CAUTION": "AVANÇAR COM CAUTELA",
+            "DO NOT ADVANCE": "NÃO AVANÇAR"
+        }
+    }
+}
+
+
+# Short note rendered locally when a required criterion fails the gating
+# threshold (see evaluate_required_gate). Headings use SECTION_KEYWORDS so the
+# note parses like an LLM-written one.
+GATED_NOTE_TEMPLATES = {
+    "English": {
+        "overall": "OVERALL ASSESSMENT", "summary": "EXECUTIVE SUMMARY",
+        "concerns": "AREAS OF CONCERN", "recommendation": "RECOMMENDATION",
+        "summary_text": "The candidate scores below {threshold}/100 on {count} required criteria. "
+                        "The detailed assessment was skipped.",
+        "concern": "{criterion}: {score}/100 (required)",
+        "rationale": "Required criteria not met: {criteria}."
+    },
+    "French": {
+        "overall": "ÉVALUATION GLOBALE", "summary": "RÉSUMÉ EXÉCUTIF",
+        "concerns": "POINTS DE VIGILANCE", "recommendation": "RECOMMANDATION",
+        "summary_text": "Le candidat obtient moins de {threshold}/100 sur {count} critères obligatoires. "
+                        "L'évaluation détaillée n'a pas été réalisée.",
+        "concern": "{criterion} : {score}/100 (obligatoire)",
+        "rationale": "Critères obligatoires non satisfaits : {criteria}."
+    },
+    "Spanish": {
+        "overall": "EVALUACIÓN GENERAL", "summary": "RESUMEN EJECUTIVO",
+        "concerns": "ÁREAS DE PREOCUPACIÓN", "recommendation": "RECOMENDACIÓN",
+        "summary_text": "El candidato obtiene menos de {threshold}/100 en {count} criterios obligatorios. "
+                        "Se omitió la evaluación detallada.",
+        "concern": "{criterion}: {score}/100 (obligatorio)",
+        "rationale": "Criterios obligatorios no cumplidos: {criteria}."
+    },
+    "German": {
+        "overall": "GESAMTBEWERTUNG", "summary": "ZUSAMMENFASSUNG",
+        "concerns": "BEDENKEN", "recommendation": "EMPFEHLUNG",
+        "summary_text": "Der Kandidat erreicht bei {count} Pflichtkriterien weniger als {threshold}/100. "
+                        "Die ausführliche Bewertung wurde übersprungen.",
+        "concern": "{criterion}: {score}/100 (Pflicht)",
+        "rationale": "Nicht erfüllte Pflichtkriterien: {criteria}."
+    },
+    "Dutch": {
+        "overall": "ALGEHELE BEOORDELING", "summary": "MANAGEMENTSAMENVATTING",
+        "concerns": "AANDACHTSPUNTEN", "recommendation": "AANBEVELING",
+        "summary_text": "De kandidaat scoort lager dan {threshold}/100 op {count} verplichte criteria. "
+                        "De uitgebreide beoordeling is overgeslagen.",
+        "concern": "{criterion}: {score}/100 (verplicht)",
+        "rationale": "Niet voldaan aan verplichte criteria: {criteria}."
+    },
+    "Italian": {
+        "overall": "VALUTAZIONE COMPLESSIVA", "summary": "SINTESI",
+        "concerns": "CRITICITÀ", "recommendation": "RACCOMANDAZIONE",
+        "summary_text": "Il candidato ottiene meno di {threshold}/100 su {count} criteri obbligatori. "
+                        "La valutazione dettagliata è stata omessa.",
+        "concern": "{criterion}: {score}/100 (obbligatorio)",
+        "rationale": "Criteri obbligatori non soddisfatti: {criteria}."
+    },
+    "Portuguese": {
+        "overall": "AVALIAÇÃO GERAL", "summary": "RESUMO EXECUTIVO",
+        "concerns": "PREOCUPAÇÕES", "recommendation": "RECOMENDAÇÃO",
+        "summary_text": "O candidato obtém menos de {threshold}/100 em {count} critérios obrigatórios. "
+                        "A avaliação detalhada foi omitida.",
+        "concern": "{criterion}: {score}/100 (obrigatório)",
+        "rationale": "Critérios obrigatórios não cumpridos: {criteria}."
+    }
+}
+
+
+# ============================================================================
+# SCORE CONVERSION RULES (QUALIFICATION_TO_SCORE_CONVERSION_PROMPT)
+# ============================================================================
+
+# (range with at most one concern, range with several concerns) per
+# recommendation and fit level. Where the prompt's ADVANCE ranges overlap the
+# mandatory fit-level boundaries, the intersection is used.
+_CONTRADICTION_RANGES = ((40, 49), (30, 39))
+SCORE_CONVERSION_RANGES = {
+    "ADVANCE": {
+        "Exceptional Fit": ((95, 100), (95, 100)),
+        "Strong Fit": ((85, 89), (85, 89)),
+        "Good Fit": ((75, 79), (75, 79)),
+        "Moderate Fit": ((60, 64), (60, 64)),
+        "Weak Fit": ((40, 49), (30, 39)),
+        "Poor Fit": ((15, 29), (0, 14))
+    },
+    "PROCEED WITH CAUTION": {
+        "Exceptional Fit": ((90, 94), (90, 94)),
+        "Strong Fit": ((85, 89), (80, 84)),
+        "Good Fit": ((72, 79), (65, 71)),
+        "Moderate Fit": ((58, 64), (50, 57)),
+        "Weak Fit": ((40, 49), (30, 39)),
+        "Poor Fit": ((15, 29), (0, 14))
+    },
+    # DO NOT ADVANCE overrides the assessment: a blocking requirement is missing
+    "DO NOT ADVANCE": {
+        "Exceptional Fit": _CONTRADICTION_RANGES,
+        "Strong Fit": _CONTRADICTION_RANGES,
+        "Good Fit": _CONTRADICTION_RANGES,
+        "Moderate Fit": _CONTRADICTION_RANGES,
+        "Weak Fit": _CONTRADICTION_RANGES,
+        "Poor Fit": ((0, 29), (0, 29))
+    }
+}
+
+MAX_SUMMARY_ITEMS = 3
+MAX_ITEM_LENGTH = 160
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def _fold(text: str) -> str:
+    """Strip accents and lowercase text for keyword matching."""
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch)).lower()
+
+
+def _strip_tags(fragment: str) -> str:
+    """Remove HTML tags, unescape entities and collapse whitespace."""
+    text = re.sub(r"<br\s*/?>", " ", fragment, flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", "", text)
+    return re.sub(r"\s+", " ", html.unescape(text)).strip()
+
+
+def clean_qualification_note(qualification_note: str) -> str:
+    """Remove markdown code fences and <div> wrappers around the note HTML."""
+    cleaned = qualification_note.strip()
+    if "```html" in cleaned:
+        cleaned = cleaned.split("```html")[1].split("```")[0].strip()
+    elif "```" in cleaned:
+        cleaned = cleaned.split("```")[1].split("```")[0].strip()
+    cleaned = re.sub(r"<div[^>]*>", "", cleaned)
+    return cleaned.replace("</div>", "")
+
+
+def normalize_fit_level(text: str) -> Optional[str]:
+    """
+    Map a (possibly translated) fit level to its canonical English label.
+
+    A range such as "Moderate to Strong Fit" maps to its lower level, so the
+    local score conversion never overstates the fit.
+
+    Args:
+        text: Fit level text, e.g. "Strong Fit" or "Adéquation forte"
+
+    Returns:
+        Canonical fit level from FIT_LEVELS, or None if not recognized
+    """
+    tokens = set(re.findall(r"[\wß]+", _fold(text)))
+    matched = [level for level in FIT_LEVELS if tokens & FIT_LEVEL_KEYWORDS[level]]
+    return matched[-1] if matched else None
+
+
+def normalize_recommendation(text: str) -> Optional[str]:
+    """
+    Map a (possibly translated) recommendation label to its canonical label.
+
+    Args:
+        text: Recommendation text, e.g. "DO NOT ADVANCE - missing Dutch"
+
+    Returns:
+        "DO NOT ADVANCE", "PROCEED WITH CAUTION", "ADVANCE", or None
+    """
+    folded = _fold(text)
+    for label in RECOMMENDATIONS:
+        for phrase in RECOMMENDATION_PHRASES[label]:
+            if re.search(rf"\b{re.escape(phrase)}\b", folded):
+                return label
+    return None
+
+
+def _section_key(heading: str) -> Optional[str]:
+    """Identify a top-level heading by keyword (any supported language)."""
+    folded = _fold(heading).upper()
+    for key, keywords in SECTION_KEYWORDS.items():
+        if any(keyword in folded for keyword in keywords):
+            return key
+    return None
+
+
+def _split_sections(note_html: str) -> List[tuple]:
+    """
+    Split the note into (heading, body_html) pairs on top-level <b> headings.
+
+    A <b> directly inside <p> or <li> (e.g. the recommendation label or a
+    "Current Role Focus:" item) is content, not a heading.
+    """
+    headings = []
+    for match in re.finditer(r"<b>(.*?)</b>", note_html, flags=re.IGNORECASE | re.DOTALL):
+        preceding = note_html[:match.start()].rstrip()
+        if re.search(r"<(p|li)[^>]*>$", preceding, flags=re.IGNORECASE):
+            continue
+        headings.append(match)
+
+    sections = []
+    for i, match in enumerate(headings):
+        body_end = headings[i + 1].start() if i + 1 < len(headings) else len(note_html)
+        sections.append((_strip_tags(match.group(1)), note_html[match.end():body_end]))
+    return sections
+
+
+def _list_items(body_html: str) -> List[str]:
+    """Return the text of each <li> in a section body."""
+    items = [_strip_tags(item) for item in re.findall(r"<li[^>]*>(.*?)</li>", body_html, flags=re.IGNORECASE | re.DOTALL)]
+    return [item for item in items if item]
+
+
+def parse_qualification_note(qualification_note: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract fit level, strengths, concerns and recommendation from a note.
+
+    Args:
+        qualification_note: HTML qualification note (any supported language)
+
+    Returns:
+        dict with fit_level, fit_level_text, executive_summary, strengths,
+        concerns, recommendation and recommendation_rationale; or None if
+        the fit level or the recommendation cannot be found
+    """
+    if not qualification_note or not qualification_note.strip():
+        return None
+
+    sections = _split_sections(clean_qualification_note(qualification_note))
+    if not sections:
+        return None
+
+    # Identify sections by keyword, fall back to the fixed structure order
+    keyed = {}
+    for heading, body in sections:
+        key = _section_key(heading)
+        if key and key not in keyed:
+            keyed[key] = (heading, body)
+    if len(sections) == len(SECTION_ORDER):
+        for key, section in zip(SECTION_ORDER, sections):
+            keyed.setdefault(key, section)
+    # The note always starts with the overall assessment
+    keyed.setdefault("overall", sections[0])
+
+    # Fit level: text after the colon of the first heading
+    overall_heading, overall_body = keyed["overall"]
+    fit_level_text = overall_heading.split(":", 1)[1].strip() if ":" in overall_heading else overall_heading
+    fit_level = normalize_fit_level(fit_level_text) or normalize_fit_level(_strip_tags(overall_body)[:80])
+
+    # Recommendation: bold label inside the RECOMMENDATION section
+    recommendation = None
+    rationale = ""
+    if "recommendation" in keyed:
+        _, recommendation_body = keyed["recommendation"]
+        label_match = re.search(r"<b>(.*?)</b>", recommendation_body, flags=re.IGNORECASE | re.DOTALL)
+        recommendation_text = _strip_tags(recommendation_body)
+        if label_match:
+            recommendation = normalize_recommendation(_strip_tags(label_match.group(1)))
+            rationale = _strip_tags(recommendation_body[label_match.end():])
+        if recommendation is None:
+            recommendation = normalize_recommendation(recommendation_text[:80])
+            rationale = recommendation_text
+        rationale = rationale.lstrip(" -–—:").strip()
+
+    if fit_level is None or recommendation is None:
+        return None
+
+    executive_summary = _strip_tags(keyed["executive_summary"][1]) if "executive_summary" in keyed else ""
+    strengths = _list_items(keyed["strengths"][1]) if "strengths" in keyed else []
+    concerns = _list_items(keyed["concerns"][1]) if "concerns" in keyed else []
+
+    return {
+        "fit_level": fit_level,
+        "fit_level_text": fit_level_text,
+        "executive_summary": executive_summary,
+        "strengths": strengths,
+        "concerns": concerns,
+        "recommendation": recommendation,
+        "recommendation_rationale": rationale
+    }
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def _shorten(item: str) -> str:
+    """Keep the first sentence of an item, capped at MAX_ITEM_LENGTH chars."""
+    first_sentence = re.split(r"(?<=[.!?])\s", item, maxsplit=1)[0].rstrip(".")
+    if len(first_sentence) > MAX_ITEM_LENGTH:
+        first_sentence = first_sentence[:MAX_ITEM_LENGTH].rsplit(" ", 1)[0] + "…"
+    return first_sentence
+
+
+def _is_none_identified(items: List[str]) -> bool:
+    """True if the only concern says there are none (e.g. "None identified")."""
+    return len(items) == 1 and len(items[0]) < 40 and bool(
+        re.search(r"\b(none|aucun|aucune|ninguna|ninguno|keine|geen|nessuna|nessuno|nenhuma|nenhum)\b", _fold(items[0]))
+    )
+
+
+def score_from_qualification_note(parsed_note: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a parsed note into a matching score without an LLM call.
+
+    Applies the rules of QUALIFICATION_TO_SCORE_CONVERSION_PROMPT: the
+    recommendation selects the rule set ("DO NOT ADVANCE" overrides the
+    assessment and caps the score below 50), the fit level selects the range,
+    and the number of listed concerns picks the upper or lower sub-range.
+
+    Args:
+        parsed_note: Output of parse_qualification_note
+
+    Returns:
+        dict with matching_score, score_range, fit_level, recommendation,
+        num_concerns and contradiction (assessment overridden)
+    """
+    fit_level = parsed_note["fit_level"]
+    recommendation = parsed_note["recommendation"]
+    concerns = parsed_note.get("concerns", [])
+    num_concerns = 0 if _is_none_identified(concerns) else len(concerns)
+
+    few_concerns_range, many_concerns_range = SCORE_CONVERSION_RANGES[recommendation][fit_level]
+    low, high = few_concerns_range if num_concerns <= 1 else many_concerns_range
+
+    return {
+        "matching_score": round((low + high) / 2),
+        "score_range": (low, high),
+        "fit_level": fit_level,
+        "recommendation": recommendation,
+        "num_concerns": num_concerns,
+        "contradiction": recommendation == "DO NOT ADVANCE" and fit_level not in ("Weak Fit", "Poor Fit")
+    }
+
+
+def render_qualification_summary(
+    parsed_note: Dict[str, Any],
+    breakdown: List[Dict[str, Any]] = None,
+    language: str = "English",
+    final_score: int = None
+) -> str:
+    """
+    Render a concise executive summary from a parsed note and score breakdown.
+
+    Args:
+        parsed_note: Output of parse_qualification_note
+        breakdown: Breakdown list from calculate_matching_score (optional)
+        language: Summary language (falls back to English templates)
+        final_score: Final matching score to quote in the fit line (optional)
+
+    Returns:
+        Plain-text summary (3 short paragraphs)
+    """
+    template = SUMMARY_TEMPLATES.get(language, SUMMARY_TEMPLATES["English"])
+
+    score_text = template["score"].format(final_score=final_score) if final_score is not None else ""
+    fit_paragraph = template["fit"].format(
+        fit_level=template["fit_levels"][parsed_note["fit_level"]],
+        score=score_text
+    )
+    if parsed_note.get("executive_summary"):
+        fit_paragraph += " " + parsed_note["executive_summary"]
+
+    strengths = [_shorten(item) for item in parsed_note.get("strengths", [])[:MAX_SUMMARY_ITEMS]]
+    concerns = parsed_note.get("concerns", [])
+
+    lines = []
+    if strengths:
+        lines.append(template["strengths"].format(items="; ".join(strengths) + "."))
+    if concerns and not _is_none_identified(concerns):
+        lines.append(template["concerns"].format(
+            items="; ".join(_shorten(item) for item in concerns[:MAX_SUMMARY_ITEMS]) + "."
+        ))
+    else:
+        lines.append(template["no_concerns"])
+
+    if breakdown:
+        ranked = sorted(breakdown, key=lambda item: item["score"], reverse=True)
+        top = ranked[:2]
+        bottom = [item for item in reversed(ranked) if item not in top][:2]
+        for key, items in [("top_criteria", top), ("bottom_criteria", bottom)]:
+            if items:
+                lines.append(template[key].format(
+                    items=", ".join(f"{item['criterion']} ({item['score']:.0f})" for item in items)
+                ))
+
+    rationale = parsed_note.get("recommendation_rationale", "")
+    recommendation_paragraph = template["recommendation"].format(
+        recommendation=template["recommendations"][parsed_note["recommendation"]],
+        rationale=f" - {rationale}" if rationale else ""
+    )
+
+    return "\n\n".join([fit_paragraph, "\n".join(lines), recommendation_paragraph])
+
+
+def render_gated_note(
+    failed_criteria: List[Dict[str, Any]],
+    threshold: float,
+    language: str = "English"
+) -> str:
+    """
+    Render a short "do not advance" note for a candidate failing required criteria.
+
+    Args:
+        failed_criteria: failed_criteria list from evaluate_required_gate
+        threshold: Gating threshold the criteria scored below
+        language: Note language (falls back to English templates)
+
+    Returns:
+        HTML note in the qualification note structure (Poor Fit, DO NOT ADVANCE)
+    """
+    template = GATED_NOTE_TEMPLATES.get(language, GATED_NOTE_TEMPLATES["English"])
+    labels = SUMMARY_TEMPLATES.get(language, SUMMARY_TEMPLATES["English"])
+
+    concerns = []
+    for item in failed_criteria:
+        concern = template["concern"].format(criterion=item["criterion"], score=f"{item['score']:.0f}")
+        if item.get("gap"):
+            concern += f" - {item['gap']}"
+        concerns.append(f"<li>{html.escape(concern)}</li>")
+
+    summary = template["summary_text"].format(threshold=f"{threshold:.0f}", count=len(failed_criteria))
+    rationale = template["rationale"].format(criteria=", ".join(item["criterion"] for item in failed_criteria))
+
+    return "\n".join([
+        f"<b>{template['overall']}: {labels['fit_levels']['Poor Fit']}</b>",
+        f"<b>{template['summary']}</b>",
+        f"<p>{html.escape(summary)}</p>",
+        f"<b>{template['concerns']}</b>",
+        "<ul>" + "".join(concerns) + "</ul>",
+        f"<b>{template['recommendation']}</b>",
+        f"<p><b>{labels['recommendations']['DO NOT ADVANCE']}</b> - {html.escape(rationale)}</p>"
+    ])
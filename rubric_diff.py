@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Criterion-level rubric diffing and incremental re-scoring.
+
+A criterion score depends on the criterion's name and description and on the
+CV, not on its weight or on the other criteria. After a rubric edit only the
+criteria that were added or whose description changed need new LLM scores;
+the cached scores of every untouched criterion are reused, and weight-only
+changes are applied by recomputing the final score.
+
+Criteria are matched by name, so a renamed criterion counts as removed +
+added (and is re-scored).
+
+USAGE:
+------
+    diff = diff_rubrics(old_rubric, new_rubric)
+    diff.summary()                 # "1 added, 1 changed, 2 reweighted, 0 removed, 5 unchanged"
+
+    # One candidate: LLM call covering only the added/changed criteria
+    criteria_scores = rescore_incrementally(cv_text, old_scores, old_rubric, new_rubric)
+
+    # A whole pipeline: previous score_profiles_concurrently results in, new results out
+    results, failures = rescore_profiles_incrementally(cv_profiles, previous_results, old_rubric, new_rubric)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Callable
+
+from test_matching_score import (
+    EvaluationRubric,
+    CriterionScore,
+    score_criteria_with_llm,
+    score_criteria_subset,
+    calculate_matching_score
+)
+
+
+@dataclass
+class RubricDiff:
+    """Criterion names of a new rubric grouped by how they changed."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)      # description changed: re-score
+    reweighted: List[str] = field(default_factory=list)   # weight / is_required only: keep score
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def to_rescore(self) -> List[str]:
+        """Criteria that need new scores (new rubric order)."""
+        return self.added + self.changed
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.reweighted or self.removed)
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.changed)} changed, {len(self.reweighted)} reweighted, "
+                f"{len(self.removed)} removed, {len(self.unchanged)} unchanged")
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").split()).lower()
+
+
+def diff_rubrics(old: EvaluationRubric, new: EvaluationRubric) -> RubricDiff:
+    """
+    Compare two rubrics criterion by criterion.
+
+    Descriptions are compared ignoring case and whitespace; weights are
+    compared after rounding to 0.1 (weights are normalized floats).
+
+    Args:
+        old: Rubric the cached scores were computed with
+        new: Edited rubric
+
+    Returns:
+        RubricDiff (added/changed/reweighted/unchanged in new rubric order,
+        removed in old rubric order)
+    """
+    old_by_name = {c.name: c for c in old.criteria}
+    new_names = {c.name for c in new.criteria}
+    diff = RubricDiff()
+    for criterion in new.criteria:
+        previous = old_by_name.get(criterion.name)
+        if previous is None:
+            diff.added.append(criterion.name)
+        elif _normalize(previous.description) != _normalize(criterion.description):
+            diff.changed.append(criterion.name)
+        elif round(previous.weight, 1) != round(criterion.weight, 1) or previous.is_required != criterion.is_required:
+            diff.reweighted.append(criterion.name)
+        else:
+            diff.unchanged.append(criterion.name)
+    diff.removed = [c.name for c in old.criteria if c.name not in new_names]
+    return diff
+
+
+def rescore_incrementally(
+    cv_profile: str,
+    old_scores: List[CriterionScore],
+    old_rubric: EvaluationRubric,
+    new_rubric: EvaluationRubric,
+    diff: RubricDiff = None,
+    scorer: Callable[..., List[CriterionScore]] = score_criteria_with_llm,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> List[CriterionScore]:
+    """
+    Scores of a candidate under an edited rubric, re-scoring only what changed.
+
+    Added and changed criteria (and criteria missing from old_scores) are sent
+    to the scorer as a sub-rubric in one call; all other scores are reused.
+
+    Args:
+        cv_profile: The candidate's CV text
+        old_scores: Criterion scores computed with old_rubric
+        old_rubric: Rubric the old scores were computed with
+        new_rubric: Edited rubric
+        diff: Precomputed diff_rubrics(old_rubric, new_rubric) (shared across a batch)
+        scorer: score_criteria_with_llm or a drop-in replacement (e.g. score_criteria_hybrid)
+        model: Optional model name to use
+
+    Returns:
+        List of CriterionScore in new rubric order
+    """
+    diff = diff or diff_rubrics(old_rubric, new_rubric)
+    reusable = set(diff.unchanged) | set(diff.reweighted)
+    cached = {s.criteria_name: s for s in old_scores if s.criteria_name in reusable}
+    remaining = [c for c in new_rubric.criteria if c.name not in cached]
+
+    if remaining:
+        print(f"→ Re-scoring {len(remaining)}/{len(new_rubric.criteria)} criteria "
+              f"({', '.join(c.name for c in remaining)})")
+    else:
+        print(f"✓ No criteria to re-score ({diff.summary()})")
+    return score_criteria_subset(cv_profile, new_rubric, cached, scorer,
+                                 langfuse_parent=langfuse_parent, session_id=session_id, model=model)
+
+
+def scores_from_result(result: Dict) -> List[CriterionScore]:
+    """Rebuild CriterionScore objects from a calculate_matching_score breakdown."""
+    return [
+        CriterionScore(item["criterion"], item["score"], item.get("evidence", ""), item.get("gap", ""))
+        for item in result["breakdown"]
+    ]
+
+
+def rescore_profiles_incrementally(
+    cv_profiles: List[tuple],
+    previous_results: List[tuple],
+    old_rubric: EvaluationRubric,
+    new_rubric: EvaluationRubric,
+    max_workers: int = 8,
+    scorer: Callable[..., List[CriterionScore]] = score_criteria_with_llm,
+    model: str = None
+) -> tuple:
+    """
+    Re-rank scored candidates after a rubric edit.
+
+    Counterpart of score_profiles_concurrently: each candidate gets one small
+    call for the added/changed criteria instead of a full re-score.
+    Candidates without previous results are scored on every criterion.
+
+    Args:
+        cv_profiles: List of (name, cv_text) tuples
+        previous_results: (name, score, result) tuples scored with old_rubric
+        old_rubric: Rubric the previous results were computed with
+        new_rubric: Edited rubric
+        max_workers: Maximum number of concurrent LLM calls
+        scorer: Criteria scorer (see rescore_incrementally)
+        model: Optional model name to use
+
+    Returns:
+        Tuple of (results, failures) in the score_profiles_concurrently format
+    """
+    diff = diff_rubrics(old_rubric, new_rubric)
+    print(f"\n📐 Rubric diff: {diff.summary()}")
+    previous = {name: scores_from_result(result) for name, _, result in previous_results}
+
+    def rescore_one(name: str, cv_profile: str) -> dict:
+        criteria_scores = rescore_incrementally(
+            cv_profile, previous.get(name, []), old_rubric, new_rubric, diff=diff, scorer=scorer, model=model
+        )
+        result = calculate_matching_score(new_rubric, criteria_scores)
+        print(f"\n→ {name}: {result['final_score']}/100")
+        return result
+
+    outcomes = [None] * len(cv_profiles)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(rescore_one, name, cv_profile) for name, cv_profile in cv_profiles]
+        for i, future in enumerate(futures):
+            try:
+                outcomes[i] = ("ok", future.result())
+            except Exception as e:
+                print(f"⚠ Re-scoring failed for {cv_profiles[i][0]}: {e}")
+                outcomes[i] = ("error", str(e))
+
+    results = []
+    failures = []
+    for (name, _), (status, value) in zip(cv_profiles, outcomes):
+        if status == "ok":
+            results.append((name, value["final_score"], value))
+        else:
+            failures.append((name, value))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results, failures
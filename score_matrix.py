@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Vectorized batch scoring: a candidates × criteria matrix of scores.
+
+calculate_matching_score builds a weight map and loops in Python for each
+candidate (with debug prints). To rank thousands of already-scored candidates,
+e.g. after re-weighting a rubric, ScoreMatrix holds the per-criterion scores in
+a float32 NumPy matrix aligned to the rubric's criterion order and computes
+final scores, contributions and rankings with vectorized operations.
+
+Scores follow calculate_matching_score exactly: contribution = score ×
+weight / 100, final score = rounded sum of contributions, and a criterion the
+candidate was not scored on (NaN) contributes nothing. The per-candidate
+breakdown (same structure as calculate_matching_score) is built on demand.
+
+USAGE:
+------
+    matrix = ScoreMatrix.from_results(rubric, results)   # (name, score, result) tuples
+    matrix.final_scores()            # np.ndarray of ints, one per candidate
+    matrix.ranking(top_n=20)         # [(candidate_id, final_score)]
+    matrix.result("alice")           # {"final_score", "total_weight_used", "breakdown"}
+
+    # Re-weight without re-scoring (weights are renormalized to 100)
+    matrix.reweight({"Languages - Dutch": 30, "Location": 0}).ranking(top_n=20)
+"""
+
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+
+from test_matching_score import EvaluationRubric, CriterionScore, reweight_rubric
+
+
+def _match_criterion(name: str, index: Dict[str, int]) -> Optional[int]:
+    """Column of a scored criterion name (exact, then substring match as in calculate_matching_score)."""
+    if name in index:
+        return index[name]
+    lowered = name.lower()
+    for rubric_name, column in index.items():
+        if rubric_name.lower() in lowered or lowered in rubric_name.lower():
+            return column
+    return None
+
+
+class ScoreMatrix:
+    """Per-criterion scores of many candidates against one rubric."""
+
+    def __init__(
+        self,
+        rubric: EvaluationRubric,
+        candidate_ids: Sequence[str],
+        scores: np.ndarray,
+        evidence: List[List[str]] = None,
+        gaps: List[List[str]] = None
+    ):
+        """
+        Args:
+            rubric: The rubric (column order = rubric.criteria order)
+            candidate_ids: One id per row
+            scores: (candidates, criteria) scores; NaN = criterion not scored
+            evidence: Optional evidence text per candidate and criterion
+            gaps: Optional gap text per candidate and criterion
+        """
+        self.rubric = rubric
+        self.candidate_ids = list(candidate_ids)
+        self.scores = np.asarray(scores, dtype=np.float32).reshape(len(self.candidate_ids), len(rubric.criteria))
+        self.weights = np.array([c.weight for c in rubric.criteria], dtype=np.float64)
+        self.evidence = evidence
+        self.gaps = gaps
+        self._rows = {candidate_id: row for row, candidate_id in enumerate(self.candidate_ids)}
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    @classmethod
+    def from_criteria_scores(
+        cls,
+        rubric: EvaluationRubric,
+        scored: List[tuple]
+    ) -> "ScoreMatrix":
+        """
+        Build the matrix from (candidate_id, List[CriterionScore]) tuples.
+
+        Criterion names are matched to rubric columns like
+        calculate_matching_score does; unmatched scores are dropped.
+        """
+        index = {c.name: column for column, c in enumerate(rubric.criteria)}
+        scores = np.full((len(scored), len(rubric.criteria)), np.nan, dtype=np.float32)
+        evidence = [[""] * len(rubric.criteria) for _ in scored]
+        gaps = [[""] * len(rubric.criteria) for _ in scored]
+        for row, (_, criteria_scores) in enumerate(scored):
+            for criterion_score in criteria_scores:
+                column = _match_criterion(criterion_score.criteria_name, index)
+                if column is None:
+                    continue
+                scores[row, column] = criterion_score.score
+                evidence[row][column] = criterion_score.evidence or ""
+                gaps[row][column] = criterion_score.gap or ""
+        return cls(rubric, [candidate_id for candidate_id, _ in scored], scores, evidence, gaps)
+
+    @classmethod
+    def from_results(cls, rubric: EvaluationRubric, results: List[tuple]) -> "ScoreMatrix":
+        """Build the matrix from score_profiles_concurrently results ((name, score, result) tuples)."""
+        return cls.from_criteria_scores(rubric, [
+            (name, [
+                CriterionScore(item["criterion"], item["score"], item.get("evidence", ""), item.get("gap", ""))
+                for item in result["breakdown"]
+            ])
+            for name, _, result in results
+        ])
+
+    def reweight(self, weights: Dict[str, float]) -> "ScoreMatrix":
+        """
+        Same scores under new criterion weights (see reweight_rubric).
+
+        The score matrix is shared, not copied, so re-weighting thousands of
+        candidates only recomputes the final scores.
+
+        Args:
+            weights: New (relative) weight per criterion name
+
+        Returns:
+            New ScoreMatrix with the re-weighted rubric
+        """
+        return ScoreMatrix(reweight_rubric(self.rubric, weights), self.candidate_ids, self.scores, self.evidence, self.gaps)
+
+    def contributions(self) -> np.ndarray:
+        """(candidates, criteria) contributions score × weight / 100 (0 where not scored)."""
+        return np.nan_to_num(self.scores * (self.weights / 100).astype(np.float32), nan=0.0)
+
+    def _final(self, scores: np.ndarray) -> np.ndarray:
+        scored = ~np.isnan(scores)
+        weights = self.weights
+        total_weight = scored @ weights
+
+        # Accumulate column by column in float64, in the same order and with the
+        # same operations as calculate_matching_score, so .5 cases round alike
+        weighted = np.zeros(len(scores), dtype=np.float64)
+        for column, weight in enumerate(weights):
+            weighted += np.where(scored[:, column], scores[:, column], 0).astype(np.float64) * (weight / 100)
+
+        # Candidates matching no weighted criterion fall back to the plain average
+        with np.errstate(invalid="ignore"):
+            average = np.nanmean(np.where(scored, scores, np.nan), axis=1)
+        final = np.where(total_weight > 0, weighted, np.nan_to_num(average, nan=0.0))
+        return np.rint(final).astype(np.int64)
+
+    def final_scores(self) -> np.ndarray:
+        """Final matching score per candidate (ints, same rounding as calculate_matching_score)."""
+        return self._final(self.scores)
+
+    def ranking(self, top_n: int = None) -> List[tuple]:
+        """(candidate_id, final_score) sorted by score (descending, ties keep row order)."""
+        final = self.final_scores()
+        order = np.argsort(-final, kind="stable")
+        if top_n is not None:
+            order = order[:top_n]
+        return [(self.candidate_ids[row], int(final[row])) for row in order]
+
+    def result(self, candidate_id: str) -> Dict[str, Any]:
+        """
+        Score breakdown of one candidate.
+
+        Returns:
+            dict with final_score, total_weight_used and breakdown (same
+            structure as calculate_matching_score)
+        """
+        row = self._rows[candidate_id]
+        breakdown = []
+        total_weight = 0.0
+        for column, criterion in enumerate(self.rubric.criteria):
+            score = float(self.scores[row, column])
+            if np.isnan(score) or criterion.weight <= 0:
+                continue
+            score = int(score) if score.is_integer() else score
+            contribution = score * (criterion.weight / 100)
+            total_weight += criterion.weight
+            breakdown.append({
+                "criterion": criterion.name,
+                "score": score,
+                "weight": criterion.weight,
+                "contribution": round(contribution, 2),
+                "evidence": self.evidence[row][column] if self.evidence else "",
+                "gap": self.gaps[row][column] if self.gaps else ""
+            })
+        return {
+            "final_score": int(self._final(self.scores[row:row + 1])[0]),
+            "total_weight_used": total_weight,
+            "breakdown": breakdown
+        }
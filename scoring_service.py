@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Headless HTTP scoring service (stdlib http.server, JSON in / JSON out).
+
+Exposes the evaluation pipeline to other systems (e.g. an ATS) without going
+through the Streamlit UI. All requests share one OpenRouter connection pool,
+one step cache (rubrics, scores, notes memoized by input hash) and a
+process-wide limit on in-flight LLM calls.
+
+ENDPOINTS:
+----------
+    POST /rubric    {"job_posting": "..."}
+                    -> {"rubric": {...}, "timings": {...}}
+    POST /score     {"job_posting": "...", "cv_text": "..."}
+                    -> {"final_score": 72.5, "breakdown": [...], "timings": {...}}
+    POST /evaluate  {"job_posting": "...", "cv_text": "...", "language": "French"}
+                    -> score + qualification_note, qualification_summary, qualification_score
+    POST /batch     {"job_posting": "...", "candidates": [{"candidate_id": "c1", "cv_text": "..."}]}
+                    -> {"results": [...ranked...], "failures": [...], "timings": {...}}
+    GET  /health    -> {"status": "ok"}
+    GET  /stats     -> request counts, cache size, LLM concurrency limit
+
+Optional fields on POST requests: model, use_cache (default true),
+prompt_version, prompt_label, session_id; /evaluate also accepts fused,
+local_summary and gating ({"action": "skip" | "downgrade" | "off",
+"threshold": 40}; default off) and returns the gate decision.
+"timings" holds per-step durations in seconds plus "total".
+
+USAGE:
+------
+    python scoring_service.py --port 8000 --max-in-flight 8
+
+    # End-to-end testing against a local fake OpenRouter:
+    OPENROUTER_BASE_URL=http://127.0.0.1:9000/chat python scoring_service.py
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Optional
+
+import test_matching_score
+from test_matching_score import convert_qualification_to_score, set_llm_concurrency, GatingPolicy, GATING_ACTIONS
+from evaluation_pipeline import build_evaluation_pipeline, StepCache, PipelineRun
+
+
+class BadRequest(ValueError):
+    """Invalid or incomplete request body (HTTP 400)."""
+
+
+def _timings(run: PipelineRun) -> Dict[str, float]:
+    timings = {name: round(duration, 3) for name, duration in run.step_times.items()}
+    timings["total"] = round(run.total_time, 3)
+    return timings
+
+
+class ScoringService:
+    """Shared state and request handlers of the HTTP service."""
+
+    def __init__(self, cache_entries: int = 1024, batch_workers: int = 8):
+        self.cache = StepCache(max_entries=cache_entries)
+        self.pipelines = {
+            (fused, local_summary): build_evaluation_pipeline(fused=fused, local_summary=local_summary, cache=self.cache)
+            for fused in (False, True)
+            for local_summary in (False, True)
+        }
+        self.batch_executor = ThreadPoolExecutor(max_workers=batch_workers)
+        self.request_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _context(self, body: Dict[str, Any], required: tuple) -> Dict[str, Any]:
+        missing = [name for name in required if not body.get(name)]
+        if missing:
+            raise BadRequest(f"Missing required field(s): {', '.join(missing)}")
+        return {
+            "job_posting": body.get("job_posting"),
+            "cv_text": body.get("cv_text"),
+            "language": body.get("language", "English"),
+            "model": body.get("model"),
+            "use_cache": body.get("use_cache", True),
+            "prompt_version": body.get("prompt_version"),
+            "prompt_label": body.get("prompt_label"),
+            "gating_policy": self._gating_policy(body.get("gating")),
+            "session_id": body.get("session_id"),
+            "langfuse_parent": None
+        }
+
+    def _gating_policy(self, gating: Optional[Dict[str, Any]]) -> Optional[GatingPolicy]:
+        if not gating:
+            return None
+        if not isinstance(gating, dict):
+            raise BadRequest("gating must be an object")
+        try:
+            policy = GatingPolicy(**gating)
+        except TypeError as e:
+            raise BadRequest(f"Invalid gating policy: {e}")
+        if policy.action not in GATING_ACTIONS:
+            raise BadRequest(f"Unknown gating action '{policy.action}' (expected one of {GATING_ACTIONS})")
+        return policy
+
+    def _score(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        run = self.pipelines[(False, True)].run(context, targets=["result"])
+        result = run.outputs["result"]
+        return {
+            "final_score": result["final_score"],
+            "breakdown": result["breakdown"],
+            "timings": _timings(run),
+            "cached_steps": run.cached_steps
+        }
+
+    def rubric(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        run = self.pipelines[(False, True)].run(self._context(body, ("job_posting",)), targets=["rubric"])
+        return {"rubric": asdict(run.outputs["rubric"]), "timings": _timings(run), "cached_steps": run.cached_steps}
+
+    def score(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self._score(self._context(body, ("job_posting", "cv_text")))
+
+    def evaluate(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        context = self._context(body, ("job_posting", "cv_text"))
+        pipeline = self.pipelines[(bool(body.get("fused", False)), bool(body.get("local_summary", True)))]
+        run = pipeline.run(context)
+        result = run.outputs["result"]
+        try:
+            qualification_score = convert_qualification_to_score(run.outputs["qualification_note"], llm_fallback=False)
+        except ValueError:
+            qualification_score = None
+        return {
+            "final_score": result["final_score"],
+            "breakdown": result["breakdown"],
+            "qualification_note": run.outputs["qualification_note"],
+            "qualification_summary": run.outputs["qualification_summary"],
+            "qualification_score": qualification_score,
+            "gate": run.outputs.get("gate"),
+            "timings": _timings(run),
+            "cached_steps": run.cached_steps
+        }
+
+    def batch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        start_time = time.time()
+        context = self._context(body, ("job_posting",))
+        candidates = body.get("candidates") or []
+        if not candidates:
+            raise BadRequest("Missing required field(s): candidates")
+        if not isinstance(candidates, list) or not all(isinstance(c, dict) for c in candidates):
+            raise BadRequest("candidates must be a list of objects")
+
+        # Candidates without an id or CV text are reported, not scored
+        results = []
+        failures = []
+        valid = []
+        for candidate in candidates:
+            missing = [f for f in ("candidate_id", "cv_text") if not str(candidate.get(f) or "").strip()]
+            if missing:
+                failures.append({"candidate_id": candidate.get("candidate_id"),
+                                 "error": f"Missing required field(s): {', '.join(missing)}"})
+            else:
+                valid.append(candidate)
+
+        # The rubric is extracted once (single-flight in the shared cache)
+        # before the candidates are scored concurrently
+        if valid:
+            self.pipelines[(False, True)].run(context, targets=["rubric"])
+        futures = [
+            (candidate, self.batch_executor.submit(self._score, dict(context, cv_text=candidate["cv_text"])))
+            for candidate in valid
+        ]
+        for candidate, future in futures:
+            try:
+                results.append({"candidate_id": candidate.get("candidate_id"), **future.result()})
+            except Exception as e:
+                failures.append({"candidate_id": candidate.get("candidate_id"), "error": str(e)})
+        results.sort(key=lambda r: r["final_score"], reverse=True)
+        return {
+            "results": results,
+            "failures": failures,
+            "timings": {"total": round(time.time() - start_time, 3)}
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self.request_counts)
+        return {
+            "requests": counts,
+            "cache_entries": len(self.cache),
+            "llm_max_in_flight": test_matching_score.LLM_MAX_IN_FLIGHT,
+            "llm_calls_logged": len(test_matching_score.LLM_CALL_LOG)
+        }
+
+    def count(self, path: str):
+        with self._lock:
+            self.request_counts[path] = self.request_counts.get(path, 0) + 1
+
+
+def make_handler(service: ScoringService):
+    """Build a request handler class bound to a ScoringService."""
+    routes = {
+        "/rubric": service.rubric,
+        "/score": service.score,
+        "/evaluate": service.evaluate,
+        "/batch": service.batch
+    }
+
+    class ScoringRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status: int, payload: Dict[str, Any]):
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            elif self.path == "/stats":
+                self._send_json(200, service.stats())
+            else:
+                self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+
+        def do_POST(self):
+            handler = routes.get(self.path)
+            if handler is None:
+                self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+                return
+            service.count(self.path)
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, dict):
+                    raise ValueError("Request body must be a JSON object")
+            except ValueError as e:
+                self._send_json(400, {"error": f"Invalid request: {e}"})
+                return
+            try:
+                self._send_json(200, handler(body))
+            except BadRequest as e:
+                self._send_json(400, {"error": str(e)})
+            except ValueError as e:
+                # OpenRouter errors and unparseable LLM responses
+                self._send_json(502, {"error": str(e)})
+            except Exception as e:
+                self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+        def log_message(self, format, *args):
+            print(f"🌐 {self.address_string()} {format % args}")
+
+    return ScoringRequestHandler
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    max_in_flight: int = None,
+    batch_workers: int = 8
+) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server (call serve_forever() to start it).
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 = pick a free port)
+        max_in_flight: Optional process-wide limit on concurrent LLM calls
+        batch_workers: Candidates scored concurrently per /batch request
+
+    Returns:
+        ThreadingHTTPServer with a .service attribute (ScoringService)
+    """
+    if max_in_flight:
+        set_llm_concurrency(max_in_flight)
+    service = ScoringService(batch_workers=batch_workers)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP scoring service for candidate evaluation.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help=f"Max concurrent LLM calls (default: {test_matching_score.LLM_MAX_IN_FLIGHT})")
+    parser.add_argument("--batch-workers", type=int, default=8, help="Candidates scored concurrently per /batch request")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.max_in_flight, args.batch_workers)
+    print(f"🚀 Scoring service listening on http://{args.host}:{server.server_address[1]} "
+          f"(LLM: {test_matching_score.OPENROUTER_BASE_URL}, max in flight: {test_matching_score.LLM_MAX_IN_FLIGHT})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,6 @@ import streamlit as st
 import sys
 import os
 from pathlib import Path
-import io
 import json
 
 # Add the current directory to path to import from test_matching_score
@@ -24,33 +23,21 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Note: We'll need to dynamically update the API key in the module
 import test_matching_score
 from test_matching_score import (
-    extract_rubric_with_llm,
-    score_criteria_with_llm,
-    calculate_matching_score,
-    generate_qualification_note,
-    generate_qualification_summary,
+    convert_qualification_to_score,
+    supports_fused_evaluation,
     EvaluationRubric,
-    CriterionScore
+    CriterionScore,
+    GatingPolicy,
+    GATING_ACTIONS,
+    reweight_rubric
 )
 
-# PDF extraction - try both libraries
-PDF_LIBRARY = None
-try:
-    import PyPDF2
-    PDF_LIBRARY = "PyPDF2"
-except ImportError:
-    pass
-
-try:
-    import pdfplumber
-    if PDF_LIBRARY is None:
-        PDF_LIBRARY = "pdfplumber"
-except ImportError:
-    pass
+from evaluation_pipeline import build_evaluation_pipeline, StepCache, SpeculativeStepRunner
+from score_matrix import ScoreMatrix
 
-if PDF_LIBRARY is None:
-    # Will show error when user tries to upload
-    pass
+# PDF extraction (PyPDF2 or pdfplumber, see cv_text.py)
+from cv_text import PDF_LIBRARY, extract_pdf_text, extract_pdf_pages
+from cv_compaction import compact_cv_text
 
 # Load .env file if it exists
 try:
@@ -109,28 +96,7 @@ def extract_text_from_pdf(pdf_file) -> str:
         return ""
     
     try:
-        # Reset file pointer to beginning
-        pdf_file.seek(0)
-        
-        if PDF_LIBRARY == "PyPDF2":
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
-        else:  # pdfplumber
-            # Create a copy of file bytes for pdfplumber
-            pdf_file.seek(0)
-            pdf_bytes = pdf_file.read()
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text.strip()
+        return extract_pdf_text(pdf_file)
     except Exception as e:
         st.error(f"Error extracting text from PDF: {str(e)}")
         import traceback
@@ -138,6 +104,24 @@ def extract_text_from_pdf(pdf_file) -> str:
         return ""
 
 
+# Minimum posting length before rubric extraction starts in the background
+SPECULATIVE_MIN_POSTING_CHARS = 200
+
+# Display labels for evaluation pipeline steps
+STEP_LABELS = {
+    "rubric_extraction": "Rubric Extraction",
+    "cv_profiling": "CV Profiling",
+    "criteria_scoring": "Criteria Scoring",
+    "hybrid_criteria_scoring": "Criteria Scoring (local + LLM)",
+    "fused_evaluation": "Fused Scoring + Note + Summary",
+    "score_calculation": "Score Calculation",
+    "required_gate": "Required Criteria Gate",
+    "qualification_note": "Qualification Note",
+    "qualification_summary": "Qualification Summary",
+    "local_summary": "Qualification Summary (local)"
+}
+
+
 def format_score_color(score: int) -> str:
     """Return color based on score."""
     if score >= 80:
@@ -148,6 +132,300 @@ def format_score_color(score: int) -> str:
         return "red"
 
 
+def render_weight_controls(evaluation: dict) -> EvaluationRubric:
+    """
+    Criterion weight editor; returns the rubric with the edited weights.
+    
+    Criterion scores do not depend on the weights, so the final score is
+    recomputed locally (no LLM call) whenever a weight changes.
+    """
+    rubric = evaluation["rubric"]
+    with st.expander("⚖️ Adjust criterion weights"):
+        st.caption("Weights are renormalized to 100%. Scores are recomputed instantly from the existing criterion scores.")
+        weights = {}
+        columns = st.columns(3)
+        for i, criterion in enumerate(rubric.criteria):
+            with columns[i % 3]:
+                weights[criterion.name] = st.number_input(
+                    criterion.name,
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=round(criterion.weight, 1),
+                    step=1.0,
+                    key=f"weight_{evaluation['id']}_{i}"
+                )
+    if all(abs(weights[c.name] - round(c.weight, 1)) < 1e-9 for c in rubric.criteria):
+        return rubric
+    try:
+        return reweight_rubric(rubric, weights)
+    except ValueError as e:
+        st.warning(f"⚠️ {e} - keeping the original weights")
+        return rubric
+
+
+def render_results(evaluation: dict):
+    """Render the results of the last evaluation (kept in session state)."""
+    criteria_scores = evaluation["criteria_scores"]
+    qualification_note = evaluation["qualification_note"]
+    qualification_summary = evaluation["qualification_summary"]
+    gate = evaluation["gate"]
+    
+    # Display Results
+    st.divider()
+    st.header("📊 Results")
+    
+    # Re-weighting: recompute the final score from the stored criterion scores
+    rubric = render_weight_controls(evaluation)
+    if rubric is evaluation["rubric"]:
+        result = evaluation["result"]
+    else:
+        result = ScoreMatrix.from_criteria_scores(rubric, [("candidate", criteria_scores)]).result("candidate")
+        st.info(f"⚖️ Re-weighted score: {result['final_score']}% (original: {evaluation['result']['final_score']}%)")
+    
+    # Final Score - Large Display
+    final_score = result["final_score"]
+    score_color = format_score_color(final_score)
+    
+    col_score1, col_score2, col_score3 = st.columns([1, 2, 1])
+    with col_score2:
+        st.markdown(f"""
+        <div style="text-align: center; padding: 20px;">
+            <h2 style="color: {score_color}; margin-bottom: 10px;">Final Matching Score</h2>
+            <h1 style="font-size: 72px; color: {score_color}; margin: 0;">{final_score}%</h1>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Qualification-based score (local conversion of the note, no LLM call)
+        try:
+            qualification_score = convert_qualification_to_score(qualification_note, llm_fallback=False)
+            st.caption(
+                f"Qualification note: **{qualification_score['fit_level']}** · "
+                f"**{qualification_score['recommendation']}** → {qualification_score['matching_score']}/100"
+                + (" (recommendation overrides assessment)" if qualification_score["contradiction"] else "")
+            )
+        except ValueError:
+            qualification_score = None
+    
+    # Gating decision (required criteria below threshold)
+    if gate and gate["failed_criteria"]:
+        failed = ", ".join(f"{c['criterion']} ({c['score']:.0f})" for c in gate["failed_criteria"])
+        if gate["action"] == "skip":
+            st.warning(f"🚧 Required criteria below {gate['threshold']:.0f}: {failed}. "
+                       "Qualification note rendered locally (no LLM call).")
+        elif gate["action"] == "downgrade":
+            st.warning(f"🚧 Required criteria below {gate['threshold']:.0f}: {failed}. "
+                       f"Brief qualification note written with `{gate['model']}`.")
+        else:
+            st.warning(f"⚠️ Required criteria below {gate['threshold']:.0f}: {failed}.")
+    
+    st.divider()
+    
+    # Rubric Criteria
+    st.subheader("📋 Evaluation Criteria")
+    st.markdown(f"**Total Criteria:** {len(rubric.criteria)} | **Total Weight:** {rubric.total_weight:.1f}%")
+    
+    criteria_df_data = []
+    for criterion in rubric.criteria:
+        criteria_df_data.append({
+            "Criterion": criterion.name,
+            "Weight": f"{criterion.weight:.1f}%",
+            "Description": criterion.description,
+            "Required": "✅ Yes" if criterion.is_required else "⚪ Preferred"
+        })
+    
+    st.dataframe(
+        criteria_df_data,
+        width="stretch",
+        hide_index=True
+    )
+    
+    st.divider()
+    
+    # Summary Table
+    st.subheader("📊 Score Summary")
+    summary_data = []
+    empty_evidence_count = 0
+    
+    for breakdown_item in result["breakdown"]:
+        # Get evidence and gap, ensuring they're strings
+        evidence = breakdown_item.get("evidence", "") or ""
+        gap = breakdown_item.get("gap", "") or ""
+        
+        # Track empty evidence
+        if not evidence:
+            empty_evidence_count += 1
+        
+        # Use fallback text if empty
+        if not evidence:
+            evidence = "No evidence provided by AI"
+        if not gap and breakdown_item["score"] < 80:
+            gap = "Score below 80 - review recommended"
+        
+        summary_data.append({
+            "Criterion": breakdown_item["criterion"],
+            "Score": breakdown_item["score"],
+            "Weight": f"{breakdown_item['weight']:.1f}%",
+            "Contribution": f"{breakdown_item['contribution']:.2f}",
+            "Evidence": evidence,
+            "Gap": gap
+        })
+    
+    # Show warning if many empty evidence fields
+    if empty_evidence_count > 0:
+        st.warning(f"⚠️ {empty_evidence_count} out of {len(summary_data)} criteria have no evidence. The AI may not be returning evidence/gap fields correctly.")
+    
+    # Show debug info if needed
+    with st.expander("🔍 Debug Info (Click to see raw data)"):
+        st.json({
+            "breakdown_sample": result["breakdown"][0] if result["breakdown"] else None,
+            "criteria_scores_sample": {
+                "criteria_name": criteria_scores[0].criteria_name if criteria_scores else None,
+                "score": criteria_scores[0].score if criteria_scores else None,
+                "evidence": criteria_scores[0].evidence if criteria_scores else None,
+                "gap": criteria_scores[0].gap if criteria_scores else None,
+            } if criteria_scores else None,
+            "all_criteria_scores": [
+                {
+                    "criteria_name": cs.criteria_name,
+                    "score": cs.score,
+                    "evidence": cs.evidence,
+                    "gap": cs.gap
+                }
+                for cs in criteria_scores
+            ]
+        })
+    
+    st.dataframe(
+        summary_data,
+        width="stretch",
+        hide_index=True
+    )
+    
+    # Download results as JSON
+    st.divider()
+    
+    # Qualification Summary Display
+    st.header("📄 Qualification Summary")
+    st.markdown("""
+    A concise executive summary of the candidate's qualification assessment.
+    """)
+    st.info(qualification_summary)
+    
+    st.divider()
+    
+    # Qualification Note Display
+    st.header("📝 Candidate Qualification Note")
+    st.markdown("""
+    This comprehensive assessment provides a detailed analysis of the candidate's fit for the role,
+    based on recent experience, career trajectory, and requirements alignment.
+    """)
+    
+    # Clean and display the HTML-formatted qualification note
+    import re
+    
+    cleaned_note = qualification_note.strip()
+    
+    # Remove code block markers if present
+    if "```html" in cleaned_note:
+        cleaned_note = cleaned_note.split("```html")[1].split("```")[0].strip()
+    elif "```" in cleaned_note:
+        cleaned_note = cleaned_note.split("```")[1].split("```")[0].strip()
+    
+    # Remove any <div> wrappers from the LLM response (including the qual-note-container div)
+    cleaned_note = re.sub(r'<div[^>]*>', '', cleaned_note)
+    cleaned_note = cleaned_note.replace('</div>', '')
+    
+    # Remove any remaining HTML artifacts that might show as raw text
+    cleaned_note = re.sub(r'^\s*<[^>]+>\s*$', '', cleaned_note, flags=re.MULTILINE)
+    
+    print(f"✓ Cleaned note (first 300 chars): {cleaned_note[:300]}")
+    
+    # Add CSS styling for better presentation
+    qualification_html = f"""
+    <style>
+        .qual-note-container {{
+            background-color: #f8f9fa;
+            padding: 25px;
+            border-radius: 10px;
+            border-left: 5px solid #007bff;
+            margin: 20px 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        .qual-note-container b {{
+            color: #1e3a8a;
+            font-size: 1.15em;
+            display: block;
+            margin: 20px 0 10px 0;
+        }}
+        .qual-note-container ul {{
+            margin: 10px 0;
+            padding-left: 25px;
+            list-style-type: disc;
+        }}
+        .qual-note-container li {{
+            margin: 10px 0;
+            line-height: 1.7;
+            color: #374151;
+        }}
+        .qual-note-container p {{
+            margin: 12px 0;
+            line-height: 1.8;
+            color: #374151;
+        }}
+        .qual-note-container li b {{
+            display: inline;
+            font-size: 1em;
+            margin: 0;
+        }}
+    </style>
+    
+        {cleaned_note}
+    
+    """
+    
+    # Display with proper HTML rendering
+    st.markdown(qualification_html, unsafe_allow_html=True)
+    
+    st.divider()
+    st.subheader("💾 Export Results")
+    
+    results_json = {
+        "final_score": final_score,
+        "qualification_score": qualification_score["matching_score"] if qualification_score else None,
+        "qualification_summary": qualification_summary,
+        "qualification_note": qualification_note,
+        "rubric": {
+            "criteria": [
+                {
+                    "name": c.name,
+                    "weight": c.weight,
+                    "description": c.description,
+                    "is_required": c.is_required
+                }
+                for c in rubric.criteria
+            ]
+        },
+        "criteria_scores": [
+            {
+                "criteria_name": cs.criteria_name,
+                "score": cs.score,
+                "evidence": cs.evidence,
+                "gap": cs.gap
+            }
+            for cs in criteria_scores
+        ],
+        "breakdown": result["breakdown"],
+        "gate": gate
+    }
+    
+    st.download_button(
+        label="📥 Download Results as JSON",
+        data=json.dumps(results_json, indent=2),
+        file_name="matching_score_results.json",
+        mime="application/json"
+    )
+
+
 def main():
     st.set_page_config(
         page_title="Candidate Matching Score V2",
@@ -218,6 +496,79 @@ def main():
         
         st.caption(f"Selected: `{selected_model}`")
         
+        # Fused evaluation: scores, note and summary in one LLM call (default per model)
+        use_fused_evaluation = st.checkbox(
+            "⚡ Fused evaluation (single LLM call)",
+            value=supports_fused_evaluation(selected_model),
+            key=f"fused_evaluation_{selected_model}",
+            help="Score criteria, write the qualification note and the summary in one LLM call instead of three"
+        )
+        
+        # Local summary: render step 5 from the note structure instead of an LLM call
+        use_local_summary = st.checkbox(
+            "🧾 Local summary (no LLM call)",
+            value=True,
+            disabled=use_fused_evaluation,
+            help="Build the qualification summary from the note's structure; falls back to the LLM if the note cannot be parsed"
+        )
+        
+        # Local scorers: experience years and languages scored from the CV text
+        use_local_criteria = st.checkbox(
+            "🧮 Score experience years & languages locally",
+            value=False,
+            disabled=use_fused_evaluation,
+            help="Compute these criteria from CV dates and stated language levels; only the other criteria are sent to the LLM"
+        )
+        
+        # Compact profile: score on a structured CV extract (cached per CV) instead of the full text
+        use_compact_profile = st.checkbox(
+            "🗜️ Score on compact CV profile",
+            value=False,
+            disabled=use_fused_evaluation,
+            help="Extract roles, education, skills and languages once per CV (cached) and send that instead of the full CV for scoring"
+        )
+        
+        # Compaction: strip page furniture, contact details and low-value sections from the CV
+        use_cv_compaction = st.checkbox(
+            "✂️ Compact CV text",
+            value=False,
+            help="Remove repeated headers/footers, page numbers, contact details, references and long hobby sections, "
+                 "and list recent experience first; the compacted CV is used for scoring and the note"
+        )
+        cv_token_budget = st.number_input(
+            "CV token budget (0 = no limit):",
+            min_value=0,
+            max_value=20000,
+            value=0,
+            step=250,
+            disabled=not use_cv_compaction,
+            help="Above this size, interests, projects and the details of the oldest roles are trimmed first"
+        )
+        
+        # Gating: skip or downgrade the note when a required criterion fails
+        gating_labels = {
+            "off": "Off (always write the full note)",
+            "skip": "Skip note (local \"do not advance\" note)",
+            "downgrade": "Brief note with a cheaper model"
+        }
+        gating_action = st.selectbox(
+            "🚧 Failed required criteria:",
+            options=GATING_ACTIONS,
+            index=GATING_ACTIONS.index("off"),
+            format_func=gating_labels.get,
+            disabled=use_fused_evaluation,
+            help="What to do with the qualification note when a required criterion scores below the threshold"
+        )
+        gating_threshold = st.slider(
+            "Required criterion threshold",
+            min_value=0,
+            max_value=100,
+            value=40,
+            step=5,
+            disabled=use_fused_evaluation or gating_action == "off"
+        )
+        gating_policy = GatingPolicy(threshold=float(gating_threshold), action=gating_action)
+        
         st.divider()
         
         # Cache option
@@ -274,6 +625,28 @@ def main():
             height=300,
             placeholder="Paste the full job description here..."
         )
+        
+        # Speculative rubric extraction: start extracting as soon as the posting
+        # settles, so the evaluation can start at criteria scoring
+        if api_key and len(job_posting.strip()) >= SPECULATIVE_MIN_POSTING_CHARS:
+            rubric_status = st.session_state.setdefault(
+                "rubric_prefetcher", SpeculativeStepRunner("rubric_extraction", delay=1.0)
+            ).schedule(
+                build_evaluation_pipeline(cache=st.session_state.setdefault("pipeline_cache", StepCache())),
+                {
+                    "job_posting": job_posting,
+                    "model": selected_model,
+                    "use_cache": use_cache,
+                    "prompt_version": prompt_version,
+                    "prompt_label": prompt_label,
+                    "session_id": None,
+                    "langfuse_parent": None
+                }
+            )
+            if rubric_status == "ready":
+                st.caption("⚡ Rubric ready")
+            elif rubric_status != "missing":
+                st.caption("⏳ Extracting rubric in the background...")
     
     with col2:
         st.header("📄 Candidate CV")
@@ -325,6 +698,25 @@ def main():
             
             if cv_text:
                 st.info(f"✅ CV text received ({len(cv_text)} chars, ~{len(cv_text.split())} words)")
+        
+        if cv_text and use_cv_compaction:
+            # Page boundaries let compaction recognize repeated headers/footers
+            pages = None
+            if uploaded_file is not None:
+                try:
+                    pages = extract_pdf_pages(uploaded_file)
+                except Exception:
+                    pages = None
+            compacted = compact_cv_text(pages or cv_text, token_budget=cv_token_budget or None)
+            cv_text = compacted.text
+            st.info(f"✂️ Compacted CV: {compacted.summary()}")
+            with st.expander("✂️ Preview compacted text"):
+                st.text_area(
+                    "Compacted CV Text:",
+                    value=cv_text,
+                    height=200,
+                    disabled=True
+                )
     
     # Process button
     st.divider()
@@ -348,10 +740,7 @@ def main():
         status_text = st.empty()
         timing_container = st.empty()
         
-        # Track timing for each step
         import time
-        step_times = {}
-        total_start = time.time()
         
         try:
             candidate_name = uploaded_file.name if uploaded_file else "unknown"
@@ -367,116 +756,59 @@ def main():
                 session_id = f"streamlit-{hashlib.md5(f'{candidate_name}-{time.time()}'.encode()).hexdigest()[:12]}"
                 st.info(f"🔍 Langfuse tracking | Session: `{session_id}` | Version: {prompt_version or 'latest'}")
             
-            # Step 1: Extract Rubric
-            step1_start = time.time()
-            status_text.text("📋 Step 1/5: Extracting evaluation criteria from job posting...")
-            progress_bar.progress(15)
-            
-            with st.spinner("Analyzing job posting..."):
-                rubric = extract_rubric_with_llm(
-                    job_posting,
-                    use_cache=use_cache,
-                    prompt_version=prompt_version,
-                    prompt_label=prompt_label,
-                    langfuse_parent=langfuse_trace,  # Not used in v3.x, kept for compatibility
-                    session_id=session_id,  # Pass session_id to group all operations
-                    model=selected_model
-                )
-            
-            step_times['rubric_extraction'] = time.time() - step1_start
-            timing_container.info(f"⏱️ Step 1 completed in {step_times['rubric_extraction']:.2f}s")
-            
-            progress_bar.progress(30)
+            # Run the evaluation pipeline (steps run as soon as their inputs are ready;
+            # outputs are memoized by input hash, so e.g. changing only the language
+            # re-runs just the note and summary steps)
+            pipeline = build_evaluation_pipeline(
+                fused=use_fused_evaluation,
+                local_summary=use_local_summary,
+                cache=st.session_state.setdefault("pipeline_cache", StepCache()),
+                local_criteria=use_local_criteria,
+                compact_profile=use_compact_profile
+            )
+            total_steps = len(pipeline.steps) - 1  # PDF extraction is done at upload
+            completed_steps = []
             
-            # Step 2: Score Criteria
-            step2_start = time.time()
-            status_text.text("📊 Step 2/5: Scoring candidate against criteria...")
-            progress_bar.progress(45)
+            def on_step_complete(step_name, duration, cached):
+                completed_steps.append(step_name)
+                progress_bar.progress(int(100 * len(completed_steps) / total_steps))
+                status_text.text(f"✓ {STEP_LABELS.get(step_name, step_name)} {'(cached)' if cached else f'({duration:.2f}s)'}")
             
+            status_text.text(f"📋 Evaluating candidate ({language})...")
             with st.spinner("Evaluating candidate..."):
-                criteria_scores = score_criteria_with_llm(
-                    cv_text, 
-                    rubric,
-                    langfuse_parent=langfuse_trace,  # Not used in v3.x, kept for compatibility
-                    session_id=session_id,  # Pass session_id to group all operations
-                    model=selected_model
-                )
-            
-            step_times['criteria_scoring'] = time.time() - step2_start
-            timing_container.info(f"⏱️ Steps 1-2 completed in {sum(step_times.values()):.2f}s (Step 2: {step_times['criteria_scoring']:.2f}s)")
-            
-            progress_bar.progress(55)
-            
-            # Step 3: Calculate Final Score
-            step3_start = time.time()
-            status_text.text("🎯 Step 3/5: Calculating final matching score...")
-            progress_bar.progress(65)
-            
-            result = calculate_matching_score(rubric, criteria_scores)
-            
-            step_times['score_calculation'] = time.time() - step3_start
-            timing_container.info(f"⏱️ Steps 1-3 completed in {sum(step_times.values()):.2f}s (Step 3: {step_times['score_calculation']:.2f}s)")
-            
-            progress_bar.progress(75)
-            
-            # Format rubric and criteria scores text for qualification note
-            rubric_text = "\n".join([
-                f"- {c.name} (Weight: {c.weight:.1f}%): {c.description}"
-                for c in rubric.criteria
-            ])
-            
-            criteria_scores_text = "\n".join([
-                f"- {cs.criteria_name}: {cs.score}/100 - Evidence: {cs.evidence or 'N/A'}"
-                for cs in criteria_scores
-            ])
-            
-            # Step 4: Generate Qualification Note
-            step4_start = time.time()
-            status_text.text(f"📝 Step 4/5: Generating qualification note ({language})...")
-            progress_bar.progress(85)
-            
-            with st.spinner(f"Generating comprehensive qualification assessment in {language}..."):
-                qualification_note = generate_qualification_note(
-                    job_posting,
-                    cv_text,
-                    rubric_text=rubric_text,
-                    criteria_scores_text=criteria_scores_text,
-                    language=language,
-                    langfuse_parent=langfuse_trace,  # Not used in v3.x, kept for compatibility
-                    session_id=session_id,  # Pass session_id to group all operations
-                    model=selected_model
-                )
-            
-            step_times['qualification_generation'] = time.time() - step4_start
-            timing_container.info(f"⏱️ Steps 1-4 completed in {sum(step_times.values()):.2f}s (Step 4: {step_times['qualification_generation']:.2f}s)")
-            
-            progress_bar.progress(92)
-            
-            # Step 5: Generate Qualification Summary
-            step5_start = time.time()
-            status_text.text("📄 Step 5/5: Generating qualification summary...")
-            progress_bar.progress(95)
-            
-            with st.spinner(f"Generating concise summary in {language}..."):
-                qualification_summary = generate_qualification_summary(
-                    qualification_note,
-                    language=language,
-                    langfuse_parent=langfuse_trace,  # Not used in v3.x, kept for compatibility
-                    session_id=session_id,  # Pass session_id to group all operations
-                    model=selected_model
+                run = pipeline.run(
+                    {
+                        "job_posting": job_posting,
+                        "cv_text": cv_text,
+                        "language": language,
+                        "model": selected_model,
+                        "use_cache": use_cache,
+                        "prompt_version": prompt_version,
+                        "prompt_label": prompt_label,
+                        "gating_policy": gating_policy,
+                        "session_id": session_id,  # Pass session_id to group all operations
+                        "langfuse_parent": langfuse_trace  # Not used in v3.x, kept for compatibility
+                    },
+                    on_step_complete=on_step_complete
                 )
             
-            step_times['qualification_summary'] = time.time() - step5_start
-            total_time = time.time() - total_start
+            rubric = run.outputs["rubric"]
+            criteria_scores = run.outputs["criteria_scores"]
+            result = run.outputs["result"]
+            qualification_note = run.outputs["qualification_note"]
+            qualification_summary = run.outputs["qualification_summary"]
+            gate = run.outputs.get("gate")
+            total_time = run.total_time
             
             # Display final timing summary
+            timing_lines = "\n".join(
+                f"            - {STEP_LABELS.get(step, step)}: "
+                + ("cached" if step in run.cached_steps else f"{duration:.2f}s")
+                for step, duration in run.step_times.items()
+            )
             timing_container.success(f"""
             ⏱️ **Total Time: {total_time:.2f}s**
-            - Step 1 (Rubric Extraction): {step_times['rubric_extraction']:.2f}s
-            - Step 2 (Criteria Scoring): {step_times['criteria_scoring']:.2f}s
-            - Step 3 (Score Calculation): {step_times['score_calculation']:.2f}s
-            - Step 4 (Qualification Note): {step_times['qualification_generation']:.2f}s
-            - Step 5 (Qualification Summary): {step_times['qualification_summary']:.2f}s
+{timing_lines}
             """)
             
             # LANGFUSE: Flush any pending events
@@ -491,228 +823,18 @@ def main():
             progress_bar.progress(100)
             status_text.text("✅ Evaluation complete!")
             
-            # Display Results
-            st.divider()
-            st.header("📊 Results")
-            
-            # Final Score - Large Display
-            final_score = result["final_score"]
-            score_color = format_score_color(final_score)
-            
-            col_score1, col_score2, col_score3 = st.columns([1, 2, 1])
-            with col_score2:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 20px;">
-                    <h2 style="color: {score_color}; margin-bottom: 10px;">Final Matching Score</h2>
-                    <h1 style="font-size: 72px; color: {score_color}; margin: 0;">{final_score}%</h1>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.divider()
-            
-            # Rubric Criteria
-            st.subheader("📋 Evaluation Criteria")
-            st.markdown(f"**Total Criteria:** {len(rubric.criteria)} | **Total Weight:** {rubric.total_weight:.1f}%")
-            
-            criteria_df_data = []
-            for criterion in rubric.criteria:
-                criteria_df_data.append({
-                    "Criterion": criterion.name,
-                    "Weight": f"{criterion.weight:.1f}%",
-                    "Description": criterion.description,
-                    "Required": "✅ Yes" if criterion.is_required else "⚪ Preferred"
-                })
-            
-            st.dataframe(
-                criteria_df_data,
-                width="stretch",
-                hide_index=True
-            )
-            
-            st.divider()
-            
-            # Summary Table
-            st.subheader("📊 Score Summary")
-            summary_data = []
-            empty_evidence_count = 0
-            
-            for breakdown_item in result["breakdown"]:
-                # Get evidence and gap, ensuring they're strings
-                evidence = breakdown_item.get("evidence", "") or ""
-                gap = breakdown_item.get("gap", "") or ""
-                
-                # Track empty evidence
-                if not evidence:
-                    empty_evidence_count += 1
-                
-                # Use fallback text if empty
-                if not evidence:
-                    evidence = "No evidence provided by AI"
-                if not gap and breakdown_item["score"] < 80:
-                    gap = "Score below 80 - review recommended"
-                
-                summary_data.append({
-                    "Criterion": breakdown_item["criterion"],
-                    "Score": breakdown_item["score"],
-                    "Weight": f"{breakdown_item['weight']:.1f}%",
-                    "Contribution": f"{breakdown_item['contribution']:.2f}",
-                    "Evidence": evidence,
-                    "Gap": gap
-                })
-            
-            # Show warning if many empty evidence fields
-            if empty_evidence_count > 0:
-                st.warning(f"⚠️ {empty_evidence_count} out of {len(summary_data)} criteria have no evidence. The AI may not be returning evidence/gap fields correctly.")
-            
-            # Show debug info if needed
-            with st.expander("🔍 Debug Info (Click to see raw data)"):
-                st.json({
-                    "breakdown_sample": result["breakdown"][0] if result["breakdown"] else None,
-                    "criteria_scores_sample": {
-                        "criteria_name": criteria_scores[0].criteria_name if criteria_scores else None,
-                        "score": criteria_scores[0].score if criteria_scores else None,
-                        "evidence": criteria_scores[0].evidence if criteria_scores else None,
-                        "gap": criteria_scores[0].gap if criteria_scores else None,
-                    } if criteria_scores else None,
-                    "all_criteria_scores": [
-                        {
-                            "criteria_name": cs.criteria_name,
-                            "score": cs.score,
-                            "evidence": cs.evidence,
-                            "gap": cs.gap
-                        }
-                        for cs in criteria_scores
-                    ]
-                })
-            
-            st.dataframe(
-                summary_data,
-                width="stretch",
-                hide_index=True
-            )
-            
-            # Download results as JSON
-            st.divider()
-            
-            # Qualification Summary Display
-            st.header("📄 Qualification Summary")
-            st.markdown("""
-            A concise executive summary of the candidate's qualification assessment.
-            """)
-            st.info(qualification_summary)
-            
-            st.divider()
-            
-            # Qualification Note Display
-            st.header("📝 Candidate Qualification Note")
-            st.markdown("""
-            This comprehensive assessment provides a detailed analysis of the candidate's fit for the role,
-            based on recent experience, career trajectory, and requirements alignment.
-            """)
-            
-            # Clean and display the HTML-formatted qualification note
-            import re
-            
-            cleaned_note = qualification_note.strip()
-            
-            # Remove code block markers if present
-            if "```html" in cleaned_note:
-                cleaned_note = cleaned_note.split("```html")[1].split("```")[0].strip()
-            elif "```" in cleaned_note:
-                cleaned_note = cleaned_note.split("```")[1].split("```")[0].strip()
-            
-            # Remove any <div> wrappers from the LLM response (including the qual-note-container div)
-            cleaned_note = re.sub(r'<div[^>]*>', '', cleaned_note)
-            cleaned_note = cleaned_note.replace('</div>', '')
-            
-            # Remove any remaining HTML artifacts that might show as raw text
-            cleaned_note = re.sub(r'^\s*<[^>]+>\s*$', '', cleaned_note, flags=re.MULTILINE)
-            
-            print(f"✓ Cleaned note (first 300 chars): {cleaned_note[:300]}")
-            
-            # Add CSS styling for better presentation
-            qualification_html = f"""
-            <style>
-                .qual-note-container {{
-                    background-color: #f8f9fa;
-                    padding: 25px;
-                    border-radius: 10px;
-                    border-left: 5px solid #007bff;
-                    margin: 20px 0;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .qual-note-container b {{
-                    color: #1e3a8a;
-                    font-size: 1.15em;
-                    display: block;
-                    margin: 20px 0 10px 0;
-                }}
-                .qual-note-container ul {{
-                    margin: 10px 0;
-                    padding-left: 25px;
-                    list-style-type: disc;
-                }}
-                .qual-note-container li {{
-                    margin: 10px 0;
-                    line-height: 1.7;
-                    color: #374151;
-                }}
-                .qual-note-container p {{
-                    margin: 12px 0;
-                    line-height: 1.8;
-                    color: #374151;
-                }}
-                .qual-note-container li b {{
-                    display: inline;
-                    font-size: 1em;
-                    margin: 0;
-                }}
-            </style>
-            
-                {cleaned_note}
-            
-            """
-            
-            # Display with proper HTML rendering
-            st.markdown(qualification_html, unsafe_allow_html=True)
-            
-            st.divider()
-            st.subheader("💾 Export Results")
-            
-            results_json = {
-                "final_score": final_score,
-                "qualification_summary": qualification_summary,
+            # Keep the results across reruns (e.g. when adjusting criterion weights)
+            st.session_state["evaluation_count"] = st.session_state.get("evaluation_count", 0) + 1
+            st.session_state["evaluation"] = {
+                "id": st.session_state["evaluation_count"],
+                "rubric": rubric,
+                "criteria_scores": criteria_scores,
+                "result": result,
                 "qualification_note": qualification_note,
-                "rubric": {
-                    "criteria": [
-                        {
-                            "name": c.name,
-                            "weight": c.weight,
-                            "description": c.description,
-                            "is_required": c.is_required
-                        }
-                        for c in rubric.criteria
-                    ]
-                },
-                "criteria_scores": [
-                    {
-                        "criteria_name": cs.criteria_name,
-                        "score": cs.score,
-                        "evidence": cs.evidence,
-                        "gap": cs.gap
-                    }
-                    for cs in criteria_scores
-                ],
-                "breakdown": result["breakdown"]
+                "qualification_summary": qualification_summary,
+                "gate": gate
             }
             
-            st.download_button(
-                label="📥 Download Results as JSON",
-                data=json.dumps(results_json, indent=2),
-                file_name="matching_score_results.json",
-                mime="application/json"
-            )
-            
         except json.JSONDecodeError as e:
             st.error(f"❌ JSON Parsing Error: {str(e)}")
             st.error("The AI response could not be parsed as JSON. This might be due to:")
@@ -743,6 +865,11 @@ def main():
             st.exception(e)
             progress_bar.empty()
             status_text.empty()
+    
+    # Results persist across reruns (weight edits, widget changes)
+    evaluation = st.session_state.get("evaluation")
+    if evaluation:
+        render_results(evaluation)
 
 
 if __name__ == "__main__":
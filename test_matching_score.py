@@ -242,7 +242,8 @@ Multiple Profiles (uses cache for consistency):
     
     # This will:
     # 1. Generate rubric once (cached)
-    # 2. Score all 3 candidates against SAME rubric
+    # 2. Score all 3 candidates against SAME rubric (concurrently,
+    #    max_workers calls in flight; failures are reported per candidate)
     # 3. Show comparison summary
 
 HOW IT WORKS:
@@ -284,6 +285,15 @@ Edit the script and change OPENROUTER_MODEL variable:
 
 **Note:** Changing the model invalidates the cache (different model = different rubric)
 
+FUSED EVALUATION:
+-----------------
+For models in FUSED_EVALUATION_MODELS, criteria scoring, the qualification note
+and the summary can be produced by ONE LLM call (evaluate_candidate_fused)
+instead of three, so the job posting and CV are sent only once.
+
+    # Compare latency and token cost of both modes
+    benchmark_evaluation_modes(job_posting, cv_profile, runs=3)
+
 VALIDATION:
 -----------
 This script helps validate that:
@@ -306,7 +316,7 @@ DATE: 2025-11-24
 ================================================================================
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass, asdict
 import json
 import sys
@@ -315,8 +325,22 @@ import re
 import requests
 import hashlib
 import pickle
+import threading
+import contextvars
+from contextlib import contextmanager
 from pathlib import Path
-from prompts import CRITERIA_SCORING_PROMPT, QUALIFICATION_GENERATION_PROMPT
+from prompts import (
+    CRITERIA_SCORING_PROMPT,
+    QUALIFICATION_GENERATION_PROMPT,
+    QUALIFICATION_TO_SCORE_CONVERSION_PROMPT,
+    FUSED_EVALUATION_OUTPUT_PROMPT
+)
+from qualification_note import (
+    parse_qualification_note,
+    render_qualification_summary,
+    score_from_qualification_note
+)
+from cv_text import cv_text_hash
 
 # Load environment variables from .env file
 try:
@@ -394,6 +418,23 @@ class CriterionScore:
     gap: str
 
 
+@dataclass
+class GatingPolicy:
+    """
+    What to do after scoring when a required criterion is below threshold.
+
+    action: "skip" renders a short "do not advance" note locally (no LLM call),
+    "downgrade" writes a brief note with a cheaper model, "off" disables gating.
+    """
+    threshold: float = 40.0
+    action: str = "skip"
+    downgrade_model: Optional[str] = None  # None = GEMINI_FLASH_LITE_OPENROUTER
+    downgrade_max_tokens: int = 1200
+
+
+GATING_ACTIONS = ["off", "skip", "downgrade"]
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -408,8 +449,12 @@ if not OPENROUTER_API_KEY:
     print("  3. Install python-dotenv: pip install python-dotenv")
     sys.exit(1)
 
-# OpenRouter configuration
-OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
+# OpenRouter configuration (the URL can point to a local fake server for testing)
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1/chat/completions")
+OPENROUTER_TIMEOUT = float(os.getenv("OPENROUTER_TIMEOUT", "120"))
+
+# Maximum number of concurrent OpenRouter calls per process (see set_llm_concurrency)
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "16"))
 
 # Available Models
 CLAUDE_HAIKU_OPENROUTER = "anthropic/claude-haiku-4.5"
@@ -428,11 +473,63 @@ MODEL_NAMES = {
     GPT_OSS_120B_OPENROUTER: "GPT OSS 120B (Exacto)"
 }
 
+# Models that reliably return scores, note and summary in one structured response.
+# Fused evaluation replaces steps 2, 4 and 5 with a single LLM call for these models.
+FUSED_EVALUATION_MODELS = {
+    CLAUDE_HAIKU_OPENROUTER,
+    GEMINI_FLASH_OPENROUTER
+}
+
 # Cache configuration
 CACHE_DIR = Path(__file__).parent / ".rubric_cache"
 CACHE_DIR.mkdir(exist_ok=True)
 ENABLE_CACHE = True  # Set to False to disable caching
 
+# Per-call token usage and latency, appended by call_openrouter (used for benchmarks)
+# Only the most recent LLM_CALL_LOG_MAX calls are kept (long-running services);
+# use track_llm_calls() to attribute calls to a block of work
+LLM_CALL_LOG: List[Dict[str, Any]] = []
+LLM_CALL_LOG_MAX = 10000
+_LLM_CALL_LOG_LOCK = threading.Lock()
+_LLM_CALL_COLLECTORS: contextvars.ContextVar = contextvars.ContextVar("llm_call_collectors", default=())
+
+# Shared HTTP connection pool and in-flight limit for OpenRouter calls
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+_LLM_SEMAPHORE = threading.BoundedSemaphore(LLM_MAX_IN_FLIGHT)
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide requests.Session used for OpenRouter calls.
+    
+    Reusing one session keeps TLS connections alive across calls instead of
+    reconnecting for every LLM request.
+    """
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(LLM_MAX_IN_FLIGHT, 10))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP_SESSION = session
+        return _HTTP_SESSION
+
+
+def set_llm_concurrency(max_in_flight: int):
+    """
+    Limit the number of OpenRouter calls in flight at once (process-wide).
+    
+    Calls already waiting keep the previous limit.
+    
+    Args:
+        max_in_flight: Maximum number of concurrent LLM calls
+    """
+    global _LLM_SEMAPHORE, LLM_MAX_IN_FLIGHT
+    LLM_MAX_IN_FLIGHT = max(1, max_in_flight)
+    _LLM_SEMAPHORE = threading.BoundedSemaphore(LLM_MAX_IN_FLIGHT)
+
 # ============================================================================
 # PROMPTS (copied from actual project)
 # ============================================================================
@@ -746,6 +843,84 @@ def calculate_matching_score(rubric: EvaluationRubric, criteria_scores: List[Cri
     }
 
 
+def evaluate_required_gate(
+    rubric: EvaluationRubric,
+    criteria_scores: List[CriterionScore],
+    policy: GatingPolicy = None
+) -> dict:
+    """
+    Decide whether the note/summary steps are worth their cost.
+
+    A candidate failing a required criterion (e.g. 10/100 on a mandatory
+    language) is a "do not advance" whatever the full note says, so the
+    policy can skip the 3000-token note or downgrade it to a brief note on a
+    cheaper model.
+
+    Args:
+        rubric: The evaluation rubric (is_required flags)
+        criteria_scores: Scores from score_criteria_with_llm
+        policy: Gating policy (None or action "off" = never gate)
+
+    Returns:
+        dict with gated, action ("none", "skip" or "downgrade"), threshold,
+        model and max_tokens (for downgraded steps) and failed_criteria
+        [{"criterion", "score", "evidence", "gap"}]
+    """
+    policy = policy or GatingPolicy(action="off")
+    if policy.action not in GATING_ACTIONS:
+        raise ValueError(f"Unknown gating action '{policy.action}' (expected one of {GATING_ACTIONS})")
+
+    required = {c.name for c in rubric.criteria if c.is_required}
+    failed_criteria = [
+        {
+            "criterion": cs.criteria_name,
+            "score": cs.score,
+            "evidence": cs.evidence or "",
+            "gap": cs.gap or ""
+        }
+        for cs in criteria_scores
+        if cs.criteria_name in required and cs.score < policy.threshold
+    ]
+    gated = bool(failed_criteria) and policy.action != "off"
+    action = policy.action if gated else "none"
+
+    if gated:
+        names = ", ".join(f"{c['criterion']} ({c['score']:.0f})" for c in failed_criteria)
+        print(f"🚧 Required criteria below {policy.threshold:.0f}: {names} -> {action}")
+
+    return {
+        "gated": gated,
+        "action": action,
+        "threshold": policy.threshold,
+        "model": (policy.downgrade_model or GEMINI_FLASH_LITE_OPENROUTER) if action == "downgrade" else None,
+        "max_tokens": policy.downgrade_max_tokens if action == "downgrade" else None,
+        "failed_criteria": failed_criteria
+    }
+
+
+@contextmanager
+def track_llm_calls():
+    """
+    Collect the LLM calls made inside a block (same entries as LLM_CALL_LOG).
+
+    Calls are attributed by context rather than by position in LLM_CALL_LOG,
+    so the log cap does not matter and calls from unrelated threads are not
+    counted. Work submitted by score_profiles_concurrently counts toward the
+    caller. Blocks can be nested.
+
+    USAGE:
+        with track_llm_calls() as calls:
+            score_criteria_with_llm(cv_profile, rubric)
+        sum(call["cost"] for call in calls)
+    """
+    calls: List[Dict[str, Any]] = []
+    token = _LLM_CALL_COLLECTORS.set(_LLM_CALL_COLLECTORS.get() + (calls,))
+    try:
+        yield calls
+    finally:
+        _LLM_CALL_COLLECTORS.reset(token)
+
+
 def call_openrouter(
     messages: List[Dict[str, str]], 
     max_tokens: int = 2000,
@@ -798,7 +973,8 @@ def call_openrouter(
         # --- CONSISTENCY PARAMETERS ---
         "temperature": 0,      # Removes randomness
         "top_p": 1,           # Restricts sampling to top probability
-        "seed": 42            # Forces deterministic output (if supported by model)
+        "seed": 42,           # Forces deterministic output (if supported by model)
+        "usage": {"include": True}  # Ask OpenRouter to report token usage and cost
     }
     
     # LANGFUSE: Create generation manually (v3.x API with session grouping)
@@ -861,11 +1037,22 @@ def call_openrouter(
                     pass
                 propagate_context = None
 
-    # Track actual LLM API call time (excluding Langfuse overhead)
+    # Track actual LLM API call time (excluding Langfuse overhead and time
+    # spent waiting for a free in-flight slot)
     import time
-    llm_start_time = time.time()
-    response = requests.post(OPENROUTER_BASE_URL, headers=headers, json=data)
-    llm_duration = time.time() - llm_start_time
+    with _LLM_SEMAPHORE:
+        llm_start_time = time.time()
+        try:
+            response = get_http_session().post(
+                OPENROUTER_BASE_URL, headers=headers, json=data, timeout=OPENROUTER_TIMEOUT
+            )
+        except requests.RequestException as e:
+            if generation:
+                generation.end(level="ERROR", status_message=str(e))
+            if propagate_context:
+                propagate_context.__exit__(None, None, None)
+            raise
+        llm_duration = time.time() - llm_start_time
     
     # Check for HTTP errors
     if response.status_code != 200:
@@ -917,11 +1104,27 @@ def call_openrouter(
             generation.end(level="ERROR", status_message=error_msg)
         raise ValueError(error_msg)
     
+    # Record token usage and latency for benchmarking
+    usage = result.get("usage", {}) or {}
+    call_entry = {
+        "generation_name": generation_name,
+        "model": selected_model,
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "completion_tokens": usage.get("completion_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0),
+        "cost": usage.get("cost", 0.0),
+        "duration": llm_duration
+    }
+    with _LLM_CALL_LOG_LOCK:
+        LLM_CALL_LOG.append(call_entry)
+        for collector in _LLM_CALL_COLLECTORS.get():
+            collector.append(call_entry)
+        if len(LLM_CALL_LOG) > LLM_CALL_LOG_MAX:
+            del LLM_CALL_LOG[:len(LLM_CALL_LOG) - LLM_CALL_LOG_MAX]
+    
     # LANGFUSE: Update generation with output
     if generation:
         try:
-            # Extract token usage
-            usage = result.get("usage", {})
             # Update output and usage
             # Note: session_id is already set via propagate_attributes, no need to set it here
             generation.update(
@@ -1022,6 +1225,76 @@ def save_rubric_to_cache(job_posting: str, rubric: EvaluationRubric):
         print(f"⚠ Cache save failed: {e}")
 
 
+def build_rubric_text(rubric: EvaluationRubric) -> str:
+    """
+    Format rubric criteria as the bullet list sent to the LLM.
+    
+    Args:
+        rubric: The evaluation rubric
+        
+    Returns:
+        One "- Name (Weight: x%): description" line per criterion
+    """
+    return "\n".join([
+        f"- {c.name} (Weight: {c.weight:.1f}%): {c.description}"
+        for c in rubric.criteria
+    ])
+
+
+def parse_llm_json(response_text: str) -> dict:
+    """
+    Parse a JSON object out of an LLM response.
+    
+    Handles markdown code fences and extra text around the JSON object.
+    
+    Args:
+        response_text: Raw response text from the model
+        
+    Returns:
+        Parsed JSON object
+        
+    Raises:
+        ValueError: If no valid JSON object can be parsed
+    """
+    response_text_original = response_text
+    response_text = response_text.strip()
+    
+    # Remove markdown code blocks
+    if "```json" in response_text:
+        start_idx = response_text.find("```json") + 7
+        end_idx = response_text.find("```", start_idx)
+        if end_idx != -1:
+            response_text = response_text[start_idx:end_idx].strip()
+    elif "```" in response_text:
+        start_idx = response_text.find("```") + 3
+        end_idx = response_text.find("```", start_idx)
+        if end_idx != -1:
+            response_text = response_text[start_idx:end_idx].strip()
+    
+    # Try to find JSON object boundaries
+    if "{" in response_text and "}" in response_text:
+        start_idx = response_text.find("{")
+        end_idx = response_text.rfind("}") + 1
+        if start_idx != -1 and end_idx > start_idx:
+            response_text = response_text[start_idx:end_idx]
+    
+    response_text = response_text.strip()
+    
+    # Validate we have something to parse
+    if not response_text:
+        raise ValueError(f"Empty response after parsing. Original response: {response_text_original[:500]}")
+    
+    # Parse JSON with better error message
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError as e:
+        error_msg = f"JSON parsing failed at position {e.pos}: {e.msg}\n"
+        error_msg += f"Response text (first 1000 chars):\n{response_text[:1000]}\n"
+        error_msg += f"Original response (first 500 chars):\n{response_text_original[:500]}"
+        print(f"ERROR: {error_msg}")
+        raise ValueError(error_msg) from e
+
+
 def extract_rubric_with_llm(
     job_posting: str, 
     use_cache: bool = True,
@@ -1135,64 +1408,10 @@ def extract_rubric_with_llm(
         print(f"LLM Response (first 500 chars): {response_text[:500]}...")
         print(f"LLM Response length: {len(response_text)} chars")
         
-        # Try to parse JSON (handle potential markdown wrapping and extra text)
-        response_text_original = response_text
-        response_text = response_text.strip()
-        
-        # Remove markdown code blocks
-        if "```json" in response_text:
-            start_idx = response_text.find("```json") + 7
-            end_idx = response_text.find("```", start_idx)
-            if end_idx != -1:
-                response_text = response_text[start_idx:end_idx].strip()
-        elif "```" in response_text:
-            start_idx = response_text.find("```") + 3
-            end_idx = response_text.find("```", start_idx)
-            if end_idx != -1:
-                response_text = response_text[start_idx:end_idx].strip()
-        
-        # Try to find JSON object boundaries
-        if "{" in response_text and "}" in response_text:
-            start_idx = response_text.find("{")
-            end_idx = response_text.rfind("}") + 1
-            if start_idx != -1 and end_idx > start_idx:
-                response_text = response_text[start_idx:end_idx]
-        
-        response_text = response_text.strip()
+        # Parse JSON (handles markdown wrapping and extra text)
+        rubric = parse_rubric(parse_llm_json(response_text))
         
-        # Validate we have something to parse
-        if not response_text:
-            raise ValueError(f"Empty response after parsing. Original response: {response_text_original[:500]}")
-        
-        # Parse JSON with better error message
-        try:
-            rubric_data = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            error_msg = f"JSON parsing failed at position {e.pos}: {e.msg}\n"
-            error_msg += f"Response text (first 1000 chars):\n{response_text[:1000]}\n"
-            error_msg += f"Original response (first 500 chars):\n{response_text_original[:500]}"
-            print(f"ERROR: {error_msg}")
-            raise ValueError(error_msg) from e
-        
-        # Convert to EvaluationRubric
-        criteria = [
-            RubricCriterion(
-                name=c["name"],
-                weight=float(c["weight"]),
-                description=c["description"],
-                is_required=c.get("is_required", True)
-            )
-            for c in rubric_data["criteria"]
-        ]
-        
-        # Normalize weights to 100%
-        total_weight = sum(c.weight for c in criteria)
-        for criterion in criteria:
-            criterion.weight = (criterion.weight / total_weight) * 100
-        
-        rubric = EvaluationRubric(criteria=criteria, total_weight=100.0)
-        
-        print(f"✓ Extracted {len(criteria)} criteria via LLM")
+        print(f"✓ Extracted {len(rubric.criteria)} criteria via LLM")
         
         # LANGFUSE: Span updated/closed automatically
         
@@ -1208,6 +1427,277 @@ def extract_rubric_with_llm(
         raise
 
 
+def parse_rubric(rubric_data: dict) -> EvaluationRubric:
+    """
+    Convert a parsed rubric extraction payload into an EvaluationRubric.
+    
+    Weights are normalized to sum to 100.
+    
+    Args:
+        rubric_data: Parsed JSON object containing a "criteria" list
+        
+    Returns:
+        EvaluationRubric with normalized weights
+        
+    Raises:
+        ValueError: If the payload has no criteria or no positive weights
+    """
+    if not isinstance(rubric_data, dict) or not rubric_data.get("criteria"):
+        raise ValueError("Missing 'criteria' in rubric response")
+    
+    # Convert to EvaluationRubric
+    criteria = [
+        RubricCriterion(
+            name=c["name"],
+            weight=float(c["weight"]),
+            description=c["description"],
+            is_required=c.get("is_required", True)
+        )
+        for c in rubric_data["criteria"]
+    ]
+    
+    # Normalize weights to 100%
+    total_weight = sum(c.weight for c in criteria)
+    if total_weight <= 0:
+        raise ValueError("Rubric criteria weights sum to zero")
+    for criterion in criteria:
+        criterion.weight = (criterion.weight / total_weight) * 100
+    
+    return EvaluationRubric(criteria=criteria, total_weight=100.0)
+
+
+def reweight_rubric(rubric: EvaluationRubric, weights: Dict[str, float]) -> EvaluationRubric:
+    """
+    Copy a rubric with new criterion weights, normalized to sum to 100.
+    
+    Criterion scores do not depend on the weights, so a re-weighted rubric
+    can be applied to existing scores (calculate_matching_score, ScoreMatrix)
+    without new LLM calls. The original rubric is not modified (it may be
+    shared through the rubric cache).
+    
+    Args:
+        rubric: The rubric to re-weight
+        weights: New (relative) weight per criterion name; criteria not
+            listed keep their current weight
+        
+    Returns:
+        New EvaluationRubric with normalized weights
+        
+    Raises:
+        ValueError: On unknown criterion names, negative weights or a zero total
+    """
+    names = {c.name for c in rubric.criteria}
+    unknown = [name for name in weights if name not in names]
+    if unknown:
+        raise ValueError(f"Unknown criteria: {', '.join(unknown)}")
+    if any(weight < 0 for weight in weights.values()):
+        raise ValueError("Criterion weights must not be negative")
+    
+    criteria = [
+        RubricCriterion(
+            name=c.name,
+            weight=float(weights.get(c.name, c.weight)),
+            description=c.description,
+            is_required=c.is_required
+        )
+        for c in rubric.criteria
+    ]
+    total_weight = sum(c.weight for c in criteria)
+    if total_weight <= 0:
+        raise ValueError("Rubric criteria weights sum to zero")
+    for criterion in criteria:
+        criterion.weight = (criterion.weight / total_weight) * 100
+    
+    return EvaluationRubric(criteria=criteria, total_weight=100.0)
+
+
+def parse_criteria_scores(scores_data: dict, rubric: EvaluationRubric, strict: bool = False) -> List[CriterionScore]:
+    """
+    Convert a parsed ``criteria_scores`` LLM payload into CriterionScore objects.
+    
+    Criterion names are normalized against the rubric (exact, weight-suffixed and
+    fuzzy matches), duplicates are dropped, and rubric criteria the LLM did not
+    return get a placeholder score of 0.
+    
+    Args:
+        scores_data: Parsed JSON object containing a "criteria_scores" list
+        rubric: The evaluation rubric the scores refer to
+        strict: Raise ValueError for unscored criteria instead of adding
+            placeholders (used by packed requests, which retry instead)
+        
+    Returns:
+        List of criterion scores (one per rubric criterion)
+    """
+    # Validate response structure
+    if not isinstance(scores_data, dict) or not isinstance(scores_data.get("criteria_scores"), list):
+        keys = list(scores_data.keys()) if isinstance(scores_data, dict) else type(scores_data).__name__
+        raise ValueError(f"Missing 'criteria_scores' key in response. Keys found: {keys}")
+    
+    # Debug: Print first score to see structure
+    if len(scores_data["criteria_scores"]) > 0:
+        first_score = scores_data["criteria_scores"][0]
+        print(f"DEBUG - First score structure: {json.dumps(first_score, indent=2)}")
+        print(f"DEBUG - Keys in first score: {list(first_score.keys())}")
+    
+    # Debug: Print all returned criteria names
+    returned_criteria_names = [s.get("criteria_name", "MISSING") for s in scores_data["criteria_scores"]]
+    expected_criteria_names = [c.name for c in rubric.criteria]
+    print(f"\n{'='*80}")
+    print(f"CRITERIA VALIDATION CHECK")
+    print(f"{'='*80}")
+    print(f"Expected criteria ({len(expected_criteria_names)}):")
+    for i, name in enumerate(expected_criteria_names, 1):
+        print(f"  {i}. {name}")
+    print(f"\nReturned criteria ({len(returned_criteria_names)}):")
+    for i, name in enumerate(returned_criteria_names, 1):
+        match_indicator = "✓" if name in expected_criteria_names else "❌"
+        print(f"  {i}. {match_indicator} {name}")
+    print(f"{'='*80}\n")
+    
+    # Check for mismatches
+    mismatches = []
+    for returned_name in returned_criteria_names:
+        if returned_name not in expected_criteria_names:
+            # Try to find partial matches
+            found_match = False
+            for expected_name in expected_criteria_names:
+                if expected_name.lower() in returned_name.lower() or returned_name.lower() in expected_name.lower():
+                    print(f"⚠ Partial match found: '{returned_name}' might match '{expected_name}'")
+                    found_match = True
+                    break
+            if not found_match:
+                mismatches.append(returned_name)
+    
+    if mismatches:
+        print(f"⚠ WARNING: {len(mismatches)} criteria returned that don't match the rubric:")
+        for mismatch in mismatches:
+            print(f"   - '{mismatch}' (not in rubric)")
+        print(f"   Expected: {expected_criteria_names}")
+        print(f"   This suggests the LLM may not have received the rubric properly or is generating its own criteria.")
+    
+    # Create a mapping from criterion names (with or without weight) to actual criterion names
+    criterion_name_map = {}
+    for criterion in rubric.criteria:
+        # Map the exact name
+        criterion_name_map[criterion.name] = criterion.name
+        # Map name with weight format (as shown in prompt)
+        criterion_name_map[f"{criterion.name} (Weight: {criterion.weight:.1f}%)"] = criterion.name
+        # Map variations (case-insensitive, partial matches)
+        criterion_name_map[criterion.name.lower()] = criterion.name
+        # Try to match common variations
+        if "frontend" in criterion.name.lower() or "front-end" in criterion.name.lower():
+            criterion_name_map["Hard Skills - Front-end Technologies"] = criterion.name
+            criterion_name_map["Front-end Technologies"] = criterion.name
+        if "react" in criterion.name.lower():
+            criterion_name_map["Hard Skills - React.js"] = criterion.name
+        if "backend" in criterion.name.lower() or "back-end" in criterion.name.lower():
+            # This might not be in rubric, but we'll try to match
+            pass
+    
+    # Convert to CriterionScore list - ONLY for criteria that match the rubric
+    scores = []
+    matched_criteria = set()  # Track which rubric criteria have been matched
+    
+    for s in scores_data["criteria_scores"]:
+        # Ensure all required fields exist
+        if "criteria_name" not in s:
+            print(f"WARNING: Missing 'criteria_name' in score: {s}")
+            continue
+        if "score" not in s:
+            print(f"WARNING: Missing 'score' in score: {s}")
+            continue
+        
+        # Normalize criteria name (remove weight if present)
+        raw_criteria_name = s["criteria_name"]
+        normalized_name = criterion_name_map.get(raw_criteria_name, raw_criteria_name)
+        
+        # If still not found, try to extract just the name part (before " (Weight:")
+        if normalized_name == raw_criteria_name and " (Weight:" in raw_criteria_name:
+            normalized_name = raw_criteria_name.split(" (Weight:")[0].strip()
+            # Try to find matching criterion by name
+            for criterion in rubric.criteria:
+                if criterion.name == normalized_name:
+                    criterion_name_map[raw_criteria_name] = normalized_name
+                    break
+        
+        # Try fuzzy matching if exact match not found
+        if normalized_name not in expected_criteria_names:
+            # Try to find best match
+            best_match = None
+            best_similarity = 0
+            for criterion in rubric.criteria:
+                # Simple similarity check
+                if normalized_name.lower() in criterion.name.lower() or criterion.name.lower() in normalized_name.lower():
+                    similarity = min(len(normalized_name), len(criterion.name)) / max(len(normalized_name), len(criterion.name))
+                    if similarity > best_similarity:
+                        best_similarity = similarity
+                        best_match = criterion.name
+            
+            if best_match and best_similarity > 0.5:
+                print(f"⚠ Fuzzy matched: '{raw_criteria_name}' -> '{best_match}' (similarity: {best_similarity:.2f})")
+                normalized_name = best_match
+            else:
+                print(f"❌ ERROR: Criterion '{raw_criteria_name}' does not match any rubric criterion!")
+                print(f"   Expected one of: {expected_criteria_names}")
+                print(f"   Skipping this score to prevent incorrect matching.")
+                continue
+        
+        # Debug: Log name normalization
+        if raw_criteria_name != normalized_name:
+            print(f"DEBUG: Normalized criteria name: '{raw_criteria_name}' -> '{normalized_name}'")
+        
+        # Check if we've already scored this criterion
+        if normalized_name in matched_criteria:
+            print(f"⚠ WARNING: Duplicate score for criterion '{normalized_name}'. Keeping first occurrence.")
+            continue
+        
+        matched_criteria.add(normalized_name)
+        
+        score_obj = CriterionScore(
+            criteria_name=normalized_name,  # Use normalized name
+            score=float(s["score"]),
+            evidence=s.get("evidence", "") or "",  # Ensure it's a string, not None
+            gap=s.get("gap", "") or ""  # Ensure it's a string, not None
+        )
+        
+        # Debug: Print if evidence/gap are empty
+        if not score_obj.evidence and not score_obj.gap:
+            print(f"WARNING: No evidence or gap for criterion: {score_obj.criteria_name}")
+        
+        scores.append(score_obj)
+    
+    # Check if all rubric criteria were scored
+    missing_criteria = set(expected_criteria_names) - matched_criteria
+    if missing_criteria:
+        print(f"⚠ WARNING: {len(missing_criteria)} rubric criteria were not scored: {missing_criteria}")
+        if strict:
+            raise ValueError(f"{len(missing_criteria)} rubric criteria were not scored: {sorted(missing_criteria)}")
+        print(f"   This may cause incorrect final score calculation.")
+        # Add placeholder scores for missing criteria (score 0 with gap explanation)
+        for missing_name in missing_criteria:
+            # Find the criterion object
+            missing_criterion = next((c for c in rubric.criteria if c.name == missing_name), None)
+            if missing_criterion:
+                placeholder_score = CriterionScore(
+                    criteria_name=missing_name,
+                    score=0.0,
+                    evidence="Criterion not scored by LLM - may indicate prompt issue",
+                    gap=f"Missing score for '{missing_name}' - LLM did not return this criterion"
+                )
+                scores.append(placeholder_score)
+                print(f"   Added placeholder score (0) for '{missing_name}'")
+    
+    print(f"✓ Scored {len(scores)} criteria via LLM")
+    
+    # Debug: Print summary of evidence/gap
+    evidence_count = sum(1 for s in scores if s.evidence)
+    gap_count = sum(1 for s in scores if s.gap)
+    print(f"DEBUG - Scores with evidence: {evidence_count}/{len(scores)}")
+    print(f"DEBUG - Scores with gap: {gap_count}/{len(scores)}")
+    
+    return scores
+
+
 def score_criteria_with_llm(
     cv_profile: str, 
     rubric: EvaluationRubric,
@@ -1232,10 +1722,7 @@ def score_criteria_with_llm(
     print(f"Rubric: {len(rubric.criteria)} criteria")
     
     # Build rubric summary for prompt
-    rubric_text = "\n".join([
-        f"- {c.name} (Weight: {c.weight:.1f}%): {c.description}"
-        for c in rubric.criteria
-    ])
+    rubric_text = build_rubric_text(rubric)
     
     # Debug: Print rubric to verify it's correct
     print(f"📋 Rubric being sent to LLM ({len(rubric.criteria)} criteria):")
@@ -1351,208 +1838,10 @@ Return ONLY valid JSON with ALL fields populated. Evidence and gap fields are MA
         print(f"LLM Response (first 500 chars): {response_text}...")
         print(f"LLM Response length: {len(response_text)} chars")
         
-        # Try to parse JSON (handle potential markdown wrapping and extra text)
-        response_text_original = response_text
-        response_text = response_text.strip()
-        
-        # Remove markdown code blocks
-        if "```json" in response_text:
-            start_idx = response_text.find("```json") + 7
-            end_idx = response_text.find("```", start_idx)
-            if end_idx != -1:
-                response_text = response_text[start_idx:end_idx].strip()
-        elif "```" in response_text:
-            start_idx = response_text.find("```") + 3
-            end_idx = response_text.find("```", start_idx)
-            if end_idx != -1:
-                response_text = response_text[start_idx:end_idx].strip()
-        
-        # Try to find JSON object boundaries
-        if "{" in response_text and "}" in response_text:
-            start_idx = response_text.find("{")
-            end_idx = response_text.rfind("}") + 1
-            if start_idx != -1 and end_idx > start_idx:
-                response_text = response_text[start_idx:end_idx]
-        
-        response_text = response_text.strip()
+        # Parse JSON (handles markdown wrapping and extra text)
+        scores_data = parse_llm_json(response_text)
         
-        # Validate we have something to parse
-        if not response_text:
-            raise ValueError(f"Empty response after parsing. Original response: {response_text_original[:500]}")
-        
-        # Parse JSON with better error message
-        try:
-            scores_data = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            error_msg = f"JSON parsing failed at position {e.pos}: {e.msg}\n"
-            error_msg += f"Response text (first 1000 chars):\n{response_text[:1000]}\n"
-            error_msg += f"Original response (first 500 chars):\n{response_text_original[:500]}"
-            print(f"ERROR: {error_msg}")
-            raise ValueError(error_msg) from e
-        
-        # Validate response structure
-        if "criteria_scores" not in scores_data:
-            raise ValueError(f"Missing 'criteria_scores' key in response. Keys found: {list(scores_data.keys())}")
-        
-        # Debug: Print first score to see structure
-        if len(scores_data["criteria_scores"]) > 0:
-            first_score = scores_data["criteria_scores"][0]
-            print(f"DEBUG - First score structure: {json.dumps(first_score, indent=2)}")
-            print(f"DEBUG - Keys in first score: {list(first_score.keys())}")
-        
-        # Debug: Print all returned criteria names
-        returned_criteria_names = [s.get("criteria_name", "MISSING") for s in scores_data["criteria_scores"]]
-        expected_criteria_names = [c.name for c in rubric.criteria]
-        print(f"\n{'='*80}")
-        print(f"CRITERIA VALIDATION CHECK")
-        print(f"{'='*80}")
-        print(f"Expected criteria ({len(expected_criteria_names)}):")
-        for i, name in enumerate(expected_criteria_names, 1):
-            print(f"  {i}. {name}")
-        print(f"\nReturned criteria ({len(returned_criteria_names)}):")
-        for i, name in enumerate(returned_criteria_names, 1):
-            match_indicator = "✓" if name in expected_criteria_names else "❌"
-            print(f"  {i}. {match_indicator} {name}")
-        print(f"{'='*80}\n")
-        
-        # Check for mismatches
-        mismatches = []
-        for returned_name in returned_criteria_names:
-            if returned_name not in expected_criteria_names:
-                # Try to find partial matches
-                found_match = False
-                for expected_name in expected_criteria_names:
-                    if expected_name.lower() in returned_name.lower() or returned_name.lower() in expected_name.lower():
-                        print(f"⚠ Partial match found: '{returned_name}' might match '{expected_name}'")
-                        found_match = True
-                        break
-                if not found_match:
-                    mismatches.append(returned_name)
-        
-        if mismatches:
-            print(f"⚠ WARNING: {len(mismatches)} criteria returned that don't match the rubric:")
-            for mismatch in mismatches:
-                print(f"   - '{mismatch}' (not in rubric)")
-            print(f"   Expected: {expected_criteria_names}")
-            print(f"   This suggests the LLM may not have received the rubric properly or is generating its own criteria.")
-        
-        # Create a mapping from criterion names (with or without weight) to actual criterion names
-        criterion_name_map = {}
-        for criterion in rubric.criteria:
-            # Map the exact name
-            criterion_name_map[criterion.name] = criterion.name
-            # Map name with weight format (as shown in prompt)
-            criterion_name_map[f"{criterion.name} (Weight: {criterion.weight:.1f}%)"] = criterion.name
-            # Map variations (case-insensitive, partial matches)
-            criterion_name_map[criterion.name.lower()] = criterion.name
-            # Try to match common variations
-            if "frontend" in criterion.name.lower() or "front-end" in criterion.name.lower():
-                criterion_name_map["Hard Skills - Front-end Technologies"] = criterion.name
-                criterion_name_map["Front-end Technologies"] = criterion.name
-            if "react" in criterion.name.lower():
-                criterion_name_map["Hard Skills - React.js"] = criterion.name
-            if "backend" in criterion.name.lower() or "back-end" in criterion.name.lower():
-                # This might not be in rubric, but we'll try to match
-                pass
-        
-        # Convert to CriterionScore list - ONLY for criteria that match the rubric
-        scores = []
-        matched_criteria = set()  # Track which rubric criteria have been matched
-        
-        for s in scores_data["criteria_scores"]:
-            # Ensure all required fields exist
-            if "criteria_name" not in s:
-                print(f"WARNING: Missing 'criteria_name' in score: {s}")
-                continue
-            if "score" not in s:
-                print(f"WARNING: Missing 'score' in score: {s}")
-                continue
-            
-            # Normalize criteria name (remove weight if present)
-            raw_criteria_name = s["criteria_name"]
-            normalized_name = criterion_name_map.get(raw_criteria_name, raw_criteria_name)
-            
-            # If still not found, try to extract just the name part (before " (Weight:")
-            if normalized_name == raw_criteria_name and " (Weight:" in raw_criteria_name:
-                normalized_name = raw_criteria_name.split(" (Weight:")[0].strip()
-                # Try to find matching criterion by name
-                for criterion in rubric.criteria:
-                    if criterion.name == normalized_name:
-                        criterion_name_map[raw_criteria_name] = normalized_name
-                        break
-            
-            # Try fuzzy matching if exact match not found
-            if normalized_name not in expected_criteria_names:
-                # Try to find best match
-                best_match = None
-                best_similarity = 0
-                for criterion in rubric.criteria:
-                    # Simple similarity check
-                    if normalized_name.lower() in criterion.name.lower() or criterion.name.lower() in normalized_name.lower():
-                        similarity = min(len(normalized_name), len(criterion.name)) / max(len(normalized_name), len(criterion.name))
-                        if similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match = criterion.name
-                
-                if best_match and best_similarity > 0.5:
-                    print(f"⚠ Fuzzy matched: '{raw_criteria_name}' -> '{best_match}' (similarity: {best_similarity:.2f})")
-                    normalized_name = best_match
-                else:
-                    print(f"❌ ERROR: Criterion '{raw_criteria_name}' does not match any rubric criterion!")
-                    print(f"   Expected one of: {expected_criteria_names}")
-                    print(f"   Skipping this score to prevent incorrect matching.")
-                    continue
-            
-            # Debug: Log name normalization
-            if raw_criteria_name != normalized_name:
-                print(f"DEBUG: Normalized criteria name: '{raw_criteria_name}' -> '{normalized_name}'")
-            
-            # Check if we've already scored this criterion
-            if normalized_name in matched_criteria:
-                print(f"⚠ WARNING: Duplicate score for criterion '{normalized_name}'. Keeping first occurrence.")
-                continue
-            
-            matched_criteria.add(normalized_name)
-            
-            score_obj = CriterionScore(
-                criteria_name=normalized_name,  # Use normalized name
-                score=float(s["score"]),
-                evidence=s.get("evidence", "") or "",  # Ensure it's a string, not None
-                gap=s.get("gap", "") or ""  # Ensure it's a string, not None
-            )
-            
-            # Debug: Print if evidence/gap are empty
-            if not score_obj.evidence and not score_obj.gap:
-                print(f"WARNING: No evidence or gap for criterion: {score_obj.criteria_name}")
-            
-            scores.append(score_obj)
-        
-        # Check if all rubric criteria were scored
-        missing_criteria = set(expected_criteria_names) - matched_criteria
-        if missing_criteria:
-            print(f"⚠ WARNING: {len(missing_criteria)} rubric criteria were not scored: {missing_criteria}")
-            print(f"   This may cause incorrect final score calculation.")
-            # Add placeholder scores for missing criteria (score 0 with gap explanation)
-            for missing_name in missing_criteria:
-                # Find the criterion object
-                missing_criterion = next((c for c in rubric.criteria if c.name == missing_name), None)
-                if missing_criterion:
-                    placeholder_score = CriterionScore(
-                        criteria_name=missing_name,
-                        score=0.0,
-                        evidence="Criterion not scored by LLM - may indicate prompt issue",
-                        gap=f"Missing score for '{missing_name}' - LLM did not return this criterion"
-                    )
-                    scores.append(placeholder_score)
-                    print(f"   Added placeholder score (0) for '{missing_name}'")
-        
-        print(f"✓ Scored {len(scores)} criteria via LLM")
-        
-        # Debug: Print summary of evidence/gap
-        evidence_count = sum(1 for s in scores if s.evidence)
-        gap_count = sum(1 for s in scores if s.gap)
-        print(f"DEBUG - Scores with evidence: {evidence_count}/{len(scores)}")
-        print(f"DEBUG - Scores with gap: {gap_count}/{len(scores)}")
+        scores = parse_criteria_scores(scores_data, rubric)
         
         # LANGFUSE: Span updated/closed automatically
         
@@ -1564,6 +1853,47 @@ Return ONLY valid JSON with ALL fields populated. Evidence and gap fields are MA
         raise
 
 
+def score_criteria_subset(
+    cv_profile: str,
+    rubric: EvaluationRubric,
+    known_scores: Dict[str, CriterionScore],
+    scorer: Callable[..., List[CriterionScore]] = None,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> List[CriterionScore]:
+    """
+    Score only the criteria without a known score and merge in rubric order.
+
+    The remaining criteria are sent to the scorer as one sub-rubric (used for
+    locally scored criteria and for re-scoring after a rubric edit).
+
+    Args:
+        cv_profile: The candidate's CV text
+        rubric: The evaluation rubric
+        known_scores: Scores already available, by criterion name
+        scorer: Criteria scorer for the rest (default: score_criteria_with_llm)
+        model: Optional model name to use
+
+    Returns:
+        List of CriterionScore in rubric order (criteria the scorer did not
+        return are left out)
+    """
+    remaining = [c for c in rubric.criteria if c.name not in known_scores]
+    new_scores = {}
+    if remaining:
+        sub_rubric = EvaluationRubric(criteria=remaining, total_weight=sum(c.weight for c in remaining))
+        for score in (scorer or score_criteria_with_llm)(cv_profile, sub_rubric, langfuse_parent=langfuse_parent,
+                                                          session_id=session_id, model=model):
+            new_scores[score.criteria_name] = score
+
+    return [
+        known_scores.get(criterion.name) or new_scores.get(criterion.name)
+        for criterion in rubric.criteria
+        if criterion.name in known_scores or criterion.name in new_scores
+    ]
+
+
 def generate_qualification_note(
     job_posting: str,
     cv_profile: str,
@@ -1572,7 +1902,9 @@ def generate_qualification_note(
     language: str = "English",
     langfuse_parent=None,
     session_id: str = None,
-    model: str = None
+    model: str = None,
+    brief: bool = False,
+    max_tokens: int = 3000
 ) -> str:
     """
     Generate a comprehensive qualification note for a candidate.
@@ -1585,6 +1917,8 @@ def generate_qualification_note(
         language: Language for the qualification note (default: "English")
         session_id: Optional session ID for Langfuse tracking
         model: Optional model name to use
+        brief: Ask for a short note (candidate already failed a required criterion)
+        max_tokens: Maximum tokens for the note
         
     Returns:
         HTML-formatted qualification note
@@ -1613,6 +1947,13 @@ def generate_qualification_note(
     base_context += "**CANDIDATE RÉSUMÉ:**\n"
     base_context += f"{cv_profile}\n\n"
     
+    # Brief note for candidates gated on a required criterion
+    if brief:
+        base_context += """### BRIEF NOTE:
+The candidate scored below threshold on at least one REQUIRED criterion (see CRITERIA SCORES). Keep the same HTML structure but limit every section to one or two short bullets, and state the failed required criteria in AREAS OF CONCERN and the RECOMMENDATION.
+
+"""
+    
     # Analysis Focus (Critical)
     base_context += """### ANALYSIS FOCUS (CRITICAL)
 
@@ -1724,7 +2065,7 @@ Start your response directly with:
                     "content": prompt_to_use
                 }
             ],
-            max_tokens=3000,
+            max_tokens=max_tokens,
             generation_name="qualification_generation",
             langfuse_parent=langfuse_parent,
             langfuse_prompt=langfuse_prompt,
@@ -1812,6 +2153,217 @@ Provide a well-structured, professional summary in plain text (no HTML). Keep it
         raise
 
 
+def summarize_qualification(
+    qualification_note: str,
+    result: dict = None,
+    language: str = "English",
+    llm_fallback: bool = True,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> str:
+    """
+    Build the qualification summary locally, falling back to the LLM.
+    
+    The note's fixed HTML structure already contains the fit level, strengths,
+    concerns and recommendation, so the summary is rendered from a per-language
+    template (see qualification_note.py) without an LLM call. Only notes that
+    do not parse are sent to generate_qualification_summary.
+    
+    Args:
+        qualification_note: The full qualification note HTML text
+        result: Output of calculate_matching_score (adds score and criteria lines)
+        language: Language for the summary (default: "English")
+        llm_fallback: Call the LLM if the note cannot be parsed (default: True)
+        session_id: Optional session ID for Langfuse tracking (fallback only)
+        model: Optional model name to use (fallback only)
+        
+    Returns:
+        Concise summary text
+    """
+    parsed_note = parse_qualification_note(qualification_note)
+    if parsed_note is not None:
+        summary = render_qualification_summary(
+            parsed_note,
+            breakdown=result["breakdown"] if result else None,
+            language=language,
+            final_score=result["final_score"] if result else None
+        )
+        print(f"✓ Rendered qualification summary locally ({parsed_note['fit_level']}, {parsed_note['recommendation']})")
+        return summary
+    
+    if not llm_fallback:
+        raise ValueError("Qualification note could not be parsed (missing fit level or recommendation)")
+    
+    print("⚠ Qualification note could not be parsed - falling back to LLM summary")
+    return generate_qualification_summary(
+        qualification_note,
+        language=language,
+        langfuse_parent=langfuse_parent,
+        session_id=session_id,
+        model=model
+    )
+
+
+def convert_qualification_to_score(
+    qualification_note: str,
+    llm_fallback: bool = True,
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> dict:
+    """
+    Convert a qualification note into a numeric matching score (0-100).
+    
+    The fit level and recommendation are parsed locally and mapped with the
+    rules of QUALIFICATION_TO_SCORE_CONVERSION_PROMPT (including the
+    "DO NOT ADVANCE" override). The LLM is only called when the note does not
+    parse.
+    
+    Args:
+        qualification_note: The full qualification note HTML text
+        llm_fallback: Call the LLM if the note cannot be parsed (default: True)
+        session_id: Optional session ID for Langfuse tracking (fallback only)
+        model: Optional model name to use (fallback only)
+        
+    Returns:
+        dict with matching_score and source ("local" or "llm"); local results
+        also include score_range, fit_level, recommendation and contradiction
+    """
+    parsed_note = parse_qualification_note(qualification_note)
+    if parsed_note is not None:
+        conversion = score_from_qualification_note(parsed_note)
+        conversion["source"] = "local"
+        print(f"✓ Converted qualification note locally: {conversion['fit_level']} + "
+              f"{conversion['recommendation']} → {conversion['matching_score']}")
+        return conversion
+    
+    if not llm_fallback:
+        raise ValueError("Qualification note could not be parsed (missing fit level or recommendation)")
+    
+    print("⚠ Qualification note could not be parsed - falling back to LLM score conversion")
+    response_text, llm_duration = call_openrouter(
+        messages=[
+            {
+                "role": "user",
+                "content": f"{QUALIFICATION_TO_SCORE_CONVERSION_PROMPT}\n\n## QUALIFICATION NOTE:\n{qualification_note}"
+            }
+        ],
+        max_tokens=100,
+        generation_name="qualification_score_conversion",
+        langfuse_parent=langfuse_parent,
+        session_id=session_id,
+        model=model
+    )
+    score_data = parse_llm_json(response_text)
+    if "matching_score" not in score_data:
+        raise ValueError(f"Missing 'matching_score' key in response. Keys found: {list(score_data.keys())}")
+    
+    print(f"✓ Converted qualification note via LLM ({llm_duration:.2f}s): {score_data['matching_score']}")
+    return {
+        "matching_score": max(0, min(100, int(score_data["matching_score"]))),
+        "source": "llm"
+    }
+
+
+def supports_fused_evaluation(model: str = None) -> bool:
+    """Return True if fused (single-call) evaluation is enabled for the model."""
+    return (model or OPENROUTER_MODEL) in FUSED_EVALUATION_MODELS
+
+
+def evaluate_candidate_fused(
+    job_posting: str,
+    cv_profile: str,
+    rubric: EvaluationRubric,
+    language: str = "English",
+    langfuse_parent=None,
+    session_id: str = None,
+    model: str = None
+) -> tuple[List[CriterionScore], str, str]:
+    """
+    Score criteria, write the qualification note and the summary in ONE LLM call.
+    
+    Replaces score_criteria_with_llm, generate_qualification_note and
+    generate_qualification_summary (steps 2, 4 and 5) so the job posting and
+    CV are sent once instead of three times.
+    
+    Args:
+        job_posting: The job posting text
+        cv_profile: The candidate's CV text
+        rubric: The evaluation rubric
+        language: Language for the qualification note and summary (default: "English")
+        session_id: Optional session ID for Langfuse tracking
+        model: Optional model name to use
+        
+    Returns:
+        Tuple of (criteria_scores, qualification_note, qualification_summary)
+    """
+    print("\n[LLM CALL via OpenRouter] Fused Evaluation (scores + note + summary)...")
+    print(f"🌐 Language: {language}")
+    print(f"Rubric: {len(rubric.criteria)} criteria")
+    
+    rubric_text = build_rubric_text(rubric)
+    
+    prompt_content = f"""{CRITERIA_SCORING_PROMPT}
+
+---
+
+{QUALIFICATION_GENERATION_PROMPT}
+
+---
+
+### INPUTS
+
+**EVALUATION RUBRIC (score EACH criterion, use the EXACT names):**
+{rubric_text}
+
+**JOB POSTING:**
+{job_posting}
+
+**CANDIDATE RÉSUMÉ:**
+{cv_profile}
+
+{FUSED_EVALUATION_OUTPUT_PROMPT.format(language=language, num_criteria=len(rubric.criteria))}"""
+    
+    print(f"📤 Sending fused prompt to LLM (length: {len(prompt_content)} chars)")
+    
+    try:
+        # Call OpenRouter (returns content and LLM duration)
+        response_text, llm_duration = call_openrouter(
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt_content
+                }
+            ],
+            max_tokens=7500,  # Scoring (4000) + note (3000) + summary (500)
+            generation_name="fused_evaluation",
+            langfuse_parent=langfuse_parent,
+            langfuse_prompt=None,
+            session_id=session_id,
+            model=model
+        )
+        
+        print(f"✓ Fused evaluation LLM call: {llm_duration:.2f}s")
+        print(f"LLM Response length: {len(response_text)} chars")
+        
+        evaluation_data = parse_llm_json(response_text)
+        criteria_scores = parse_criteria_scores(evaluation_data, rubric)
+        
+        qualification_note = (evaluation_data.get("qualification_note") or "").strip()
+        qualification_summary = (evaluation_data.get("qualification_summary") or "").strip()
+        if not qualification_note:
+            raise ValueError(f"Missing 'qualification_note' in fused response. Keys found: {list(evaluation_data.keys())}")
+        
+        print(f"✓ Generated qualification note ({len(qualification_note)} chars) and summary ({len(qualification_summary)} chars)")
+        
+        return criteria_scores, qualification_note, qualification_summary
+        
+    except Exception as e:
+        print(f"❌ Fused evaluation failed: {e}")
+        raise
+
+
 def pretty_print_results(rubric: EvaluationRubric, criteria_scores: List[CriterionScore], result: dict):
     """Pretty print the matching score results."""
     print("\n" + "="*100)
@@ -1911,7 +2463,7 @@ def test_scenario(scenario_name: str, job_posting: str, cv_profile: str, use_cac
     
     # LANGFUSE: Create a trace for this matching score calculation
     trace = None
-    if LANGFUSE_ENABLED:
+    if LANGFUSE_ENABLED and hasattr(langfuse, "trace"):
         # A trace is the top-level unit of observation
         # It represents one complete matching score calculation
         trace = langfuse.trace(
@@ -1927,10 +2479,10 @@ def test_scenario(scenario_name: str, job_posting: str, cv_profile: str, use_cac
         )
     
     # Step 1: Extract rubric from job posting (uses cache if available)
-    rubric = extract_rubric_with_llm(job_posting, use_cache=use_cache, langfuse_trace=trace)
+    rubric = extract_rubric_with_llm(job_posting, use_cache=use_cache, langfuse_parent=trace)
     
     # Step 2: Score candidate against rubric (ACTUAL LLM CALL)
-    criteria_scores = score_criteria_with_llm(cv_profile, rubric, langfuse_trace=trace)
+    criteria_scores = score_criteria_with_llm(cv_profile, rubric, langfuse_parent=trace)
     
     # Step 3: Calculate final matching score (actual calculation logic)
     result = calculate_matching_score(rubric, criteria_scores)
@@ -1964,19 +2516,153 @@ def test_scenario(scenario_name: str, job_posting: str, cv_profile: str, use_cac
     return result
 
 
-def test_multiple_profiles(job_posting: str, cv_profiles: List[tuple], use_cache: bool = True):
+def score_profiles_concurrently(
+    cv_profiles: List[tuple],
+    rubric: EvaluationRubric,
+    max_workers: int = 8,
+    session_prefix: str = None,
+    model: str = None,
+    on_result: Callable[[str, dict], Any] = None,
+    keep_results: bool = True,
+    dedupe: bool = True
+) -> tuple:
+    """
+    Score several candidates against the same rubric with a bounded thread pool.
+    
+    The rubric is shared and the scoring calls are independent, so up to
+    max_workers calls are in flight at once. A failing candidate is recorded
+    instead of aborting the batch. Candidates with the same CV text (see
+    cv_text_hash) are scored once and share the result.
+    
+    Args:
+        cv_profiles: List of (name, cv_text) tuples
+        rubric: The evaluation rubric (extract it once beforehand)
+        max_workers: Maximum number of concurrent LLM calls (1 = sequential)
+        session_prefix: Optional prefix for per-candidate Langfuse session IDs
+        model: Optional model name to use
+        on_result: Optional callback(name, result) invoked from the worker
+            thread as soon as a candidate is scored (e.g. Leaderboard.add)
+        keep_results: Set to False to drop results once on_result has seen
+            them (results is then empty; memory stays bounded)
+        dedupe: Score duplicate CV texts only once (default: True)
+        
+    Returns:
+        Tuple of (results, failures):
+        - results: List of (name, score, result) tuples sorted by score
+          (descending, ties keep input order)
+        - failures: List of (name, error message) tuples in input order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def score_one(name: str, cv_profile: str, copy_names: List[str]) -> dict:
+        # LANGFUSE: One trace / session per candidate so candidates can be
+        # compared side-by-side even when scored concurrently
+        candidate_trace = None
+        if LANGFUSE_ENABLED and hasattr(langfuse, "trace"):
+            candidate_trace = langfuse.trace(
+                name=f"matching_score",
+                user_id=name.lower().replace(" ", "_"),
+                metadata={
+                    "candidate_name": name,
+                    "cv_preview": cv_profile[:200]
+                },
+                tags=["batch", "candidate", name.lower()]
+            )
+        session_id = None
+        if session_prefix:
+            session_id = f"{session_prefix}-{name.lower().replace(' ', '_')}"
+        
+        criteria_scores = score_criteria_with_llm(
+            cv_profile, rubric, langfuse_parent=candidate_trace, session_id=session_id, model=model
+        )
+        result = calculate_matching_score(rubric, criteria_scores)
+        
+        # LANGFUSE: Add score to candidate trace
+        if candidate_trace:
+            candidate_trace.score(
+                name="matching_score",
+                value=result["final_score"],
+                comment=f"Candidate: {name}"
+            )
+        print(f"\n→ {name}: {result['final_score']}/100")
+        if on_result is not None:
+            on_result(name, result)
+            for copy_name in copy_names:
+                on_result(copy_name, result)
+        return result if keep_results else None
+    
+    # Index of the profile whose score each profile reuses (itself if unique)
+    canonical = list(range(len(cv_profiles)))
+    if dedupe:
+        first_by_hash = {}
+        for i, (_, cv_profile) in enumerate(cv_profiles):
+            canonical[i] = first_by_hash.setdefault(cv_text_hash(cv_profile), i)
+    to_score = [i for i in range(len(cv_profiles)) if canonical[i] == i]
+    copies = {i: [] for i in to_score}
+    for i, first in enumerate(canonical):
+        if first != i:
+            copies[first].append(cv_profiles[i][0])
+    duplicates = len(cv_profiles) - len(to_score)
+    if duplicates:
+        print(f"🔁 {duplicates}/{len(cv_profiles)} duplicate CVs ({duplicates / len(cv_profiles):.0%}) - "
+              f"scoring {len(to_score)} unique CVs")
+    
+    outcomes = [None] * len(cv_profiles)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            # Run in the caller's context so track_llm_calls() attributes worker calls
+            i: executor.submit(contextvars.copy_context().run, score_one, cv_profiles[i][0], cv_profiles[i][1], copies[i])
+            for i in to_score
+        }
+        for i, future in futures.items():
+            try:
+                outcomes[i] = ("ok", future.result())
+            except Exception as e:
+                print(f"⚠ Scoring failed for {cv_profiles[i][0]}: {e}")
+                outcomes[i] = ("error", str(e))
+    
+    results = []
+    failures = []
+    for (name, _), first in zip(cv_profiles, canonical):
+        status, value = outcomes[first]
+        if status == "error":
+            failures.append((name, value))
+        elif keep_results:
+            results.append((name, value["final_score"], value))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results, failures
+
+
+def test_multiple_profiles(
+    job_posting: str,
+    cv_profiles: List[tuple],
+    use_cache: bool = True,
+    max_workers: int = 8,
+    model: str = None,
+    top_k: int = None
+):
     """
     Test multiple candidate profiles against the same job posting.
     Uses cached rubric to ensure consistency across all candidates.
+    Candidates are scored concurrently (see score_profiles_concurrently).
     
     Args:
         job_posting: The job posting text
         cv_profiles: List of (name, cv_text) tuples
         use_cache: Whether to use cached rubric (default: True)
+        max_workers: Maximum number of concurrent scoring calls (1 = sequential)
+        model: Optional model name to use
+        top_k: Keep only the best top_k results (streaming Leaderboard: the
+            current top is printed as results arrive, plus a score histogram)
         
     Returns:
-        List of (name, score, result) tuples
+        List of (name, score, result) tuples sorted by score (only the top_k
+        if set); candidates whose scoring failed are reported in the summary
+        and left out
     """
+    import time
+    from leaderboard import Leaderboard
+    
     print("\n" + "="*100)
     print(f"TESTING {len(cv_profiles)} CANDIDATES AGAINST SAME JOB POSTING")
     print("="*100)
@@ -1986,7 +2672,7 @@ def test_multiple_profiles(job_posting: str, cv_profiles: List[tuple], use_cache
     
     # LANGFUSE: Create a parent trace for the batch comparison
     batch_trace = None
-    if LANGFUSE_ENABLED:
+    if LANGFUSE_ENABLED and hasattr(langfuse, "trace"):
         batch_trace = langfuse.trace(
             name="batch_matching_scores",
             metadata={
@@ -1997,59 +2683,128 @@ def test_multiple_profiles(job_posting: str, cv_profiles: List[tuple], use_cache
             tags=["test", "batch", "comparison"]
         )
     
-    rubric = extract_rubric_with_llm(job_posting, use_cache=use_cache, langfuse_trace=batch_trace)
+    rubric = extract_rubric_with_llm(job_posting, use_cache=use_cache, langfuse_parent=batch_trace, model=model)
     
-    results = []
-    for name, cv_profile in cv_profiles:
-        print(f"\n{'='*100}")
-        print(f"CANDIDATE: {name}")
-        print(f"{'='*100}")
-        print(f"CV: {cv_profile[:200]}...")
-        
-        # LANGFUSE: Create a sub-trace for each candidate
-        # This allows you to compare candidates side-by-side
-        candidate_trace = None
-        if LANGFUSE_ENABLED:
-            candidate_trace = langfuse.trace(
-                name=f"matching_score",
-                user_id=name.lower().replace(" ", "_"),
-                metadata={
-                    "candidate_name": name,
-                    "cv_preview": cv_profile[:200]
-                },
-                tags=["batch", "candidate", name.lower()]
-            )
-        
-        # Score this candidate
-        criteria_scores = score_criteria_with_llm(cv_profile, rubric, langfuse_trace=candidate_trace)
-        result = calculate_matching_score(rubric, criteria_scores)
-        
-        # LANGFUSE: Add score to candidate trace
-        if LANGFUSE_ENABLED and candidate_trace:
-            candidate_trace.score(
-                name="matching_score",
-                value=result["final_score"],
-                comment=f"Candidate: {name}"
-            )
-        
-        # Store result
-        results.append((name, result['final_score'], result))
-        
-        # Print summary
-        print(f"\n→ {name}: {result['final_score']}/100")
+    print(f"\n[SCORING {len(cv_profiles)} CANDIDATES] (max {max_workers} in flight)")
+    start_time = time.time()
+    session_prefix = None
+    if LANGFUSE_ENABLED:
+        session_prefix = f"batch-{hashlib.md5(f'{job_posting[:200]}-{start_time}'.encode()).hexdigest()[:12]}"
+    leaderboard = Leaderboard(top_k=top_k) if top_k else None
+    
+    def update_leaderboard(name: str, result: dict):
+        # Show the current top whenever it changes
+        if leaderboard.add(name, result):
+            print(leaderboard.format_top(min(top_k, 10)))
+    
+    results, failures = score_profiles_concurrently(
+        cv_profiles, rubric, max_workers=max_workers, session_prefix=session_prefix, model=model,
+        on_result=update_leaderboard if leaderboard is not None else None,
+        keep_results=leaderboard is None
+    )
+    if leaderboard is not None:
+        results = leaderboard.top()
+    elapsed = time.time() - start_time
     
     # Print comparison summary
     print("\n" + "="*100)
-    print("COMPARISON SUMMARY")
+    print(f"COMPARISON SUMMARY ({elapsed:.1f}s)")
     print("="*100)
-    results.sort(key=lambda x: x[1], reverse=True)
     for i, (name, score, _) in enumerate(results, 1):
         print(f"{i}. {name}: {score}/100")
+    if leaderboard is not None:
+        print(f"\n{leaderboard.format_histogram()}")
+    if failures:
+        print(f"\n⚠ {len(failures)} candidate(s) failed:")
+        for name, error in failures:
+            print(f"  - {name}: {error}")
     print("="*100)
     
     return results
 
 
+def benchmark_evaluation_modes(
+    job_posting: str,
+    cv_profile: str,
+    language: str = "English",
+    runs: int = 1,
+    model: str = None
+) -> dict:
+    """
+    Compare end-to-end latency and token cost of the 5-step pipeline vs fused mode.
+    
+    The rubric is extracted once (cached) and shared by both modes, so the
+    comparison covers what differs: steps 2-5 vs a single fused call.
+    
+    Args:
+        job_posting: The job posting text
+        cv_profile: The candidate's CV text
+        language: Language for the qualification note and summary
+        runs: Number of runs per mode (results are averaged)
+        model: Optional model name to use
+        
+    Returns:
+        dict keyed by mode ("pipeline", "fused") with averaged wall time,
+        LLM calls, prompt/completion tokens and cost
+    """
+    import time
+    
+    print("\n" + "="*100)
+    print(f"BENCHMARK: 5-step pipeline vs fused evaluation ({runs} run(s), model: {model or OPENROUTER_MODEL})")
+    print("="*100)
+    
+    rubric = extract_rubric_with_llm(job_posting, use_cache=True, model=model)
+    rubric_text = build_rubric_text(rubric)
+    
+    def run_pipeline():
+        criteria_scores = score_criteria_with_llm(cv_profile, rubric, model=model)
+        calculate_matching_score(rubric, criteria_scores)
+        criteria_scores_text = "\n".join([
+            f"- {cs.criteria_name}: {cs.score}/100 - Evidence: {cs.evidence or 'N/A'}"
+            for cs in criteria_scores
+        ])
+        note = generate_qualification_note(
+            job_posting, cv_profile,
+            rubric_text=rubric_text,
+            criteria_scores_text=criteria_scores_text,
+            language=language,
+            model=model
+        )
+        generate_qualification_summary(note, language=language, model=model)
+    
+    def run_fused():
+        criteria_scores, _, _ = evaluate_candidate_fused(job_posting, cv_profile, rubric, language=language, model=model)
+        calculate_matching_score(rubric, criteria_scores)
+    
+    report = {}
+    for mode, runner in [("pipeline", run_pipeline), ("fused", run_fused)]:
+        totals = {"wall_time": 0.0, "llm_calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
+        for _ in range(runs):
+            start = time.time()
+            with track_llm_calls() as calls:
+                runner()
+            totals["wall_time"] += time.time() - start
+            totals["llm_calls"] += len(calls)
+            totals["prompt_tokens"] += sum(c["prompt_tokens"] for c in calls)
+            totals["completion_tokens"] += sum(c["completion_tokens"] for c in calls)
+            totals["cost"] += sum(c["cost"] or 0.0 for c in calls)
+        report[mode] = {key: value / runs for key, value in totals.items()}
+    
+    print("\n" + "="*100)
+    print("BENCHMARK RESULTS (average per evaluation, excluding rubric extraction)")
+    print("="*100)
+    print(f"{'Mode':<12}{'Wall time':>12}{'LLM calls':>12}{'Prompt tok':>14}{'Output tok':>14}{'Cost ($)':>12}")
+    for mode, stats in report.items():
+        print(f"{mode:<12}{stats['wall_time']:>11.2f}s{stats['llm_calls']:>12.1f}"
+              f"{stats['prompt_tokens']:>14.0f}{stats['completion_tokens']:>14.0f}{stats['cost']:>12.4f}")
+    if report["pipeline"]["wall_time"] > 0:
+        speedup = report["pipeline"]["wall_time"] / max(report["fused"]["wall_time"], 1e-9)
+        print(f"\nFused mode speedup: {speedup:.2f}x")
+    print("="*100 + "\n")
+    
+    return report
+
+
 def main():
     """Main test function with various scenarios."""
     